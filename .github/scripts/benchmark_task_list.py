@@ -0,0 +1,133 @@
+"""Micro-benchmark for the Better ToDo task container.
+
+Compares the uid-indexed TaskList with the plain list scans it replaced for
+lookup, update, delete and move operations at 1k, 10k and 100k tasks.
+
+Run from the repository root:
+    python .github/scripts/benchmark_task_list.py
+"""
+import importlib.util
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+
+MODULE_PATH = Path(__file__).resolve().parents[2] / "custom_components" / "better_todo" / "task_list.py"
+
+# Load task_list.py on its own so Home Assistant does not need to be installed
+spec = importlib.util.spec_from_file_location("task_list", MODULE_PATH)
+task_list = importlib.util.module_from_spec(spec)
+sys.modules["task_list"] = task_list
+spec.loader.exec_module(task_list)
+TaskList = task_list.TaskList
+
+SIZES = (1_000, 10_000, 100_000)
+OPERATIONS = 200
+
+
+@dataclass
+class Task:
+    uid: str
+    summary: str
+
+
+def make_tasks(size: int) -> list[Task]:
+    return [Task(uid=f"uid-{idx}", summary=f"Task {idx}") for idx in range(size)]
+
+
+def probe_uids(size: int) -> list[str]:
+    # Spread the probes over the whole list, the average case for a scan
+    step = max(size // OPERATIONS, 1)
+    return [f"uid-{idx}" for idx in range(0, size, step)][:OPERATIONS]
+
+
+# Previous implementation: linear scans over a list
+def list_get(items: list[Task], uid: str) -> Task | None:
+    for item in items:
+        if item.uid == uid:
+            return item
+    return None
+
+
+def list_update(items: list[Task], task: Task) -> None:
+    for idx, existing in enumerate(items):
+        if existing.uid == task.uid:
+            items[idx] = task
+            break
+
+
+def list_delete(items: list[Task], uids: list[str]) -> list[Task]:
+    return [item for item in items if item.uid not in uids]
+
+
+def list_move(items: list[Task], uid: str, previous_uid: str | None) -> None:
+    moved = None
+    for idx, item in enumerate(items):
+        if item.uid == uid:
+            moved = items.pop(idx)
+            break
+    if moved is None:
+        return
+    if previous_uid is None:
+        items.insert(0, moved)
+        return
+    for idx, item in enumerate(items):
+        if item.uid == previous_uid:
+            items.insert(idx + 1, moved)
+            return
+    items.append(moved)
+
+
+def bench(size: int) -> list[tuple[str, float, float]]:
+    uids = probe_uids(size)
+    results = []
+
+    items = make_tasks(size)
+    indexed = TaskList(make_tasks(size))
+
+    results.append((
+        "get",
+        timeit.timeit(lambda: [list_get(items, uid) for uid in uids], number=1),
+        timeit.timeit(lambda: [indexed.get(uid) for uid in uids], number=1),
+    ))
+    results.append((
+        "update",
+        timeit.timeit(lambda: [list_update(items, Task(uid, "x")) for uid in uids], number=1),
+        timeit.timeit(lambda: [indexed.replace(Task(uid, "x")) for uid in uids], number=1),
+    ))
+    # Move each probe after the last task, and back to the start
+    last_uid = f"uid-{size - 1}"
+    results.append((
+        "move",
+        timeit.timeit(
+            lambda: [list_move(items, uid, last_uid if idx % 2 else None) for idx, uid in enumerate(uids)],
+            number=1,
+        ),
+        timeit.timeit(
+            lambda: [indexed.move(uid, last_uid if idx % 2 else None) for idx, uid in enumerate(uids)],
+            number=1,
+        ),
+    ))
+    # A delete_task call with every probe uid
+    results.append((
+        "delete",
+        timeit.timeit(lambda: list_delete(items, uids), number=1),
+        timeit.timeit(lambda: [indexed.remove(uid) for uid in uids], number=1),
+    ))
+    return results
+
+
+def main() -> None:
+    print(f"{OPERATIONS} operations per measurement\n")
+    print(f"{'tasks':>8}  {'operation':<10} {'list (ms)':>12} {'TaskList (ms)':>14} {'speedup':>9}")
+    for size in SIZES:
+        for name, list_time, indexed_time in bench(size):
+            speedup = list_time / indexed_time if indexed_time else float("inf")
+            print(
+                f"{size:>8}  {name:<10} {list_time * 1000:>12.3f} "
+                f"{indexed_time * 1000:>14.3f} {speedup:>8.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+/**
+ * Build the Better ToDo frontend bundle.
+ *
+ * Minifies the cards, the panel component and the shared core module into
+ * custom_components/better_todo/www/dist/ under content-hashed file names,
+ * writes a pre-compressed .gz and .br file next to each of them and a
+ * manifest.json mapping every source file name to its hashed file name.
+ * The integration serves dist/ with immutable caching and derives the
+ * Lovelace resource URLs from the manifest.
+ *
+ * Only Node.js is needed (no npm packages). Run from the repository root
+ * after changing a file in www/ and commit the result:
+ *     node .github/scripts/build_frontend.mjs
+ *
+ * With --check (used by CI) the script exits with an error when the minified
+ * files or the manifest in dist/ are not up to date with the sources. The
+ * bytes of the .gz and .br files depend on the zlib and brotli versions of
+ * Node.js, so they are not compared; any that does not decompress to its
+ * file is rebuilt instead.
+ */
+import { spawnSync } from 'node:child_process';
+import { createHash } from 'node:crypto';
+import { mkdtempSync, mkdirSync, readdirSync, readFileSync, rmSync, writeFileSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { dirname, join, resolve } from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { constants, brotliCompressSync, brotliDecompressSync, gunzipSync, gzipSync } from 'node:zlib';
+
+const ROOT = resolve(dirname(fileURLToPath(import.meta.url)), '..', '..');
+const WWW_DIR = join(ROOT, 'custom_components', 'better_todo', 'www');
+const DIST_DIR = join(WWW_DIR, 'dist');
+const MANIFEST = 'manifest.json';
+const COMPRESSED = { '.gz': gunzipSync, '.br': brotliDecompressSync };
+
+// The core module comes first, the other modules import it by hashed name
+const SOURCES = [
+  'better-todo-core.js',
+  'better-todo-card.js',
+  'better-todo-dashboard-card.js',
+  'better-todo-list-card.js',
+  'better-todo-panel-component.js',
+  'better-todo-simple-card.js',
+];
+
+// Must match HASHED_FILENAME in custom_components/better_todo/javascript.py
+const HASH_LENGTH = 8;
+
+const IDENTIFIER = /[A-Za-z0-9_$\u0080-\uffff]/;
+const WHITESPACE = /\s/;
+// Keywords after which a slash starts a regular expression, not a division
+const KEYWORDS_BEFORE_EXPRESSION = new Set([
+  'await', 'case', 'delete', 'do', 'else', 'in', 'instanceof', 'new',
+  'of', 'return', 'throw', 'typeof', 'void', 'yield',
+]);
+
+/**
+ * Remove comments and redundant whitespace from an ES module.
+ *
+ * Strings, template literals and regular expressions are copied unchanged,
+ * except that line breaks and indentation inside template literals are
+ * collapsed to a single newline (the templates only hold HTML and CSS).
+ * Line breaks between statements are kept where automatic semicolon
+ * insertion could depend on them, so no semicolons have to be added.
+ */
+function minify(source) {
+  let out = '';
+  let i = 0;
+  let pending = '';
+  let lastChar = '';
+  let lastWord = '';
+  // Brace depth of each open ${...} expression inside a template literal
+  const templates = [];
+
+  const emit = (text) => {
+    const next = text[0];
+    if (pending === '\n' && !'{([,;'.includes(lastChar) && !'})],;'.includes(next)) {
+      out += '\n';
+    } else if (
+      pending
+      && ((IDENTIFIER.test(lastChar) && IDENTIFIER.test(next))
+        || (lastChar === next && '+-'.includes(next))
+        || (/[0-9]/.test(lastChar) && next === '.'))
+    ) {
+      out += ' ';
+    }
+    pending = '';
+    out += text;
+    lastChar = text[text.length - 1];
+  };
+
+  const regexAllowed = () => {
+    if (!lastChar) return true;
+    if (IDENTIFIER.test(lastChar)) return KEYWORDS_BEFORE_EXPRESSION.has(lastWord);
+    return !')]}'.includes(lastChar);
+  };
+
+  // Copy template literal text up to the closing backtick or the next ${
+  const readTemplate = () => {
+    let text = '';
+    while (i < source.length) {
+      const char = source[i];
+      if (char === '\\') {
+        text += source.slice(i, i + 2);
+        i += 2;
+      } else if (char === '`') {
+        i += 1;
+        out += `${text}\``;
+        lastChar = '`';
+        return;
+      } else if (char === '$' && source[i + 1] === '{') {
+        i += 2;
+        out += `${text}\${`;
+        lastChar = '{';
+        templates.push(0);
+        return;
+      } else if (char === '\n' || (char === '\r' && source[i + 1] === '\n')) {
+        text = text.replace(/[ \t]+$/, '');
+        while (i < source.length && WHITESPACE.test(source[i])) i += 1;
+        text += '\n';
+      } else {
+        text += char;
+        i += 1;
+      }
+    }
+    throw new Error('Unterminated template literal');
+  };
+
+  while (i < source.length) {
+    const char = source[i];
+    const next = source[i + 1];
+
+    if (WHITESPACE.test(char)) {
+      if (out) pending = char === '\n' || pending === '\n' ? '\n' : ' ';
+      i += 1;
+    } else if (char === '/' && next === '/') {
+      while (i < source.length && source[i] !== '\n') i += 1;
+    } else if (char === '/' && next === '*') {
+      const end = source.indexOf('*/', i + 2);
+      if (end === -1) throw new Error('Unterminated comment');
+      const comment = source.slice(i, end + 2);
+      if (out) pending = comment.includes('\n') || pending === '\n' ? '\n' : pending || ' ';
+      i = end + 2;
+    } else if (char === '"' || char === "'") {
+      let end = i + 1;
+      while (source[end] !== char) {
+        if (end >= source.length || source[end] === '\n') throw new Error('Unterminated string');
+        end += source[end] === '\\' ? 2 : 1;
+      }
+      emit(source.slice(i, end + 1));
+      lastWord = '';
+      i = end + 1;
+    } else if (char === '`') {
+      emit('`');
+      lastWord = '';
+      i += 1;
+      readTemplate();
+    } else if (char === '/' && regexAllowed()) {
+      let end = i + 1;
+      let inClass = false;
+      while (inClass || source[end] !== '/') {
+        if (end >= source.length || source[end] === '\n') throw new Error('Unterminated regular expression');
+        if (source[end] === '\\') end += 1;
+        else if (source[end] === '[') inClass = true;
+        else if (source[end] === ']') inClass = false;
+        end += 1;
+      }
+      end += 1;
+      while (end < source.length && IDENTIFIER.test(source[end])) end += 1;
+      emit(source.slice(i, end));
+      lastWord = '';
+      i = end;
+    } else if (IDENTIFIER.test(char)) {
+      let end = i + 1;
+      while (end < source.length && IDENTIFIER.test(source[end])) end += 1;
+      // Numbers such as 1.5 or 1e-3 are copied as a whole
+      if (/[0-9]/.test(char)) {
+        while (end < source.length && /[0-9A-Za-z_.]/.test(source[end])) {
+          end += /[eE]/.test(source[end]) && '+-'.includes(source[end + 1]) ? 2 : 1;
+        }
+      }
+      lastWord = source.slice(i, end);
+      emit(lastWord);
+      i = end;
+    } else if (char === '}' && templates.length && templates[templates.length - 1] === 0) {
+      templates.pop();
+      pending = '';
+      out += '}';
+      i += 1;
+      readTemplate();
+    } else {
+      if (templates.length && char === '{') templates[templates.length - 1] += 1;
+      if (templates.length && char === '}') templates[templates.length - 1] -= 1;
+      emit(char);
+      lastWord = '';
+      i += 1;
+    }
+  }
+  return `${out}\n`;
+}
+
+function contentHash(content) {
+  return createHash('sha256').update(content).digest('hex').slice(0, HASH_LENGTH);
+}
+
+function checkSyntax(name, content) {
+  // node --check only parses import statements in .mjs files
+  const dir = mkdtempSync(join(tmpdir(), 'better-todo-'));
+  const file = join(dir, name.replace(/\.js$/, '.mjs'));
+  writeFileSync(file, content);
+  const result = spawnSync(process.execPath, ['--check', file], { encoding: 'utf8' });
+  rmSync(dir, { recursive: true, force: true });
+  if (result.status !== 0) {
+    throw new Error(`Minified ${name} is not valid JavaScript:\n${result.stderr}`);
+  }
+}
+
+function build() {
+  const files = new Map();
+  const manifest = {};
+
+  for (const name of SOURCES) {
+    let code = minify(readFileSync(join(WWW_DIR, name), 'utf8'));
+    for (const [source, hashed] of Object.entries(manifest)) {
+      code = code.replaceAll(`'./${source}'`, `'./${hashed}'`);
+    }
+    checkSyntax(name, code);
+
+    const content = Buffer.from(code);
+    const hashed = name.replace(/\.js$/, `.${contentHash(content)}.js`);
+    manifest[name] = hashed;
+    files.set(hashed, content);
+    files.set(`${hashed}.gz`, gzipSync(content, { level: 9 }));
+    files.set(`${hashed}.br`, brotliCompressSync(content, {
+      params: {
+        [constants.BROTLI_PARAM_MODE]: constants.BROTLI_MODE_TEXT,
+        [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+        [constants.BROTLI_PARAM_SIZE_HINT]: content.length,
+      },
+    }));
+  }
+
+  files.set(MANIFEST, Buffer.from(`${JSON.stringify(manifest, null, 2)}\n`));
+  return files;
+}
+
+function decompressesTo(path, decompress, content) {
+  try {
+    return decompress(readFileSync(path)).equals(content);
+  } catch {
+    return false;
+  }
+}
+
+function main() {
+  const check = process.argv.includes('--check');
+  const files = build();
+  mkdirSync(DIST_DIR, { recursive: true });
+  const existing = readdirSync(DIST_DIR);
+
+  if (check) {
+    const stale = existing.filter((name) => !files.has(name));
+    for (const [name, content] of files) {
+      if (name.endsWith('.gz') || name.endsWith('.br')) continue;
+      if (!existing.includes(name) || !readFileSync(join(DIST_DIR, name)).equals(content)) {
+        stale.push(name);
+      }
+    }
+    if (stale.length) {
+      console.error(`dist/ is out of date (${stale.join(', ')}), run node .github/scripts/build_frontend.mjs`);
+      process.exit(1);
+    }
+    for (const [name, content] of files) {
+      if (!name.endsWith('.js')) continue;
+      for (const [extension, decompress] of Object.entries(COMPRESSED)) {
+        if (!decompressesTo(join(DIST_DIR, `${name}${extension}`), decompress, content)) {
+          writeFileSync(join(DIST_DIR, `${name}${extension}`), files.get(`${name}${extension}`));
+          console.log(`Rebuilt ${name}${extension}`);
+        }
+      }
+    }
+    console.log('dist/ is up to date');
+    return;
+  }
+
+  for (const name of existing) {
+    if (!files.has(name)) rmSync(join(DIST_DIR, name));
+  }
+  for (const [name, content] of files) {
+    writeFileSync(join(DIST_DIR, name), content);
+    if (name.endsWith('.js')) {
+      const source = SOURCES.find((source) => name.startsWith(source.replace(/\.js$/, '.')));
+      const size = readFileSync(join(WWW_DIR, source)).length;
+      console.log(
+        `${name}: ${size} -> ${content.length} bytes, `
+        + `${files.get(`${name}.gz`).length} gzip, ${files.get(`${name}.br`).length} brotli`,
+      );
+    }
+  }
+}
+
+main();
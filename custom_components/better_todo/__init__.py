@@ -17,14 +17,20 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from dataclasses import asdict
+from datetime import date
+from typing import Any
+
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.components.todo import TodoItem
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_component
 from homeassistant.helpers.entity import Entity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTR_RECURRENCE_ENABLED,
@@ -34,9 +40,23 @@ from .const import (
     ATTR_RECURRENCE_END_TYPE,
     ATTR_RECURRENCE_INTERVAL,
     ATTR_RECURRENCE_UNIT,
+    BATCH_OP_CREATE,
+    BATCH_OP_DELETE,
+    BATCH_OP_MOVE,
+    BATCH_OP_SET_RECURRENCE,
+    BATCH_OP_UPDATE,
     DOMAIN,
     ENTITY_DOMAIN,
+    GROUP_FORTHCOMING,
+    GROUP_NO_DUE_DATE,
+    GROUP_THIS_WEEK,
+    SORT_DUE,
+    SORT_POSITION,
+    SORT_SUMMARY,
 )
+from .grouping import parse_due
+from .runtime import BetterTodoConfigEntry, BetterTodoData, async_get_list_registry
+from .todo import BetterTodoEntity
 from .todo import async_setup_entry as async_setup_todo_entry
 
 _LOGGER = logging.getLogger(__name__)
@@ -56,6 +76,12 @@ SERVICE_CREATE_TASK = "create_task"
 SERVICE_UPDATE_TASK = "update_task"
 SERVICE_DELETE_TASK = "delete_task"
 SERVICE_MOVE_TASK = "move_task"
+SERVICE_GET_OCCURRENCES = "get_occurrences"
+SERVICE_CREATE_TASKS = "create_tasks"
+SERVICE_UPDATE_TASKS = "update_tasks"
+SERVICE_DELETE_TASKS = "delete_tasks"
+SERVICE_BATCH = "batch"
+SERVICE_GET_TASKS = "get_tasks"
 
 # Service schemas
 CREATE_TASK_SCHEMA = vol.Schema(
@@ -64,9 +90,28 @@ CREATE_TASK_SCHEMA = vol.Schema(
         vol.Required("summary"): cv.string,
         vol.Optional("description"): cv.string,
         vol.Optional("due"): cv.string,
+        # Optional recurrence, applied together with the new task
+        vol.Optional(ATTR_RECURRENCE_ENABLED): cv.boolean,
+        vol.Optional(ATTR_RECURRENCE_INTERVAL): cv.positive_int,
+        vol.Optional(ATTR_RECURRENCE_UNIT): vol.In(["days", "weeks", "months", "years"]),
+        vol.Optional(ATTR_RECURRENCE_END_ENABLED): cv.boolean,
+        vol.Optional(ATTR_RECURRENCE_END_TYPE): vol.In(["count", "date"]),
+        vol.Optional(ATTR_RECURRENCE_END_COUNT): cv.positive_int,
+        vol.Optional(ATTR_RECURRENCE_END_DATE): cv.string,
     }
 )
 
+# Recurrence fields accepted by create_task
+RECURRENCE_FIELDS = (
+    ATTR_RECURRENCE_ENABLED,
+    ATTR_RECURRENCE_INTERVAL,
+    ATTR_RECURRENCE_UNIT,
+    ATTR_RECURRENCE_END_ENABLED,
+    ATTR_RECURRENCE_END_TYPE,
+    ATTR_RECURRENCE_END_COUNT,
+    ATTR_RECURRENCE_END_DATE,
+)
+
 UPDATE_TASK_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id"): cv.entity_id,
@@ -93,6 +138,73 @@ MOVE_TASK_SCHEMA = vol.Schema(
     }
 )
 
+CREATE_TASKS_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("items"): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required("summary"): cv.string,
+                        vol.Optional("description"): cv.string,
+                        vol.Optional("due"): cv.string,
+                    }
+                )
+            ],
+        ),
+    }
+)
+
+UPDATE_TASKS_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("items"): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required("uid"): cv.string,
+                        vol.Optional("summary"): cv.string,
+                        vol.Optional("description"): cv.string,
+                        vol.Optional("due"): cv.string,
+                        vol.Optional("status"): vol.In(["needs_action", "completed"]),
+                    }
+                )
+            ],
+        ),
+    }
+)
+
+DELETE_TASKS_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("uids"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+GET_TASKS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entity_id"): cv.entity_id,
+        vol.Optional("status"): vol.In(["needs_action", "completed"]),
+        vol.Optional("group"): vol.In([GROUP_NO_DUE_DATE, GROUP_THIS_WEEK, GROUP_FORTHCOMING]),
+        vol.Optional("due_start"): cv.date,
+        vol.Optional("due_end"): cv.date,
+        vol.Optional("search"): cv.string,
+        vol.Optional("sort", default=SORT_POSITION): vol.In([SORT_POSITION, SORT_DUE, SORT_SUMMARY]),
+        vol.Optional("limit", default=100): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+        vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
+GET_OCCURRENCES_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entity_id"): cv.entity_id,
+        vol.Optional("start"): cv.date,
+        vol.Required("end"): cv.date,
+    }
+)
+
 # Service schemas
 SET_TASK_RECURRENCE_SCHEMA = vol.Schema(
     {
@@ -110,6 +222,62 @@ SET_TASK_RECURRENCE_SCHEMA = vol.Schema(
     }
 )
 
+BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("operations"): vol.All(
+            cv.ensure_list,
+            [
+                cv.key_value_schemas(
+                    "op",
+                    {
+                        BATCH_OP_CREATE: vol.Schema(
+                            {
+                                vol.Required("op"): BATCH_OP_CREATE,
+                                vol.Required("summary"): cv.string,
+                                vol.Optional("description"): cv.string,
+                                vol.Optional("due"): cv.string,
+                                vol.Optional("ref"): cv.string,
+                            }
+                        ),
+                        BATCH_OP_UPDATE: vol.Schema(
+                            {
+                                vol.Required("op"): BATCH_OP_UPDATE,
+                                vol.Required("uid"): cv.string,
+                                vol.Optional("summary"): cv.string,
+                                vol.Optional("description"): cv.string,
+                                vol.Optional("due"): cv.string,
+                                vol.Optional("status"): vol.In(["needs_action", "completed"]),
+                            }
+                        ),
+                        BATCH_OP_MOVE: vol.Schema(
+                            {
+                                vol.Required("op"): BATCH_OP_MOVE,
+                                vol.Required("uid"): cv.string,
+                                vol.Optional("previous_uid"): cv.string,
+                            }
+                        ),
+                        BATCH_OP_DELETE: vol.Schema(
+                            {
+                                vol.Required("op"): BATCH_OP_DELETE,
+                                vol.Required("uid"): cv.string,
+                            }
+                        ),
+                        BATCH_OP_SET_RECURRENCE: SET_TASK_RECURRENCE_SCHEMA.extend(
+                            {
+                                vol.Required("op"): BATCH_OP_SET_RECURRENCE,
+                                vol.Remove("entity_id"): cv.entity_id,
+                                vol.Remove("task_uid"): cv.string,
+                                vol.Required("uid"): cv.string,
+                            }
+                        ),
+                    },
+                )
+            ],
+        ),
+    }
+)
+
 GET_TASK_RECURRENCE_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id"): cv.entity_id,
@@ -126,10 +294,12 @@ APPLY_RECURRENCE_FROM_UI_SCHEMA = vol.Schema(
 _SETUP_LOCK = asyncio.Lock()
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: BetterTodoConfigEntry) -> bool:
     """Set up Better ToDo from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {"config": entry.data, "entities": {}}
+    # Filled with the list and helper entities as the platforms set them up
+    entry.runtime_data = BetterTodoData()
+    lists = async_get_list_registry(hass)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
@@ -169,6 +339,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass.data[DOMAIN]["js_registered"] = js_registration
             _LOGGER.info("Registered Better ToDo JavaScript modules")
         
+        if not hass.data[DOMAIN].get("websocket_registered"):
+            from .websocket import async_register_websocket_commands
+            async_register_websocket_commands(hass)
+            hass.data[DOMAIN]["websocket_registered"] = True
+
         # Register custom panel with sidebar navigation
         # The panel provides a two-column layout: sidebar with list navigation + main content area
         # This is the expected structure as shown in screenshot-01.png
@@ -184,13 +359,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entity_id = call.data["entity_id"]
         task_uid = call.data["task_uid"]
 
-        # Find the entity in stored entities
-        entity = None
-        for entry_data in hass.data[DOMAIN].values():
-            if isinstance(entry_data, dict) and "entities" in entry_data:
-                entity = entry_data["entities"].get(entity_id)
-                if entity is not None:
-                    break
+        entity = lists.get(entity_id)
 
         if entity is None:
             return
@@ -216,13 +385,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         """
         entity_id = call.data["entity_id"]
 
-        # Find the entity in stored entities
-        entity = None
-        for entry_data in hass.data[DOMAIN].values():
-            if isinstance(entry_data, dict) and "entities" in entry_data:
-                entity = entry_data["entities"].get(entity_id)
-                if entity is not None:
-                    break
+        entity = lists.get(entity_id)
 
         if entity is None:
             return
@@ -235,57 +398,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         
         This service reads the helper entity values and applies them to the task.
         It uses the following helper entities from the same config entry:
-        - text.{list_name}_task_uid: The task to apply recurrence to
-        - number.{list_name}_recurrence_interval: The interval value
-        - select.{list_name}_recurrence_unit: The time unit (days/months/years)
-        - select.{list_name}_recurrence_end_type: How to end (never/count/date)
-        - number.{list_name}_recurrence_end_count: Count value if end type is count
-        - text.{list_name}_recurrence_end_date: Date value if end type is date
+        - Task UID (text): The task to apply recurrence to
+        - Recurrence interval (number): The interval value
+        - Recurrence unit (select): The time unit (days/months/years)
+        - Recurrence end type (select): How to end (never/count/date)
+        - Recurrence end count (number): Count value if end type is count
+        - Recurrence end date (text): Date value if end type is date
         """
         entity_id = call.data["entity_id"]
-        
-        # Find the todo entity
-        todo_entity = None
-        entry_id = None
-        for eid, entry_data in hass.data[DOMAIN].items():
-            if isinstance(entry_data, dict) and "entities" in entry_data:
-                todo_entity = entry_data["entities"].get(entity_id)
-                if todo_entity is not None:
-                    entry_id = eid
-                    break
-        
-        if todo_entity is None or entry_id is None:
+
+        todo_entity = lists.get(entity_id)
+        if todo_entity is None:
             return
-        
-        # Get the helper entity IDs based on the entry_id
-        task_uid_entity_id = f"text.{todo_entity._entry.data['name'].lower().replace(' ', '_')}_task_uid"
-        interval_entity_id = f"number.{todo_entity._entry.data['name'].lower().replace(' ', '_')}_recurrence_interval"
-        unit_entity_id = f"select.{todo_entity._entry.data['name'].lower().replace(' ', '_')}_recurrence_unit"
-        end_type_entity_id = f"select.{todo_entity._entry.data['name'].lower().replace(' ', '_')}_recurrence_end_type"
-        end_count_entity_id = f"number.{todo_entity._entry.data['name'].lower().replace(' ', '_')}_recurrence_end_count"
-        end_date_entity_id = f"text.{todo_entity._entry.data['name'].lower().replace(' ', '_')}_recurrence_end_date"
-        
-        # Get the values from the helper entities
-        task_uid = hass.states.get(task_uid_entity_id)
-        interval = hass.states.get(interval_entity_id)
-        unit = hass.states.get(unit_entity_id)
-        end_type = hass.states.get(end_type_entity_id)
-        end_count = hass.states.get(end_count_entity_id)
-        end_date = hass.states.get(end_date_entity_id)
-        
-        if task_uid is None or not task_uid.state:
+
+        # Helper entities of the same config entry, referenced directly so
+        # renamed helpers and entity_id suffixes do not matter
+        helpers = todo_entity.runtime_data
+        task_uid = helpers.task_uid.native_value if helpers.task_uid else None
+        if not task_uid:
             return
-        
+
         # Determine recurrence settings
         recurrence_enabled = True
-        recurrence_interval = int(float(interval.state)) if interval else 1
-        recurrence_unit = unit.state if unit else "days"
-        recurrence_end_type_value = end_type.state if end_type else "never"
-        
+        interval = helpers.recurrence_interval.native_value if helpers.recurrence_interval else None
+        recurrence_interval = int(interval) if interval else 1
+        unit = helpers.recurrence_unit.current_option if helpers.recurrence_unit else None
+        recurrence_unit = unit or "days"
+        end_type = helpers.recurrence_end_type.current_option if helpers.recurrence_end_type else None
+        recurrence_end_type_value = end_type or "never"
+        end_count = helpers.recurrence_end_count.native_value if helpers.recurrence_end_count else None
+        end_date = helpers.recurrence_end_date.native_value if helpers.recurrence_end_date else None
+
         # Apply recurrence
         if recurrence_end_type_value == "never":
             todo_entity.set_task_recurrence(
-                uid=task_uid.state,
+                uid=task_uid,
                 recurrence_enabled=recurrence_enabled,
                 recurrence_interval=recurrence_interval,
                 recurrence_unit=recurrence_unit,
@@ -293,76 +440,81 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
         elif recurrence_end_type_value == "count" and end_count:
             todo_entity.set_task_recurrence(
-                uid=task_uid.state,
+                uid=task_uid,
                 recurrence_enabled=recurrence_enabled,
                 recurrence_interval=recurrence_interval,
                 recurrence_unit=recurrence_unit,
                 recurrence_end_enabled=True,
                 recurrence_end_type="count",
-                recurrence_end_count=int(float(end_count.state)),
+                recurrence_end_count=int(end_count),
             )
         elif recurrence_end_type_value == "date" and end_date:
             todo_entity.set_task_recurrence(
-                uid=task_uid.state,
+                uid=task_uid,
                 recurrence_enabled=recurrence_enabled,
                 recurrence_interval=recurrence_interval,
                 recurrence_unit=recurrence_unit,
                 recurrence_end_enabled=True,
                 recurrence_end_type="date",
-                recurrence_end_date=end_date.state,
+                recurrence_end_date=end_date,
             )
 
-    async def handle_create_task(call: ServiceCall) -> None:
-        """Handle the create_task service call."""
-        from homeassistant.components.todo import TodoItem
-        
-        entity_id = call.data["entity_id"]
-        
-        # Find the entity
-        entity = None
-        for entry_data in hass.data[DOMAIN].values():
-            if isinstance(entry_data, dict) and "entities" in entry_data:
-                entity = entry_data["entities"].get(entity_id)
-                if entity is not None:
-                    break
-        
+    def get_list(entity_id: str) -> BetterTodoEntity:
+        """Return the list targeted by a service call."""
+        entity = lists.get(entity_id)
         if entity is None:
-            _LOGGER.error("Entity %s not found for create_task service", entity_id)
-            return
-        
+            raise ServiceValidationError(f"Better ToDo list {entity_id} not found")
+        return entity  # type: ignore[no-any-return]
+
+    def task_response(entity: BetterTodoEntity, item: TodoItem) -> ServiceResponse:
+        """Return the stored task and its recurrence as service response data."""
+        return {
+            "uid": item.uid,
+            "item": asdict(item),
+            "recurrence": entity.get_task_recurrence(item.uid),
+        }
+
+    async def handle_create_task(call: ServiceCall) -> ServiceResponse:
+        """Handle the create_task service call.
+
+        Returns the UID and the stored task, so callers do not need to look
+        the new task up by summary.
+        """
+        entity = get_list(call.data["entity_id"])
+
+        # Recurrence given inline is set up with the task itself
+        recurrence = None
+        if call.data.get(ATTR_RECURRENCE_ENABLED):
+            recurrence = {
+                field: call.data[field] for field in RECURRENCE_FIELDS if field in call.data
+            }
+
         # Create the task
         item = TodoItem(
             summary=call.data["summary"],
             description=call.data.get("description"),
             due=call.data.get("due"),
         )
-        await entity.async_create_todo_item(item)
+        created = await entity.async_create_todo_item(item, recurrence)
+        if created is None:
+            return None
+        return task_response(entity, created)
 
-    async def handle_update_task(call: ServiceCall) -> None:
-        """Handle the update_task service call."""
-        from homeassistant.components.todo import TodoItem
-        
+    async def handle_update_task(call: ServiceCall) -> ServiceResponse:
+        """Handle the update_task service call.
+
+        Returns the UID and the stored task after the update.
+        """
         entity_id = call.data["entity_id"]
         uid = call.data["uid"]
         
-        # Find the entity
-        entity = None
-        for entry_data in hass.data[DOMAIN].values():
-            if isinstance(entry_data, dict) and "entities" in entry_data:
-                entity = entry_data["entities"].get(entity_id)
-                if entity is not None:
-                    break
-        
-        if entity is None:
-            _LOGGER.error("Entity %s not found for update_task service", entity_id)
-            return
-        
+        entity = get_list(entity_id)
+
         # Find the existing task using public method
         existing_item = entity.get_item_by_uid(uid)
         
         if existing_item is None:
-            _LOGGER.error("Task with UID %s not found in entity %s", uid, entity_id)
-            return
+            raise ServiceValidationError(f"Task {uid} not found in {entity_id}")
         
         # Update with new values
         updated_item = TodoItem(
@@ -373,6 +525,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             status=call.data.get("status", existing_item.status),
         )
         await entity.async_update_todo_item(updated_item)
+        stored = entity.get_item_by_uid(uid)
+        if stored is None:
+            return None
+        return task_response(entity, stored)
 
     async def handle_delete_task(call: ServiceCall) -> None:
         """Handle the delete_task service call."""
@@ -383,13 +539,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if isinstance(uids, str):
             uids = [uids]
         
-        # Find the entity
-        entity = None
-        for entry_data in hass.data[DOMAIN].values():
-            if isinstance(entry_data, dict) and "entities" in entry_data:
-                entity = entry_data["entities"].get(entity_id)
-                if entity is not None:
-                    break
+        entity = lists.get(entity_id)
         
         if entity is None:
             _LOGGER.error("Entity %s not found for delete_task service", entity_id)
@@ -403,13 +553,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         uid = call.data["uid"]
         previous_uid = call.data.get("previous_uid")
         
-        # Find the entity
-        entity = None
-        for entry_data in hass.data[DOMAIN].values():
-            if isinstance(entry_data, dict) and "entities" in entry_data:
-                entity = entry_data["entities"].get(entity_id)
-                if entity is not None:
-                    break
+        entity = lists.get(entity_id)
         
         if entity is None:
             _LOGGER.error("Entity %s not found for move_task service", entity_id)
@@ -417,6 +561,122 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         
         await entity.async_move_todo_item(uid, previous_uid)
 
+    async def handle_create_tasks(call: ServiceCall) -> ServiceResponse:
+        """Handle the create_tasks service call.
+
+        Creates every task with a single state write and returns the UID of
+        each new task, in the order of the items.
+        """
+        entity = get_list(call.data["entity_id"])
+        results = await entity.async_create_todo_items([
+            TodoItem(
+                summary=item["summary"],
+                description=item.get("description"),
+                due=item.get("due"),
+            )
+            for item in call.data["items"]
+        ])
+        return {"results": results}
+
+    async def handle_update_tasks(call: ServiceCall) -> ServiceResponse:
+        """Handle the update_tasks service call.
+
+        Applies every change with a single state write. Tasks that do not exist
+        are reported with a not_found error.
+        """
+        entity = get_list(call.data["entity_id"])
+        results = await entity.async_update_todo_items(call.data["items"])
+        return {"results": results}
+
+    async def handle_delete_tasks(call: ServiceCall) -> ServiceResponse:
+        """Handle the delete_tasks service call.
+
+        Deletes every task with a single state write. Tasks that do not exist
+        are reported with a not_found error.
+        """
+        entity = get_list(call.data["entity_id"])
+        uids = call.data["uids"]
+        deleted = set(await entity.async_delete_todo_items(uids))
+        return {
+            "results": [
+                {"uid": uid} if uid in deleted else {"uid": uid, "error": "not_found"}
+                for uid in uids
+            ]
+        }
+
+    async def handle_batch(call: ServiceCall) -> ServiceResponse:
+        """Handle the batch service call.
+
+        Applies the operations in order as one change: either all of them
+        succeed, or the list is left as it was and the error is raised.
+        """
+        entity = get_list(call.data["entity_id"])
+        return await entity.async_batch(call.data["operations"])
+
+    async def handle_get_tasks(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_tasks service call.
+
+        Returns one page of the tasks matching the filters, for one list or
+        for all lists, with the total number of matches.
+        """
+        entity_id = call.data.get("entity_id")
+        if entity_id is not None:
+            entities = [get_list(entity_id)]
+        else:
+            entities = list(lists)
+
+        sort = call.data["sort"]
+        tasks: list[dict[str, Any]] = []
+        for entity in entities:
+            tasks.extend(
+                {"entity_id": entity.entity_id, **task}
+                for task in entity.query_tasks(
+                    status=call.data.get("status"),
+                    group=call.data.get("group"),
+                    due_start=call.data.get("due_start"),
+                    due_end=call.data.get("due_end"),
+                    search=call.data.get("search"),
+                    sort=sort,
+                )
+            )
+
+        # Each list is already sorted, lists stay in order for the position sort
+        if len(entities) > 1 and sort == SORT_DUE:
+            tasks.sort(key=lambda task: parse_due(task["due"]) or date.max)
+        elif len(entities) > 1 and sort == SORT_SUMMARY:
+            tasks.sort(key=lambda task: task["summary"].casefold())
+
+        offset = call.data["offset"]
+        return {
+            "tasks": tasks[offset:offset + call.data["limit"]],
+            "total": len(tasks),
+        }
+
+    async def handle_get_occurrences(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_occurrences service call.
+
+        Returns the upcoming occurrences of recurring tasks in a date window,
+        for one list or for all lists, sorted by due date.
+        """
+        entity_id = call.data.get("entity_id")
+        start = call.data.get("start") or dt_util.now().date()
+        end = call.data["end"]
+
+        if entity_id is not None:
+            entities = [get_list(entity_id)]
+        else:
+            entities = list(lists)
+
+        occurrences: list[dict[str, Any]] = []
+        for entity in entities:
+            occurrences.extend(
+                {"entity_id": entity.entity_id, **occurrence}
+                for occurrence in entity.get_occurrences(start, end)
+            )
+
+        occurrences.sort(key=lambda occurrence: occurrence["due"])
+        return {"occurrences": occurrences}
+
     # Register services only once
     if not hass.services.has_service(DOMAIN, SERVICE_CREATE_TASK):
         hass.services.async_register(
@@ -424,6 +684,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             SERVICE_CREATE_TASK,
             handle_create_task,
             schema=CREATE_TASK_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
         )
 
     if not hass.services.has_service(DOMAIN, SERVICE_UPDATE_TASK):
@@ -432,6 +693,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             SERVICE_UPDATE_TASK,
             handle_update_task,
             schema=UPDATE_TASK_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
         )
 
     if not hass.services.has_service(DOMAIN, SERVICE_DELETE_TASK):
@@ -450,6 +712,60 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             schema=MOVE_TASK_SCHEMA,
         )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_CREATE_TASKS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_CREATE_TASKS,
+            handle_create_tasks,
+            schema=CREATE_TASKS_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_UPDATE_TASKS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_UPDATE_TASKS,
+            handle_update_tasks,
+            schema=UPDATE_TASKS_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_DELETE_TASKS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_DELETE_TASKS,
+            handle_delete_tasks,
+            schema=DELETE_TASKS_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_BATCH):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_BATCH,
+            handle_batch,
+            schema=BATCH_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_GET_TASKS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_TASKS,
+            handle_get_tasks,
+            schema=GET_TASKS_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_GET_OCCURRENCES):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_OCCURRENCES,
+            handle_get_occurrences,
+            schema=GET_OCCURRENCES_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
     # Register services only once
     if not hass.services.has_service(DOMAIN, SERVICE_SET_TASK_RECURRENCE):
         hass.services.async_register(
@@ -478,20 +794,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+async def async_update_options(hass: HomeAssistant, entry: BetterTodoConfigEntry) -> None:
     """Update options."""
     await hass.config_entries.async_reload(entry.entry_id)
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: BetterTodoConfigEntry) -> bool:
     """Unload a config entry."""
+    # Write any coalesced task changes before the entity goes away
+    entity = entry.runtime_data.entity
+    if entity is not None:
+        await entity.async_flush()
+
     # First unload the standard platforms
     unload_ok: bool = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     # Manually remove the todo entity from entity registry since it's not in PLATFORMS
-    if unload_ok and entry.entry_id in hass.data[DOMAIN]:
+    if unload_ok:
         try:
-            entity = hass.data[DOMAIN][entry.entry_id].get("entity")
             if entity and entity.entity_id:
                 # Use the entity registry to properly remove the entity
                 from homeassistant.helpers import entity_registry as er
@@ -503,9 +823,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.warning("Error removing Better ToDo entity from registry: %s", err)
             # Don't fail unload due to cleanup errors
 
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-
     # Check if this is the last entry being removed
     # We need to check if there are any OTHER entries besides the one being unloaded
     remaining_entries = [
@@ -528,5 +845,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(DOMAIN, SERVICE_UPDATE_TASK)
         hass.services.async_remove(DOMAIN, SERVICE_DELETE_TASK)
         hass.services.async_remove(DOMAIN, SERVICE_MOVE_TASK)
+        hass.services.async_remove(DOMAIN, SERVICE_GET_OCCURRENCES)
+        hass.services.async_remove(DOMAIN, SERVICE_CREATE_TASKS)
+        hass.services.async_remove(DOMAIN, SERVICE_UPDATE_TASKS)
+        hass.services.async_remove(DOMAIN, SERVICE_DELETE_TASKS)
+        hass.services.async_remove(DOMAIN, SERVICE_BATCH)
+        hass.services.async_remove(DOMAIN, SERVICE_GET_TASKS)
 
     return unload_ok
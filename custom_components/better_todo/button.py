@@ -4,16 +4,16 @@ from __future__ import annotations
 from typing import Any
 
 from homeassistant.components.button import ButtonEntity
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, ENTITY_DOMAIN
+from .const import DOMAIN
+from .runtime import BetterTodoConfigEntry
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: BetterTodoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Better ToDo button platform."""
@@ -27,7 +27,7 @@ class ApplyRecurrenceButton(ButtonEntity):
     _attr_has_entity_name = True
     _attr_icon = "mdi:refresh-auto"
 
-    def __init__(self, entry: ConfigEntry) -> None:
+    def __init__(self, entry: BetterTodoConfigEntry) -> None:
         """Initialize the apply recurrence button entity."""
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_apply_recurrence"
@@ -51,12 +51,14 @@ class ApplyRecurrenceButton(ButtonEntity):
         the helper entity values and applies them to the task specified in the
         task UID text entity.
         """
-        # Call the apply_recurrence_from_ui service
-        todo_entity_id = f"{ENTITY_DOMAIN}.{self._entry.data['name'].lower().replace(' ', '_')}"
-        
+        todo_entity = self._entry.runtime_data.entity
+        if todo_entity is None:
+            return
+
+        # Call the apply_recurrence_from_ui service with the list's current entity_id
         await self.hass.services.async_call(
-            "better_todo",
+            DOMAIN,
             "apply_recurrence_from_ui",
-            {"entity_id": todo_entity_id},
+            {"entity_id": todo_entity.entity_id},
             blocking=True,
         )
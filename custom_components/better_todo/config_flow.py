@@ -15,8 +15,20 @@ from homeassistant.helpers import config_validation as cv
 from .const import (
     AUTO_LIST_CREATION_DELAY,
     AUTO_SHOPPING_LIST_NAME,
+    CONF_EXPOSE_ITEMS,
+    CONF_MISSED_OCCURRENCES,
+    CONF_SAVE_DELAY,
+    CONF_STATE_WRITE_INTERVAL,
+    DEFAULT_EXPOSE_ITEMS,
     DEFAULT_LIST_NAME,
+    DEFAULT_MISSED_OCCURRENCES,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_STATE_WRITE_INTERVAL,
     DOMAIN,
+    MAX_SAVE_DELAY,
+    MAX_STATE_WRITE_INTERVAL,
+    MISSED_OCCURRENCES_CREATE,
+    MISSED_OCCURRENCES_SKIP,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,6 +36,29 @@ _LOGGER = logging.getLogger(__name__)
 CONFIG_SCHEMA = vol.Schema({vol.Required("name", default=DEFAULT_LIST_NAME): cv.string})
 
 
+def _options_schema(data: Any) -> vol.Schema:
+    """Build the options schema using the current entry data as defaults."""
+    return vol.Schema(
+        {
+            vol.Required("name", default=data.get("name", "")): cv.string,
+            vol.Optional(
+                CONF_SAVE_DELAY, default=data.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_SAVE_DELAY)),
+            vol.Optional(
+                CONF_EXPOSE_ITEMS, default=data.get(CONF_EXPOSE_ITEMS, DEFAULT_EXPOSE_ITEMS)
+            ): cv.boolean,
+            vol.Optional(
+                CONF_STATE_WRITE_INTERVAL,
+                default=data.get(CONF_STATE_WRITE_INTERVAL, DEFAULT_STATE_WRITE_INTERVAL),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_STATE_WRITE_INTERVAL)),
+            vol.Optional(
+                CONF_MISSED_OCCURRENCES,
+                default=data.get(CONF_MISSED_OCCURRENCES, DEFAULT_MISSED_OCCURRENCES),
+            ): vol.In([MISSED_OCCURRENCES_SKIP, MISSED_OCCURRENCES_CREATE]),
+        }
+    )
+
+
 class BetterTodoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     """Handle a config flow for Better ToDo."""
 
@@ -133,13 +168,7 @@ class BetterTodoOptionsFlow(config_entries.OptionsFlow):
                 if entry.entry_id != self.config_entry.entry_id and entry.data.get("name") == new_name:
                     return self.async_show_form(
                         step_id="init",
-                        data_schema=vol.Schema(
-                            {
-                                vol.Required(
-                                    "name", default=self.config_entry.data.get("name", "")
-                                ): cv.string,
-                            }
-                        ),
+                        data_schema=_options_schema(self.config_entry.data),
                         errors={"name": "already_configured"},
                     )
             
@@ -153,11 +182,5 @@ class BetterTodoOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        "name", default=self.config_entry.data.get("name", "")
-                    ): cv.string,
-                }
-            ),
+            data_schema=_options_schema(self.config_entry.data),
         )
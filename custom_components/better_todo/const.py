@@ -10,6 +10,25 @@ AUTO_SHOPPING_LIST_NAME = "Shopping List"
 # Config flow constants
 AUTO_LIST_CREATION_DELAY = 0.5  # Seconds to wait before creating shopping list
 
+# Storage constants
+CONF_SAVE_DELAY = "save_delay"
+DEFAULT_SAVE_DELAY = 2.0  # Seconds to coalesce task changes before writing to disk
+MAX_SAVE_DELAY = 60.0
+JOURNAL_MAX_RECORDS = 1000  # Compact the journal into a snapshot after this many records
+JOURNAL_MAX_BYTES = 512 * 1024  # ... or once it grows past this size
+
+# State attribute constants
+CONF_EXPOSE_ITEMS = "expose_items"  # Also publish the full task list in state attributes
+DEFAULT_EXPOSE_ITEMS = False
+CONF_STATE_WRITE_INTERVAL = "state_write_interval"  # Minimum seconds between state writes
+DEFAULT_STATE_WRITE_INTERVAL = 0.0  # Write the state on every change
+MAX_STATE_WRITE_INTERVAL = 30.0
+
+# Dispatcher signal for per-item changes, formatted with the config entry id
+SIGNAL_ITEMS_UPDATED = f"{DOMAIN}_items_updated_{{}}"
+# Dispatcher signal for lists being added, removed, renamed or changing their active count
+SIGNAL_LISTS_UPDATED = f"{DOMAIN}_lists_updated"
+
 # Recurrence constants
 ATTR_RECURRENCE_ENABLED = "recurrence_enabled"
 ATTR_RECURRENCE_INTERVAL = "recurrence_interval"
@@ -19,6 +38,17 @@ ATTR_RECURRENCE_END_TYPE = "recurrence_end_type"
 ATTR_RECURRENCE_END_COUNT = "recurrence_end_count"
 ATTR_RECURRENCE_END_DATE = "recurrence_end_date"
 ATTR_RECURRENCE_CURRENT_COUNT = "recurrence_current_count"
+# Known occurrence the next ones are computed from, set by the recurrence engine
+ATTR_RECURRENCE_ANCHOR_DATE = "recurrence_anchor_date"
+ATTR_RECURRENCE_ANCHOR_INDEX = "recurrence_anchor_index"
+# Due date the completed task is reopened with, None when not waiting
+ATTR_RECURRENCE_NEXT_DUE = "recurrence_next_due"
+
+# What to do with occurrences that are reached without being completed
+CONF_MISSED_OCCURRENCES = "missed_occurrences"
+MISSED_OCCURRENCES_SKIP = "skip"  # Move on to the latest occurrence
+MISSED_OCCURRENCES_CREATE = "create"  # Also keep one task per missed occurrence
+DEFAULT_MISSED_OCCURRENCES = MISSED_OCCURRENCES_SKIP
 
 # Recurrence units
 RECURRENCE_UNIT_DAYS = "days"
@@ -30,6 +60,13 @@ RECURRENCE_UNIT_YEARS = "years"
 RECURRENCE_END_TYPE_COUNT = "count"
 RECURRENCE_END_TYPE_DATE = "date"
 
+# Operations of the batch service
+BATCH_OP_CREATE = "create"
+BATCH_OP_UPDATE = "update"
+BATCH_OP_MOVE = "move"
+BATCH_OP_DELETE = "delete"
+BATCH_OP_SET_RECURRENCE = "set_recurrence"
+
 # Dashboard constants (Custom panel with sidebar visibility)
 DASHBOARD_URL = "better-todo"
 DASHBOARD_TITLE = "Better ToDo"
@@ -41,32 +78,34 @@ GROUP_THIS_WEEK = "this_week"
 GROUP_FORTHCOMING = "forthcoming"
 # GROUP_DONE is no longer used - HA's native "Completed" section handles done tasks
 
+# Sort orders of the get_tasks service
+SORT_POSITION = "position"
+SORT_DUE = "due"
+SORT_SUMMARY = "summary"
+
 # Frontend resource constants
 URL_BASE = "better_todo"
+# Lovelace cards, registered as dashboard resources. They import the shared
+# better-todo-core.js module, and the panel component is loaded by the panel.
 JSMODULES = [
-    {
-        "name": "Better ToDo Panel Component",
-        "filename": "better-todo-panel-component.js",
-        "version": "0.10.6",
-    },
     {
         "name": "Better ToDo List Card",
         "filename": "better-todo-list-card.js",
-        "version": "0.10.0",
+        "version": "0.13.0",
     },
     {
         "name": "Better ToDo Card",
         "filename": "better-todo-card.js",
-        "version": "0.6.8",
+        "version": "0.8.0",
     },
     {
         "name": "Better ToDo Dashboard Card",
         "filename": "better-todo-dashboard-card.js",
-        "version": "1.0.0",
+        "version": "1.3.0",
     },
     {
         "name": "Better ToDo Simple Card",
         "filename": "better-todo-simple-card.js",
-        "version": "1.0.0",
+        "version": "1.2.0",
     },
 ]
@@ -13,6 +13,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import storage
 
 from .const import DASHBOARD_ICON, DASHBOARD_TITLE, DASHBOARD_URL, DOMAIN, ENTITY_DOMAIN
+from .runtime import async_get_list_registry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -167,12 +168,17 @@ async def async_create_or_update_dashboard(hass: HomeAssistant) -> None:
     # Uses custom:better-todo-list-card which replicates native functionality
     # but works with Better ToDo entities that don't inherit from TodoListEntity
     cards: list[dict[str, Any]] = []
+    lists = async_get_list_registry(hass)
     
     for entry in entries:
-        # Get the entity_id for this entry
-        list_name = entry.data.get("name", "tasks")
-        slug = list_name.lower().replace(" ", "_")
-        entity_id = f"{ENTITY_DOMAIN}.{slug}"
+        # Get the entity_id for this entry, which may have a suffix or a new name
+        entity = lists.get_by_entry(entry.entry_id)
+        if entity is not None:
+            entity_id = entity.entity_id
+        else:
+            list_name = entry.data.get("name", "tasks")
+            slug = list_name.lower().replace(" ", "_")
+            entity_id = f"{ENTITY_DOMAIN}.{slug}"
         
         # Create a custom Better ToDo list card for this entity
         cards.append({
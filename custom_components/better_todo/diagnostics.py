@@ -0,0 +1,28 @@
+"""Diagnostics support for Better ToDo integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .runtime import BetterTodoConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: BetterTodoConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a Better ToDo list."""
+    runtime_data = getattr(entry, "runtime_data", None)
+    entity = runtime_data.entity if runtime_data is not None else None
+    if entity is None:
+        return {"config": dict(entry.data), "loaded": False}
+
+    return {
+        "config": dict(entry.data),
+        "loaded": True,
+        "entity_id": entity.entity_id,
+        "task_count": len(entity.todo_items),
+        "storage": entity.storage_stats,
+        "state_writes": entity.state_write_stats,
+        "occurrence_cache": entity.occurrence_cache_stats,
+    }
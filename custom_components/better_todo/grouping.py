@@ -0,0 +1,396 @@
+"""Task grouping for Better ToDo integration.
+
+Active tasks are shown in three groups: no due date, this week and
+forthcoming. ``TaskGroups`` keeps each group as a bucket sorted by due date
+(then list position) and updates it as tasks change, so building the grouped
+view is a plain concatenation. Due dates are parsed once, when a task is
+added or changed, into a ``TaskRecord`` that sorting and filtering reuse, and
+tasks only move between the dated buckets when the week window changes.
+
+The buckets also answer the overdue, due today and next due date summary by
+bisection, without visiting the tasks.
+
+``WeekScheduler`` computes that window once for all lists and advances it with
+a timer at the start of the next week, or when the time zone or language of
+Home Assistant changes. The same timer tells lists when a new day starts.
+"""
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, insort
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, GROUP_FORTHCOMING, GROUP_NO_DUE_DATE, GROUP_THIS_WEEK
+
+_LOGGER = logging.getLogger(__name__)
+
+# Order in which groups are shown
+GROUP_ORDER = (GROUP_NO_DUE_DATE, GROUP_THIS_WEEK, GROUP_FORTHCOMING)
+
+# Bucket entries: (due date ordinal, list rank, uid)
+_Key = tuple[int, float, str]
+
+
+def parse_due(due: Any) -> date | None:
+    """Return the due date of a task, None if it has none or it is invalid."""
+    if not due:
+        return None
+    if isinstance(due, datetime):
+        return due.date()
+    if isinstance(due, date):
+        return due
+    try:
+        # due is stored as a date string in format YYYY-MM-DD
+        return datetime.strptime(due, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def week_start_day(language: str) -> int:
+    """Get the first day of the week for a Home Assistant language.
+
+    Returns:
+        0 for Monday (used in most locales including Spanish)
+        6 for Sunday (used in US English and some other locales)
+
+    This uses Python's weekday() where Monday=0, Sunday=6
+    """
+    # Sunday for US English and similar locales, Monday for all others
+    # (including "es", "en-GB", etc.)
+    sunday_first_locales = ["en-US", "en_US"]
+    if language in sunday_first_locales:
+        return 6
+    return 0
+
+
+def week_window(today: date, week_start_day: int) -> tuple[date, date]:
+    """Return the first and last day of the week containing today.
+
+    week_start_day uses Python's weekday() numbering (0=Monday, 6=Sunday).
+    """
+    days_since_start = (today.weekday() - week_start_day) % 7
+    start = today - timedelta(days=days_since_start)
+    return start, start + timedelta(days=6)
+
+
+class TaskRecord:
+    """Parsed due date, bucket key and group of one task."""
+
+    __slots__ = ("due", "group", "key")
+
+    def __init__(self, due: date | None, group: str | None, key: _Key) -> None:
+        """Initialize the record, group is None for completed tasks."""
+        self.due = due
+        self.group = group
+        self.key = key
+
+
+class TaskGroups:
+    """Tasks with their parsed due dates, active ones sorted into group buckets.
+
+    Completed tasks keep a record (for their due date) but are in no bucket.
+    """
+
+    def __init__(self, window: tuple[date, date]) -> None:
+        """Initialize empty buckets for the given week window."""
+        self._window = window
+        self._buckets: dict[str, list[_Key]] = {group: [] for group in GROUP_ORDER}
+        self._records: dict[str, TaskRecord] = {}
+        self._completed = 0
+
+    def __contains__(self, uid: object) -> bool:
+        """Return True if the task is in a bucket."""
+        record = self._records.get(uid) if isinstance(uid, str) else None
+        return record is not None and record.group is not None
+
+    def __len__(self) -> int:
+        """Return the number of active tasks."""
+        return len(self._records) - self._completed
+
+    @property
+    def completed(self) -> int:
+        """Return the number of completed tasks."""
+        return self._completed
+
+    @property
+    def window(self) -> tuple[date, date]:
+        """Return the week window used for the this week group."""
+        return self._window
+
+    def _group_for(self, ordinal: int | None) -> str:
+        """Return the group for a due date ordinal."""
+        if ordinal is None:
+            return GROUP_NO_DUE_DATE
+        start, end = self._window
+        if start.toordinal() <= ordinal <= end.toordinal():
+            return GROUP_THIS_WEEK
+        return GROUP_FORTHCOMING
+
+    def add(self, uid: str, due: Any, rank: float, active: bool = True) -> None:
+        """Add a task, to its bucket if it is active, replacing any previous entry."""
+        self.discard(uid)
+        due_date = parse_due(due)
+        ordinal = due_date.toordinal() if due_date is not None else None
+        key: _Key = (ordinal or 0, rank, uid)
+        if not active:
+            self._records[uid] = TaskRecord(due_date, None, key)
+            self._completed += 1
+            return
+        group = self._group_for(ordinal)
+        insort(self._buckets[group], key)
+        self._records[uid] = TaskRecord(due_date, group, key)
+
+    def discard(self, uid: str) -> None:
+        """Remove a task, if present."""
+        record = self._records.pop(uid, None)
+        if record is None:
+            return
+        if record.group is None:
+            self._completed -= 1
+            return
+        bucket = self._buckets[record.group]
+        del bucket[bisect_left(bucket, record.key)]
+
+    def clear(self) -> None:
+        """Remove every task."""
+        for bucket in self._buckets.values():
+            bucket.clear()
+        self._records.clear()
+        self._completed = 0
+
+    def set_window(self, window: tuple[date, date]) -> bool:
+        """Move dated tasks between groups for a new week window.
+
+        Returns True if the window changed.
+        """
+        if window == self._window:
+            return False
+        self._window = window
+
+        # Keys sort by due date first, and (ordinal,) sorts before every key
+        # due that day, so bisection finds the tasks inside the new window.
+        # Only the tasks that cross its boundaries change bucket.
+        start, end = window[0].toordinal(), window[1].toordinal()
+        this_week = self._buckets[GROUP_THIS_WEEK]
+        forthcoming = self._buckets[GROUP_FORTHCOMING]
+
+        low, high = bisect_left(this_week, (start,)), bisect_left(this_week, (end + 1,))
+        leaving = this_week[:low] + this_week[high:]
+        del this_week[high:]
+        del this_week[:low]
+
+        low, high = bisect_left(forthcoming, (start,)), bisect_left(forthcoming, (end + 1,))
+        entering = forthcoming[low:high]
+        del forthcoming[low:high]
+
+        for key in entering:
+            insort(this_week, key)
+            self._records[key[2]].group = GROUP_THIS_WEEK
+        for key in leaving:
+            insort(forthcoming, key)
+            self._records[key[2]].group = GROUP_FORTHCOMING
+        return True
+
+    def group_of(self, uid: str) -> str | None:
+        """Return the group of a task, None if it is not active."""
+        record = self._records.get(uid)
+        return record.group if record is not None else None
+
+    def due_of(self, uid: str) -> date | None:
+        """Return the parsed due date of a task, None if it has none."""
+        record = self._records.get(uid)
+        return record.due if record is not None else None
+
+    def uids(
+        self,
+        group: str | None = None,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[str]:
+        """Return the active tasks of a group (or all groups) due in a range.
+
+        Buckets are sorted by due date, so a date range is found by bisection
+        and only the matching tasks are visited. Tasks without a due date
+        never match a range.
+        """
+        groups = (group,) if group is not None else GROUP_ORDER
+        ranged = start is not None or end is not None
+        result: list[str] = []
+        for name in groups:
+            if ranged and name == GROUP_NO_DUE_DATE:
+                continue
+            bucket = self._buckets[name]
+            low = bisect_left(bucket, (start.toordinal(),)) if start is not None else 0
+            high = bisect_left(bucket, (end.toordinal() + 1,)) if end is not None else len(bucket)
+            result.extend(key[2] for key in bucket[low:high])
+        return result
+
+    def due_summary(self, today: date) -> tuple[int, int, date | None]:
+        """Return the overdue and due today counts and the next due date.
+
+        The next due date is the earliest one on or after today.
+        """
+        ordinal = today.toordinal()
+        overdue = due_today = 0
+        next_due: int | None = None
+        for name in (GROUP_THIS_WEEK, GROUP_FORTHCOMING):
+            bucket = self._buckets[name]
+            low = bisect_left(bucket, (ordinal,))
+            high = bisect_left(bucket, (ordinal + 1,), low)
+            overdue += low
+            due_today += high - low
+            if low < len(bucket) and (next_due is None or bucket[low][0] < next_due):
+                next_due = bucket[low][0]
+        return overdue, due_today, date.fromordinal(next_due) if next_due is not None else None
+
+    def grouped(self) -> list[tuple[str, list[str]]]:
+        """Return the uids of each non-empty group, in display order."""
+        return [
+            (group, [key[2] for key in self._buckets[group]])
+            for group in GROUP_ORDER
+            if self._buckets[group]
+        ]
+
+
+WeekListener = Callable[[tuple[date, date]], None]
+DayListener = Callable[[date], None]
+
+
+class WeekScheduler:
+    """Keeps the current week window and advances it when a new week starts.
+
+    One scheduler is shared by every list. Listeners are called with the new
+    window when it changes, and also when the language changes (group labels
+    are translated). Day listeners are called with the new date at local
+    midnight. The timer and event listener only run while there are listeners.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._listeners: list[WeekListener] = []
+        self._day_listeners: list[DayListener] = []
+        self._language = hass.config.language
+        self._today: date = dt_util.now().date()
+        self._window = self._compute_window()
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._unsub_config: CALLBACK_TYPE | None = None
+
+    @property
+    def window(self) -> tuple[date, date]:
+        """Return the first and last day of the current week."""
+        return self._window
+
+    @property
+    def today(self) -> date:
+        """Return the current local date."""
+        return self._today
+
+    def _compute_window(self) -> tuple[date, date]:
+        """Compute the week window from the current local date."""
+        return week_window(self._today, week_start_day(self._hass.config.language))
+
+    @callback
+    def async_add_listener(self, listener: WeekListener) -> CALLBACK_TYPE:
+        """Call listener with the new window whenever the week changes."""
+        return self._async_add(self._listeners, listener)
+
+    @callback
+    def async_add_day_listener(self, listener: DayListener) -> CALLBACK_TYPE:
+        """Call listener with the new date whenever a day starts."""
+        return self._async_add(self._day_listeners, listener)
+
+    @callback
+    def _async_add(self, listeners: list[Any], listener: Any) -> CALLBACK_TYPE:
+        """Add a listener, starting the timer for the first one."""
+        if not self._listeners and not self._day_listeners:
+            self._async_start()
+        listeners.append(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            listeners.remove(listener)
+            if not self._listeners and not self._day_listeners:
+                self._async_stop()
+
+        return _remove_listener
+
+    @callback
+    def _async_start(self) -> None:
+        """Start tracking week changes."""
+        self._today = dt_util.now().date()
+        self._window = self._compute_window()
+        self._language = self._hass.config.language
+        self._unsub_config = self._hass.bus.async_listen(
+            EVENT_CORE_CONFIG_UPDATE, self._async_config_updated
+        )
+        self._async_schedule()
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop tracking week changes."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._unsub_config is not None:
+            self._unsub_config()
+            self._unsub_config = None
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Schedule the timer at the next local midnight."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+        tomorrow = dt_util.start_of_local_day(self._today + timedelta(days=1))
+        self._unsub_timer = async_track_point_in_time(
+            self._hass, self._async_day_started, tomorrow
+        )
+
+    @callback
+    def _async_day_started(self, now: datetime) -> None:
+        """Advance to the new day, and week if one starts."""
+        self._unsub_timer = None
+        self._async_refresh()
+
+    @callback
+    def _async_config_updated(self, event: Event) -> None:
+        """Recompute the window when the time zone or language changes."""
+        self._async_refresh()
+
+    @callback
+    def _async_refresh(self) -> None:
+        """Recompute the date and window, reschedule and notify listeners on changes."""
+        today = dt_util.now().date()
+        new_day = today != self._today
+        self._today = today
+        window = self._compute_window()
+        language = self._hass.config.language
+        changed = window != self._window or language != self._language
+        self._window = window
+        self._language = language
+        self._async_schedule()
+
+        if changed:
+            _LOGGER.debug("Week window is now %s to %s", window[0], window[1])
+            for listener in list(self._listeners):
+                listener(window)
+        if new_day:
+            for day_listener in list(self._day_listeners):
+                day_listener(today)
+
+
+@callback
+def async_get_week_scheduler(hass: HomeAssistant) -> WeekScheduler:
+    """Return the week scheduler shared by every list."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    scheduler: WeekScheduler | None = domain_data.get("week_scheduler")
+    if scheduler is None:
+        scheduler = domain_data["week_scheduler"] = WeekScheduler(hass)
+    return scheduler
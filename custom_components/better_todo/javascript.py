@@ -5,11 +5,14 @@ This ensures custom cards are properly registered in Lovelace resources.
 """
 from __future__ import annotations
 
+import json
 import logging
+import re
 from pathlib import Path
 from typing import Any
 
-from homeassistant.components.http import StaticPathConfig
+from aiohttp import hdrs, web
+from homeassistant.components.http import HomeAssistantView, StaticPathConfig
 from homeassistant.components.lovelace import LovelaceData
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import async_call_later
@@ -19,6 +22,42 @@ from .const import DOMAIN, JSMODULES, URL_BASE
 _LOGGER = logging.getLogger(__name__)
 
 JS_URL = f"/{URL_BASE}/js"
+DIST_URL = f"/{URL_BASE}/dist"
+MANIFEST_FILENAME = "manifest.json"
+PANEL_FILENAME = "better-todo-panel-component.js"
+
+# Built files have a hash of their content in the name, so a URL always
+# returns the same file and browsers can keep it without revalidating
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# better-todo-card.1a2b3c4d.js -> better-todo-card.js
+HASHED_FILENAME = re.compile(r"^(?P<name>.+)\.[0-9a-f]{8}\.js$")
+
+
+class BetterTodoAssetView(HomeAssistantView):
+    """Serve the minified, content-hashed modules built into www/dist."""
+
+    url = DIST_URL + "/{filename}"
+    name = f"{URL_BASE}:dist"
+    requires_auth = False
+
+    def __init__(self, path: Path, filenames: set[str]) -> None:
+        """Initialise."""
+        self._path = path
+        self._filenames = filenames
+
+    async def get(self, request: web.Request, filename: str) -> web.FileResponse:
+        """Serve a built module.
+
+        aiohttp sends the pre-compressed .br or .gz file next to it when the
+        browser accepts that encoding.
+        """
+        if filename not in self._filenames:
+            raise web.HTTPNotFound
+        return web.FileResponse(
+            self._path / filename,
+            headers={hdrs.CACHE_CONTROL: IMMUTABLE_CACHE_CONTROL},
+        )
 
 
 class JSModuleRegistration:
@@ -28,9 +67,13 @@ class JSModuleRegistration:
         """Initialise."""
         self.hass = hass
         self.lovelace: LovelaceData | None = self.hass.data.get("lovelace")
+        self.path = Path(self.hass.config.path(f"custom_components/{DOMAIN}/www"))
+        # Source file name -> hashed file name in www/dist
+        self.assets: dict[str, str] = {}
 
     async def async_setup(self) -> bool:
         """Register better_todo path."""
+        self.assets = await self.hass.async_add_executor_job(self._load_manifest)
         await self._async_register_path()
         if self.lovelace and self.lovelace.mode == "storage":
             await self._async_wait_for_lovelace_resources()
@@ -42,18 +85,44 @@ class JSModuleRegistration:
             await self.async_unregister()
         return True
 
+    def _load_manifest(self) -> dict[str, str]:
+        """Load the hashed file names written by the frontend build."""
+        manifest = self.path / "dist" / MANIFEST_FILENAME
+        try:
+            assets: dict[str, str] = json.loads(manifest.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as err:
+            _LOGGER.warning(
+                "Could not read %s, serving the unminified modules: %s", manifest, err
+            )
+            return {}
+        return assets
+
+    def module_url(self, filename: str, version: str | None = None) -> str:
+        """Return the URL browsers should load a module from."""
+        if hashed := self.assets.get(filename):
+            return f"{DIST_URL}/{hashed}"
+        # No build output, fall back to the source file
+        if version is None:
+            return f"{JS_URL}/{filename}"
+        return f"{JS_URL}/{filename}?v={version}"
+
     async def _async_register_path(self) -> None:
         """Register resource path if not already registered."""
         try:
             # Use www folder for JavaScript files (standard Home Assistant pattern)
-            path = Path(self.hass.config.path(f"custom_components/{DOMAIN}/www"))
             # Register both /better_todo/js and /better_todo/www paths
-            # /js is used for Lovelace resources, /www is used for panel component
+            # /js is the fallback when there is no build output, /www is
+            # kept for resources added by hand with older versions
             await self.hass.http.async_register_static_paths([
-                StaticPathConfig(JS_URL, path, False),
-                StaticPathConfig(f"/{URL_BASE}/www", path, False)
+                StaticPathConfig(JS_URL, self.path, False),
+                StaticPathConfig(f"/{URL_BASE}/www", self.path, False)
             ])
-            _LOGGER.debug("Registered resource paths for %s", path)
+            # /dist serves the built modules with immutable caching
+            if self.assets:
+                self.hass.http.register_view(
+                    BetterTodoAssetView(self.path / "dist", set(self.assets.values()))
+                )
+            _LOGGER.debug("Registered resource paths for %s", self.path)
         except RuntimeError:
             # Runtime error is likely this is already registered.
             _LOGGER.debug("Resource paths already registered")
@@ -84,79 +153,74 @@ class JSModuleRegistration:
         resources = [
             resource
             for resource in self.lovelace.resources.async_items()
-            if resource["url"].startswith(JS_URL)
+            if resource["url"].startswith((JS_URL, DIST_URL))
         ]
 
+        # Remove resources of files that are no longer registered, e.g. the
+        # panel component, so dashboards do not download them
+        module_filenames = {module.get("filename") for module in JSMODULES}
+        for resource in resources:
+            if self._get_resource_filename(resource["url"]) not in module_filenames:
+                _LOGGER.debug("Removing unused resource %s", resource["url"])
+                await self.lovelace.resources.async_delete_item(resource.get("id"))
+
         for module in JSMODULES:
-            url = f"{JS_URL}/{module.get('filename')}"
-            version = module.get("version", "0")
+            filename = module["filename"]
+            # The hashed file name changes with the content, so the URL is
+            # updated whenever a new build is installed
+            url = self.module_url(filename, module.get("version", "0"))
 
             card_registered = False
 
             for resource in resources:
-                if self._get_resource_path(resource["url"]) == url:
+                if self._get_resource_filename(resource["url"]) == filename:
                     card_registered = True
-                    # check version
-                    if self._get_resource_version(resource["url"]) != version:
-                        # Update card version
-                        _LOGGER.debug(
-                            "Updating %s to version %s",
-                            module.get("name"),
-                            version,
-                        )
+                    # check URL
+                    if resource["url"] != url:
+                        # Update card URL
+                        _LOGGER.debug("Updating %s to %s", module.get("name"), url)
                         await self.lovelace.resources.async_update_item(
                             resource.get("id"),
                             {
                                 "res_type": "module",
-                                "url": url + "?v=" + version,
+                                "url": url,
                             },
                         )
                         # Remove old gzipped files
                         await self.async_remove_gzip_files()
                     else:
                         _LOGGER.debug(
-                            "%s already registered as version %s",
-                            module.get("name"),
-                            version,
+                            "%s already registered as %s", module.get("name"), url
                         )
 
             if not card_registered:
-                _LOGGER.debug(
-                    "Registering %s as version %s",
-                    module.get("name"),
-                    version,
-                )
+                _LOGGER.debug("Registering %s as %s", module.get("name"), url)
                 await self.lovelace.resources.async_create_item(
-                    {"res_type": "module", "url": url + "?v=" + version}
+                    {"res_type": "module", "url": url}
                 )
 
-    def _get_resource_path(self, url: str) -> str:
-        """Get resource path without version parameter."""
-        return url.split("?")[0]
-
-    def _get_resource_version(self, url: str) -> str:
-        """Get resource version from URL."""
-        parts = url.split("?")
-        if len(parts) > 1:
-            version = parts[1].replace("v=", "")
-            return version
-        return "0"
+    def _get_resource_filename(self, url: str) -> str:
+        """Get resource file name without version parameter or content hash."""
+        filename = url.split("?")[0].rsplit("/", 1)[-1]
+        if match := HASHED_FILENAME.match(filename):
+            return f"{match['name']}.js"
+        return filename
 
-    async def async_unregister(self, url: str = JS_URL) -> None:
+    async def async_unregister(self) -> None:
         """Unload lovelace module resource."""
         if not self.lovelace:
             return
             
         if self.lovelace.mode == "storage":
-            for module in JSMODULES:
-                module_url = f"{url}/{module.get('filename')}"
-                resources = [
-                    resource
-                    for resource in self.lovelace.resources.async_items()
-                    if str(resource["url"]).startswith(module_url)
-                ]
-                for resource in resources:
-                    await self.lovelace.resources.async_delete_item(resource.get("id"))
+            module_filenames = {module.get("filename") for module in JSMODULES}
+            resources = [
+                resource
+                for resource in self.lovelace.resources.async_items()
+                if str(resource["url"]).startswith((JS_URL, DIST_URL))
+                and self._get_resource_filename(str(resource["url"])) in module_filenames
+            ]
+            for resource in resources:
+                await self.lovelace.resources.async_delete_item(resource.get("id"))
 
     async def async_remove_gzip_files(self) -> None:
         """Remove cached gzip files."""
@@ -6,7 +6,8 @@ import logging
 from homeassistant.components import frontend, panel_custom
 from homeassistant.core import HomeAssistant
 
-from .const import DASHBOARD_ICON, DASHBOARD_TITLE, DASHBOARD_URL
+from .const import DASHBOARD_ICON, DASHBOARD_TITLE, DASHBOARD_URL, DOMAIN
+from .javascript import PANEL_FILENAME
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,7 +30,8 @@ async def async_register_panel(hass: HomeAssistant) -> None:
         return
     
     # Register the panel with panel_custom
-    # The JavaScript module is registered separately via javascript.py
+    # The static path of the JavaScript module is registered by javascript.py
+    js_registration = hass.data[DOMAIN]["js_registered"]
     try:
         await panel_custom.async_register_panel(
             hass=hass,
@@ -37,7 +39,9 @@ async def async_register_panel(hass: HomeAssistant) -> None:
             webcomponent_name="better-todo-panel",
             sidebar_title=DASHBOARD_TITLE,
             sidebar_icon=DASHBOARD_ICON,
-            module_url="/better_todo/www/better-todo-panel-component.js",
+            # Hashed build output next to the cards, so the browser loads
+            # better-todo-core.js once and caches the panel until it changes
+            module_url=js_registration.module_url(PANEL_FILENAME),
             embed_iframe=False,
             require_admin=False,
             config={},
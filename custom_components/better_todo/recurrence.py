@@ -0,0 +1,433 @@
+"""Recurrence engine for Better ToDo integration.
+
+When a recurring task is completed, the occurrence count is incremented and
+the next due date is computed from the recurrence settings. The task stays
+completed until that date is reached, then it is reopened with the new due
+date. Count and date end conditions stop the recurrence.
+
+An open task whose next occurrence date arrives has missed its current
+occurrence. Missed occurrences (including any that passed while Home
+Assistant was down) are skipped, or kept as one task each, depending on the
+list options, and the task moves on to the latest occurrence.
+
+Occurrences are computed in closed form from an anchor (a known occurrence
+date and its index), so monthly and yearly recurrences clamp to the end of
+short months without drifting: a task due on January 31st is due on February
+28th, then March 31st. Catching up on months of missed daily occurrences is
+a single computation.
+
+Occurrence dates are driven by ``RecurrenceScheduler``: one min-heap of
+pending dates shared by every list, with a single timer armed for the
+earliest one.
+
+``OccurrenceCache`` projects future occurrences into a date window for the
+get_occurrences service, reusing the dates of a task until its rule or
+anchor changes.
+"""
+from __future__ import annotations
+
+import calendar
+import heapq
+import logging
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_RECURRENCE_ANCHOR_DATE,
+    ATTR_RECURRENCE_ANCHOR_INDEX,
+    ATTR_RECURRENCE_CURRENT_COUNT,
+    ATTR_RECURRENCE_END_COUNT,
+    ATTR_RECURRENCE_END_DATE,
+    ATTR_RECURRENCE_END_ENABLED,
+    ATTR_RECURRENCE_END_TYPE,
+    ATTR_RECURRENCE_INTERVAL,
+    ATTR_RECURRENCE_UNIT,
+    DOMAIN,
+    RECURRENCE_END_TYPE_COUNT,
+    RECURRENCE_END_TYPE_DATE,
+    RECURRENCE_UNIT_DAYS,
+    RECURRENCE_UNIT_MONTHS,
+    RECURRENCE_UNIT_WEEKS,
+    RECURRENCE_UNIT_YEARS,
+)
+from .grouping import parse_due
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def add_interval(start: date, steps: int, interval: int, unit: str) -> date:
+    """Return the date steps intervals after start.
+
+    Months and years are clamped to the last day of shorter months.
+    """
+    if unit == RECURRENCE_UNIT_DAYS:
+        return start + timedelta(days=steps * interval)
+    if unit == RECURRENCE_UNIT_WEEKS:
+        return start + timedelta(weeks=steps * interval)
+
+    if unit not in (RECURRENCE_UNIT_MONTHS, RECURRENCE_UNIT_YEARS):
+        raise ValueError(f"Unknown recurrence unit: {unit}")
+
+    months = steps * interval * (12 if unit == RECURRENCE_UNIT_YEARS else 1)
+    year, month = divmod(start.year * 12 + start.month - 1 + months, 12)
+    month += 1
+    return date(year, month, min(start.day, calendar.monthrange(year, month)[1]))
+
+
+def steps_on_or_before(start: date, interval: int, unit: str, target: date) -> int:
+    """Return the largest number of intervals after start that is not after target.
+
+    Negative if target is before start.
+    """
+    if unit in (RECURRENCE_UNIT_DAYS, RECURRENCE_UNIT_WEEKS):
+        step = interval * (7 if unit == RECURRENCE_UNIT_WEEKS else 1)
+        return (target - start).days // step
+
+    step = interval * (12 if unit == RECURRENCE_UNIT_YEARS else 1)
+    months = (target.year - start.year) * 12 + target.month - start.month
+    steps = months // step
+    # Same month as target, but a later day of the month
+    if add_interval(start, steps, interval, unit) > target:
+        steps -= 1
+    return steps
+
+
+class _Rule:
+    """Recurrence settings of one task, as stored in its recurrence data."""
+
+    __slots__ = (
+        "anchor",
+        "anchor_index",
+        "count",
+        "end_count",
+        "end_date",
+        "interval",
+        "unit",
+    )
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Read the recurrence settings."""
+        self.anchor = parse_due(data.get(ATTR_RECURRENCE_ANCHOR_DATE))
+        self.anchor_index: int = data.get(ATTR_RECURRENCE_ANCHOR_INDEX) or 0
+        self.interval: int = data.get(ATTR_RECURRENCE_INTERVAL) or 1
+        self.unit: str = data.get(ATTR_RECURRENCE_UNIT) or RECURRENCE_UNIT_DAYS
+        self.count: int = data.get(ATTR_RECURRENCE_CURRENT_COUNT) or 0
+
+        self.end_count: int | None = None
+        self.end_date: date | None = None
+        if data.get(ATTR_RECURRENCE_END_ENABLED):
+            end_type = data.get(ATTR_RECURRENCE_END_TYPE)
+            if end_type == RECURRENCE_END_TYPE_COUNT:
+                self.end_count = data.get(ATTR_RECURRENCE_END_COUNT) or None
+            elif end_type == RECURRENCE_END_TYPE_DATE:
+                self.end_date = parse_due(data.get(ATTR_RECURRENCE_END_DATE))
+
+    @property
+    def signature(self) -> tuple[Any, ...]:
+        """Return the settings occurrence dates depend on (not the count)."""
+        return (
+            self.anchor,
+            self.anchor_index,
+            self.interval,
+            self.unit,
+            self.end_count,
+            self.end_date,
+        )
+
+    def first_index_on_or_after(self, target: date) -> int:
+        """Return the index of the first occurrence on or after target."""
+        assert self.anchor is not None
+        return self.anchor_index + 1 + steps_on_or_before(
+            self.anchor, self.interval, self.unit, target - timedelta(days=1)
+        )
+
+    def date_of(self, index: int) -> date:
+        """Return the date of an occurrence, ignoring end conditions."""
+        assert self.anchor is not None
+        return add_interval(self.anchor, index - self.anchor_index, self.interval, self.unit)
+
+    def last_index_on_or_before(self, target: date) -> int:
+        """Return the index of the last occurrence on or before target."""
+        assert self.anchor is not None
+        index = self.anchor_index + steps_on_or_before(self.anchor, self.interval, self.unit, target)
+        if self.end_count is not None:
+            index = min(index, self.end_count - 1)
+        if self.end_date is not None:
+            index = min(
+                index,
+                self.anchor_index
+                + steps_on_or_before(self.anchor, self.interval, self.unit, self.end_date),
+            )
+        return index
+
+    def is_valid(self, index: int) -> bool:
+        """Return True if an occurrence is within the end conditions."""
+        if self.end_count is not None and index >= self.end_count:
+            return False
+        return self.end_date is None or self.date_of(index) <= self.end_date
+
+
+def occurrence(data: dict[str, Any], index: int) -> date | None:
+    """Return the due date of an occurrence.
+
+    Returns None if the recurrence has no anchor or the occurrence is past
+    the end condition.
+    """
+    rule = _Rule(data)
+    if rule.anchor is None or not rule.is_valid(index):
+        return None
+    return rule.date_of(index)
+
+
+def next_occurrence(data: dict[str, Any]) -> date | None:
+    """Return the due date of the occurrence after the completed ones."""
+    return occurrence(data, data.get(ATTR_RECURRENCE_CURRENT_COUNT) or 0)
+
+
+def occurrence_dates(data: dict[str, Any], start: int, stop: int) -> list[date]:
+    """Return the due dates of occurrences start to stop (excluded)."""
+    rule = _Rule(data)
+    if rule.anchor is None:
+        return []
+    return [rule.date_of(index) for index in range(start, stop)]
+
+
+def latest_reached(data: dict[str, Any], today: date) -> int | None:
+    """Return the index of the latest occurrence reached by today.
+
+    Occurrences from the current count up to the latest one on or before
+    today (within the end conditions) have been reached, and the ones before
+    the latest were missed. Returns None if the current occurrence has not
+    been reached yet.
+    """
+    rule = _Rule(data)
+    if rule.anchor is None or not rule.is_valid(rule.count):
+        return None
+    latest = rule.last_index_on_or_before(today)
+    return latest if latest >= rule.count else None
+
+
+class _Expansion:
+    """Consecutive occurrence dates of one task, from base_index on."""
+
+    __slots__ = ("base_index", "dates", "signature")
+
+    def __init__(self, signature: tuple[Any, ...], base_index: int) -> None:
+        """Initialize an empty expansion."""
+        self.signature = signature
+        self.base_index = base_index
+        self.dates: list[date] = []
+
+
+class OccurrenceCache:
+    """Projected occurrence dates per task.
+
+    Dates are computed in one batch for the index range a window needs and
+    kept until the rule or anchor of the task changes. A later window only
+    computes the dates it adds at the end.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._expansions: dict[str, _Expansion] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def discard(self, uid: str) -> None:
+        """Forget the dates of a task."""
+        self._expansions.pop(uid, None)
+
+    def occurrences(self, uid: str, data: dict[str, Any], start: date, end: date) -> list[date]:
+        """Return the upcoming occurrences of a task between start and end.
+
+        Upcoming occurrences start at the current count: the open occurrence
+        of an open task, or the next due date of a completed one.
+        """
+        rule = _Rule(data)
+        if rule.anchor is None or end < start:
+            return []
+        first = max(rule.count, rule.first_index_on_or_after(start))
+        last = rule.last_index_on_or_before(end)
+        if last < first:
+            return []
+
+        expansion = self._expansions.get(uid)
+        if (
+            expansion is None
+            or expansion.signature != rule.signature
+            or first < expansion.base_index
+        ):
+            expansion = self._expansions[uid] = _Expansion(rule.signature, first)
+        cached_until = expansion.base_index + len(expansion.dates)
+        if cached_until <= last:
+            self.misses += 1
+            expansion.dates.extend(
+                rule.date_of(index) for index in range(cached_until, last + 1)
+            )
+        else:
+            self.hits += 1
+        return expansion.dates[first - expansion.base_index : last - expansion.base_index + 1]
+
+
+OccurrencesDueCallback = Callable[[list[str]], None]
+
+
+class RecurrenceScheduler:
+    """Min-heap of pending occurrences shared by every list.
+
+    Heap entries are (date ordinal, entry_id, uid). Rescheduled or cancelled
+    occurrences are left in the heap and skipped when popped, and the heap is
+    rebuilt once stale entries outnumber live ones. A single timer is armed
+    at local midnight of the earliest date.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._heap: list[tuple[int, str, str]] = []
+        self._scheduled: dict[str, dict[str, int]] = {}
+        self._callbacks: dict[str, OccurrencesDueCallback] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._timer_ordinal: int | None = None
+        self._unsub_config: CALLBACK_TYPE | None = None
+
+    @property
+    def scheduled_count(self) -> int:
+        """Return the number of pending occurrences."""
+        return sum(len(uids) for uids in self._scheduled.values())
+
+    @callback
+    def async_register(self, entry_id: str, occurrences_due: OccurrencesDueCallback) -> CALLBACK_TYPE:
+        """Register a list, called with the uids of its tasks that are due."""
+        if not self._callbacks:
+            # Timer instants depend on the time zone
+            self._unsub_config = self._hass.bus.async_listen(
+                EVENT_CORE_CONFIG_UPDATE, self._async_config_updated
+            )
+        self._callbacks[entry_id] = occurrences_due
+        self._scheduled.setdefault(entry_id, {})
+
+        @callback
+        def _unregister() -> None:
+            self._callbacks.pop(entry_id, None)
+            self._scheduled.pop(entry_id, None)
+            if not self._callbacks:
+                self._async_stop()
+
+        return _unregister
+
+    @callback
+    def async_schedule(self, entry_id: str, occurrences: Iterable[tuple[str, date]]) -> None:
+        """Schedule tasks to be reported as due on the given dates."""
+        scheduled = self._scheduled.setdefault(entry_id, {})
+        for uid, due in occurrences:
+            ordinal = due.toordinal()
+            scheduled[uid] = ordinal
+            heapq.heappush(self._heap, (ordinal, entry_id, uid))
+        self._async_compact()
+        self._async_arm()
+
+    @callback
+    def async_unschedule(self, entry_id: str, uids: Iterable[str]) -> None:
+        """Cancel pending occurrences, their heap entries go stale."""
+        scheduled = self._scheduled.get(entry_id)
+        if scheduled:
+            for uid in uids:
+                scheduled.pop(uid, None)
+
+    def _is_live(self, entry: tuple[int, str, str]) -> bool:
+        """Return True if a heap entry has not been cancelled or rescheduled."""
+        ordinal, entry_id, uid = entry
+        return self._scheduled.get(entry_id, {}).get(uid) == ordinal
+
+    @callback
+    def _async_compact(self) -> None:
+        """Rebuild the heap when it is mostly stale entries."""
+        live = self.scheduled_count
+        if len(self._heap) <= 2 * live + 64:
+            return
+        self._heap = [
+            (ordinal, entry_id, uid)
+            for entry_id, scheduled in self._scheduled.items()
+            for uid, ordinal in scheduled.items()
+        ]
+        heapq.heapify(self._heap)
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the timer for the earliest live occurrence."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        ordinal = self._heap[0][0] if self._heap else None
+        if ordinal == self._timer_ordinal and self._unsub_timer is not None:
+            return
+
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._timer_ordinal = ordinal
+        if ordinal is None:
+            return
+        self._unsub_timer = async_track_point_in_time(
+            self._hass,
+            self._async_fire,
+            dt_util.start_of_local_day(date.fromordinal(ordinal)),
+        )
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Report every occurrence due today or earlier to its list."""
+        self._unsub_timer = None
+        self._timer_ordinal = None
+        today = dt_util.now().date().toordinal()
+
+        due: dict[str, list[str]] = {}
+        while self._heap and self._heap[0][0] <= today:
+            entry = heapq.heappop(self._heap)
+            if not self._is_live(entry):
+                continue
+            _, entry_id, uid = entry
+            del self._scheduled[entry_id][uid]
+            due.setdefault(entry_id, []).append(uid)
+
+        for entry_id, uids in due.items():
+            _LOGGER.debug("%d recurring task(s) due in %s", len(uids), entry_id)
+            self._callbacks[entry_id](uids)
+        self._async_arm()
+
+    @callback
+    def _async_config_updated(self, event: Event) -> None:
+        """Re-arm the timer, local midnight moves with the time zone."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._timer_ordinal = None
+        self._async_arm()
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop the timer once no list is registered."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._unsub_config is not None:
+            self._unsub_config()
+            self._unsub_config = None
+        self._timer_ordinal = None
+        self._heap = []
+
+
+@callback
+def async_get_recurrence_scheduler(hass: HomeAssistant) -> RecurrenceScheduler:
+    """Return the recurrence scheduler shared by every list."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    scheduler: RecurrenceScheduler | None = domain_data.get("recurrence_scheduler")
+    if scheduler is None:
+        scheduler = domain_data["recurrence_scheduler"] = RecurrenceScheduler(hass)
+    return scheduler
@@ -0,0 +1,172 @@
+"""Runtime data and list lookup for Better ToDo integration.
+
+Each config entry keeps a ``BetterTodoData`` in ``entry.runtime_data`` with
+direct references to its list entity and its recurrence helper entities, so
+services never rebuild entity ids from the list name.
+
+``ListRegistry`` is shared by every list and finds a list by entity_id or by
+config entry in constant time. Lists register themselves when they are added
+to Home Assistant, and the registry follows entity id changes made in the
+entity registry, so a renamed list (or one that got a ``_2`` suffix) is still
+found under its current entity_id. It also keeps the list catalog (entity_id,
+name and active task count of every list) that the panel and dashboard card
+subscribe to, and only announces a list when its catalog entry changes.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DOMAIN, SIGNAL_LISTS_UPDATED
+
+if TYPE_CHECKING:
+    from .number import RecurrenceEndCountNumber, RecurrenceIntervalNumber
+    from .select import RecurrenceEndTypeSelect, RecurrenceUnitSelect
+    from .text import RecurrenceEndDateText, TaskUIDText
+    from .todo import BetterTodoEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class BetterTodoData:
+    """Entities of one Better ToDo list, stored in entry.runtime_data."""
+
+    entity: BetterTodoEntity | None = None
+    task_uid: TaskUIDText | None = None
+    recurrence_interval: RecurrenceIntervalNumber | None = None
+    recurrence_unit: RecurrenceUnitSelect | None = None
+    recurrence_end_type: RecurrenceEndTypeSelect | None = None
+    recurrence_end_count: RecurrenceEndCountNumber | None = None
+    recurrence_end_date: RecurrenceEndDateText | None = None
+
+
+BetterTodoConfigEntry: TypeAlias = ConfigEntry[BetterTodoData]
+
+
+class ListRegistry:
+    """Finds Better ToDo lists by entity_id or config entry.
+
+    The entity registry listener only runs while lists are registered.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self._hass = hass
+        self._by_entity_id: dict[str, BetterTodoEntity] = {}
+        self._by_entry_id: dict[str, BetterTodoEntity] = {}
+        # Last announced catalog entry of each list, by config entry
+        self._catalog: dict[str, dict[str, Any]] = {}
+        self._unsub_registry: CALLBACK_TYPE | None = None
+
+    def __len__(self) -> int:
+        """Return the number of registered lists."""
+        return len(self._by_entry_id)
+
+    def __iter__(self) -> Iterator[BetterTodoEntity]:
+        """Iterate over the registered lists."""
+        return iter(list(self._by_entry_id.values()))
+
+    def get(self, entity_id: str) -> BetterTodoEntity | None:
+        """Return the list with an entity_id, None if there is none."""
+        return self._by_entity_id.get(entity_id)
+
+    def get_by_entry(self, entry_id: str) -> BetterTodoEntity | None:
+        """Return the list of a config entry, None if it is not loaded."""
+        return self._by_entry_id.get(entry_id)
+
+    def catalog(self) -> list[dict[str, Any]]:
+        """Return the catalog entries of the lists, sorted by entity_id."""
+        return sorted(self._catalog.values(), key=lambda entry: entry["entity_id"])
+
+    @callback
+    def async_update_catalog(self, entity: BetterTodoEntity) -> None:
+        """Announce a list's catalog entry if it was added or changed."""
+        entry_id = entity.entry_id
+        if self._by_entry_id.get(entry_id) is not entity:
+            return
+        entry = entity.catalog_entry
+        previous = self._catalog.get(entry_id)
+        if entry == previous:
+            return
+        self._catalog[entry_id] = entry
+        if previous is None:
+            change = {"type": "add", "list": entry}
+        else:
+            change = {"type": "update", "entity_id": previous["entity_id"], "list": entry}
+        async_dispatcher_send(self._hass, SIGNAL_LISTS_UPDATED, change)
+
+    @callback
+    def async_register(self, entity: BetterTodoEntity) -> CALLBACK_TYPE:
+        """Register a list under its current entity_id."""
+        entry_id = entity.entry_id
+        previous = self._by_entry_id.get(entry_id)
+        if previous is not None:
+            self._by_entity_id.pop(previous.entity_id, None)
+        if not self._by_entry_id:
+            self._unsub_registry = self._hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                self._async_registry_updated,
+                event_filter=self._async_filter_registry_updated,
+            )
+        self._by_entry_id[entry_id] = entity
+        self._by_entity_id[entity.entity_id] = entity
+
+        @callback
+        def _unregister() -> None:
+            if self._by_entry_id.get(entry_id) is not entity:
+                return
+            del self._by_entry_id[entry_id]
+            if (entry := self._catalog.pop(entry_id, None)) is not None:
+                async_dispatcher_send(
+                    self._hass,
+                    SIGNAL_LISTS_UPDATED,
+                    {"type": "remove", "entity_id": entry["entity_id"]},
+                )
+            self._by_entity_id = {
+                entity_id: registered
+                for entity_id, registered in self._by_entity_id.items()
+                if registered is not entity
+            }
+            if not self._by_entry_id and self._unsub_registry is not None:
+                self._unsub_registry()
+                self._unsub_registry = None
+
+        return _unregister
+
+    @callback
+    def _async_filter_registry_updated(self, event_data: Any) -> bool:
+        """Only handle entity id changes of registered lists."""
+        return (
+            event_data["action"] == "update"
+            and "old_entity_id" in event_data
+            and event_data["old_entity_id"] in self._by_entity_id
+        )
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Move a renamed list to its new entity_id."""
+        old_entity_id = event.data["old_entity_id"]
+        entity_id = event.data["entity_id"]
+        entity = self._by_entity_id.pop(old_entity_id, None)
+        if entity is None:
+            return
+        self._by_entity_id[entity_id] = entity
+        _LOGGER.debug("List %s renamed to %s", old_entity_id, entity_id)
+
+
+@callback
+def async_get_list_registry(hass: HomeAssistant) -> ListRegistry:
+    """Return the list registry shared by every list."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    registry: ListRegistry | None = domain_data.get("list_registry")
+    if registry is None:
+        registry = domain_data["list_registry"] = ListRegistry(hass)
+    return registry
@@ -9,19 +9,19 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
+from .runtime import BetterTodoConfigEntry
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: BetterTodoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Better ToDo select platform."""
-    entities = [
-        RecurrenceUnitSelect(entry),
-        RecurrenceEndTypeSelect(entry),
-    ]
-    async_add_entities(entities, True)
+    runtime_data = entry.runtime_data
+    runtime_data.recurrence_unit = RecurrenceUnitSelect(entry)
+    runtime_data.recurrence_end_type = RecurrenceEndTypeSelect(entry)
+    async_add_entities([runtime_data.recurrence_unit, runtime_data.recurrence_end_type], True)
 
 
 class RecurrenceUnitSelect(SelectEntity):
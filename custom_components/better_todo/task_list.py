@@ -0,0 +1,221 @@
+"""Ordered task container for Better ToDo integration.
+
+Tasks keep a user-defined order (tasks can be moved after one another), and
+are looked up by uid from every service call. ``TaskList`` stores them in a
+doubly linked list with a uid index, so lookup, replacement, removal and
+moving a task after another one are all O(1).
+
+Each task also carries a rank that increases along the list, so other
+structures (like the group buckets) can order tasks by list position without
+walking the list. A moved task gets the midpoint of its neighbours' ranks.
+When many moves into the same gap use up the float precision, only a window
+of tasks around the move is renumbered, never the whole list.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Generic, Protocol, TypeVar
+
+
+class _HasUid(Protocol):
+    """Anything stored in a TaskList."""
+
+    @property
+    def uid(self) -> str | None:
+        """Return the unique id of the task."""
+
+
+_T = TypeVar("_T", bound=_HasUid)
+
+# Smallest rank gap left between tasks of a renumbered window, about 50 moves
+# into the same gap fit before it has to be renumbered again
+_MIN_GAP = 0.5
+
+
+class _Node(Generic[_T]):
+    """A linked list node holding one task."""
+
+    __slots__ = ("item", "next", "prev", "rank")
+
+    def __init__(self, item: _T | None, rank: float = 0.0) -> None:
+        """Initialize the node."""
+        self.item = item
+        self.rank = rank
+        self.prev: _Node[_T] = self
+        self.next: _Node[_T] = self
+
+
+class TaskList(Generic[_T]):
+    """Ordered collection of tasks indexed by uid."""
+
+    def __init__(self, items: Iterable[_T] = ()) -> None:
+        """Initialize the task list with items in order."""
+        # Sentinel node: head.next is the first task, head.prev the last one
+        self._head: _Node[_T] = _Node(None)
+        self._index: dict[str, _Node[_T]] = {}
+        # Uids of tasks whose rank was reassigned, so cached ranks can be updated
+        self._renumbered: list[str] = []
+        for item in items:
+            self.append(item)
+
+    def __len__(self) -> int:
+        """Return the number of tasks."""
+        return len(self._index)
+
+    def __bool__(self) -> bool:
+        """Return True if the list has tasks."""
+        return bool(self._index)
+
+    def __contains__(self, uid: object) -> bool:
+        """Return True if a task with this uid exists."""
+        return uid in self._index
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate over tasks in list order."""
+        node = self._head.next
+        while node is not self._head:
+            yield node.item  # type: ignore[misc]
+            node = node.next
+
+    def get(self, uid: str) -> _T | None:
+        """Return the task with this uid, if any."""
+        node = self._index.get(uid)
+        return node.item if node is not None else None
+
+    def rank(self, uid: str) -> float:
+        """Return the position rank of a task, increasing along the list."""
+        return self._index[uid].rank
+
+    def pop_renumbered(self) -> list[str]:
+        """Return the uids of tasks renumbered since the last call.
+
+        Moving a task can reassign the ranks of tasks next to it; the moved
+        task itself is only listed if it was part of such a window.
+        """
+        renumbered, self._renumbered = self._renumbered, []
+        return renumbered
+
+    def previous_uid(self, uid: str) -> str | None:
+        """Return the uid of the task before this one, None if it is first."""
+        node = self._index[uid]
+        if node.prev is self._head:
+            return None
+        return node.prev.item.uid  # type: ignore[union-attr]
+
+    def _link_after(self, node: _Node[_T], anchor: _Node[_T]) -> None:
+        """Link a node right after the anchor node."""
+        node.prev = anchor
+        node.next = anchor.next
+        anchor.next.prev = node
+        anchor.next = node
+
+    @staticmethod
+    def _unlink(node: _Node[_T]) -> None:
+        """Unlink a node from its neighbours."""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+    def append(self, item: _T) -> None:
+        """Add a task at the end of the list."""
+        if item.uid is None:
+            raise ValueError("Tasks need a uid to be stored in a TaskList")
+        if item.uid in self._index:
+            raise ValueError(f"Task {item.uid} is already in the list")
+        tail = self._head.prev
+        node = _Node(item, tail.rank + 1 if tail is not self._head else 1.0)
+        self._link_after(node, self._head.prev)
+        self._index[item.uid] = node
+
+    def replace(self, item: _T) -> bool:
+        """Replace the task with the same uid, keeping its position."""
+        node = self._index.get(item.uid)  # type: ignore[arg-type]
+        if node is None:
+            return False
+        node.item = item
+        return True
+
+    def remove(self, uid: str) -> _T | None:
+        """Remove and return the task with this uid, if any."""
+        node = self._index.pop(uid, None)
+        if node is None:
+            return None
+        self._unlink(node)
+        return node.item
+
+    def move(self, uid: str, previous_uid: str | None = None) -> bool:
+        """Move a task after another one.
+
+        With no previous_uid the task moves to the beginning. If previous_uid
+        is unknown the task moves to the end.
+        """
+        node = self._index.get(uid)
+        if node is None:
+            return False
+        self._unlink(node)
+        if previous_uid is None:
+            anchor = self._head
+        else:
+            anchor = self._index.get(previous_uid, self._head.prev)
+            if anchor is node:
+                anchor = node.prev
+        self._link_after(node, anchor)
+        self._rank_between(node)
+        return True
+
+    def _rank_between(self, node: _Node[_T]) -> None:
+        """Give a node a rank between its neighbours."""
+        prev_node, next_node = node.prev, node.next
+        if prev_node is self._head and next_node is self._head:
+            node.rank = 1.0
+        elif prev_node is self._head:
+            node.rank = next_node.rank - 1
+        elif next_node is self._head:
+            node.rank = prev_node.rank + 1
+        else:
+            node.rank = (prev_node.rank + next_node.rank) / 2
+            if not prev_node.rank < node.rank < next_node.rank:
+                # Out of float precision after many moves into the same gap
+                self._renumber_around(node)
+
+    def _renumber_around(self, node: _Node[_T]) -> None:
+        """Spread ranks evenly over the smallest window of tasks around a node.
+
+        The window grows on both sides until the ranks of the tasks just
+        outside it leave at least _MIN_GAP per task. At either end of the list
+        the ranks are unbounded, so a window reaching it always fits.
+        """
+        first = last = node
+        count = 1
+        while True:
+            low, high = first.prev, last.next
+            if low is self._head and high is self._head:
+                start, gap = 0.0, 1.0
+            elif low is self._head:
+                start, gap = high.rank - count - 1, 1.0
+            elif high is self._head:
+                start, gap = low.rank, 1.0
+            else:
+                start, gap = low.rank, (high.rank - low.rank) / (count + 1)
+                if gap < _MIN_GAP:
+                    # Double the window, as far as the list allows
+                    for _ in range(max(count // 2, 1)):
+                        if first.prev is not self._head:
+                            first = first.prev
+                            count += 1
+                        if last.next is not self._head:
+                            last = last.next
+                            count += 1
+                    continue
+            break
+
+        current = first
+        for position in range(1, count + 1):
+            current.rank = start + gap * position
+            self._renumbered.append(current.item.uid)  # type: ignore[union-attr, arg-type]
+            current = current.next
+
+    def clear(self) -> None:
+        """Remove every task."""
+        self._head.next = self._head.prev = self._head
+        self._index.clear()
+        self._renumbered.clear()
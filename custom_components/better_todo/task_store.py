@@ -0,0 +1,248 @@
+"""Journaled task storage for Better ToDo integration.
+
+Task lists are persisted as a snapshot (a regular Home Assistant ``Store``)
+plus an append-only journal of small change records. Each change costs bytes
+proportional to the change instead of a full rewrite of the list. The journal
+is replayed on top of the snapshot when loading and is compacted into a new
+snapshot once it grows past a size or record-count threshold.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import storage
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN, JOURNAL_MAX_BYTES, JOURNAL_MAX_RECORDS
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Journal operations
+OP_CREATE = "create"
+OP_UPDATE = "update"
+OP_DELETE = "delete"
+OP_MOVE = "move"
+OP_RECURRENCE = "recurrence"
+
+
+def _replay(data: dict[str, Any], records: list[dict[str, Any]]) -> None:
+    """Apply journal records to a snapshot payload in place."""
+    items: dict[str, dict[str, Any]] = {}
+    for idx, item in enumerate(data.get("items", [])):
+        items[item.get("uid") or f"__legacy_{idx}"] = item
+    recurrence_data: dict[str, Any] = data.setdefault("recurrence_data", {})
+
+    for record in records:
+        op = record.get("op")
+        if op in (OP_CREATE, OP_UPDATE):
+            item = record["item"]
+            items[item["uid"]] = item
+        elif op == OP_DELETE:
+            for uid in record["uids"]:
+                items.pop(uid, None)
+                recurrence_data.pop(uid, None)
+        elif op == OP_MOVE:
+            uid = record["uid"]
+            moved = items.pop(uid, None)
+            if moved is None:
+                continue
+            previous_uid = record.get("previous_uid")
+            ordered = list(items.items())
+            if previous_uid is None:
+                position = 0
+            else:
+                position = next(
+                    (idx + 1 for idx, (key, _) in enumerate(ordered) if key == previous_uid),
+                    len(ordered),
+                )
+            ordered.insert(position, (uid, moved))
+            items = dict(ordered)
+        elif op == OP_RECURRENCE:
+            if record.get("data") is None:
+                recurrence_data.pop(record["uid"], None)
+            else:
+                recurrence_data[record["uid"]] = record["data"]
+        else:
+            _LOGGER.warning("Skipping unknown journal record: %s", record)
+
+    data["items"] = list(items.values())
+
+
+class TaskStore:
+    """Snapshot plus append-only journal storage for one task list.
+
+    Records are buffered in memory and appended to the journal after a
+    coalescing delay, so a burst of changes results in a single write.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        save_delay: float,
+        snapshot_func: Callable[[], dict[str, Any]],
+    ) -> None:
+        """Initialize the task store.
+
+        Args:
+            hass: Home Assistant instance
+            entry_id: Config entry the task list belongs to
+            save_delay: Seconds to coalesce records before writing them
+            snapshot_func: Returns the full list payload used for compaction
+        """
+        self._hass = hass
+        self._save_delay = save_delay
+        self._snapshot_func = snapshot_func
+        self._snapshot = storage.Store[dict[str, Any]](
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.tasks"
+        )
+        self._journal_path = Path(hass.config.path(storage.STORAGE_DIR, f"{DOMAIN}.{entry_id}.journal"))
+        self._io_lock = asyncio.Lock()
+        self._buffer: list[str] = []
+        self._seq = 0
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+        # Statistics
+        self._journal_records = 0
+        self._journal_bytes = 0
+        self._writes = 0
+        self._writes_saved = 0
+        self._compactions = 0
+
+    @property
+    def dirty(self) -> bool:
+        """Return True if records are waiting to be written."""
+        return bool(self._buffer)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return storage statistics."""
+        return {
+            "save_delay": self._save_delay,
+            "dirty": self.dirty,
+            "pending_records": len(self._buffer),
+            "journal_records": self._journal_records,
+            "journal_bytes": self._journal_bytes,
+            "writes": self._writes,
+            "writes_saved": self._writes_saved,
+            "compactions": self._compactions,
+        }
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the snapshot and replay the journal on top of it."""
+        data = await self._snapshot.async_load()
+        lines = await self._hass.async_add_executor_job(self._read_journal)
+        if data is None and not lines:
+            return None
+
+        data = data or {"items": [], "recurrence_data": {}}
+        snapshot_seq = data.pop("journal_seq", 0)
+        self._seq = snapshot_seq
+
+        records: list[dict[str, Any]] = []
+        for line in lines:
+            try:
+                record = json_loads(line)
+            except ValueError:
+                # A torn final line from an interrupted write, nothing to replay
+                _LOGGER.warning("Skipping corrupt journal record in %s", self._journal_path.name)
+                continue
+            if not isinstance(record, dict) or (seq := record.get("seq", 0)) <= snapshot_seq:
+                continue
+            records.append(record)
+            self._seq = max(self._seq, seq)
+
+        self._journal_records = len(lines)
+        self._journal_bytes = sum(len(line) + 1 for line in lines)
+
+        if records:
+            _replay(data, records)
+            _LOGGER.debug(
+                "Replayed %d journal records for %s", len(records), self._journal_path.name
+            )
+        return data
+
+    def _read_journal(self) -> list[str]:
+        """Read journal lines from disk."""
+        try:
+            with self._journal_path.open(encoding="utf-8") as journal:
+                return [line for line in journal.read().splitlines() if line]
+        except FileNotFoundError:
+            return []
+
+    @callback
+    def async_append(self, op: str, **payload: Any) -> None:
+        """Queue a change record for the journal."""
+        self._seq += 1
+        record = {"seq": self._seq, "op": op, **payload}
+        self._buffer.append(json_dumps(record))
+
+        if self._unsub_flush is not None:
+            self._writes_saved += 1
+            return
+
+        @callback
+        def _schedule_flush(_now: Any) -> None:
+            self._unsub_flush = None
+            self._hass.async_create_task(self.async_flush())
+
+        self._unsub_flush = async_call_later(self._hass, self._save_delay, _schedule_flush)
+
+    async def async_flush(self) -> None:
+        """Append buffered records to the journal, compacting when it is too large."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        async with self._io_lock:
+            if not self._buffer:
+                return
+            lines, self._buffer = self._buffer, []
+            await self._hass.async_add_executor_job(self._append_journal, lines)
+            self._writes += 1
+            self._journal_records += len(lines)
+            self._journal_bytes += sum(len(line) + 1 for line in lines)
+
+            if (
+                self._journal_records >= JOURNAL_MAX_RECORDS
+                or self._journal_bytes >= JOURNAL_MAX_BYTES
+            ):
+                await self._async_compact()
+
+    def _append_journal(self, lines: list[str]) -> None:
+        """Append lines to the journal file."""
+        self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._journal_path.open("a", encoding="utf-8") as journal:
+            journal.write("\n".join(lines) + "\n")
+
+    async def async_compact(self) -> None:
+        """Write a fresh snapshot and truncate the journal."""
+        async with self._io_lock:
+            await self._async_compact()
+
+    async def _async_compact(self) -> None:
+        """Write a fresh snapshot and truncate the journal (lock held)."""
+        # The snapshot covers every record queued so far
+        self._buffer = []
+        data = self._snapshot_func()
+        data["journal_seq"] = self._seq
+        await self._snapshot.async_save(data)
+        await self._hass.async_add_executor_job(self._truncate_journal)
+        self._writes += 1
+        self._compactions += 1
+        self._journal_records = 0
+        self._journal_bytes = 0
+        _LOGGER.debug("Compacted %s into a new snapshot", self._journal_path.name)
+
+    def _truncate_journal(self) -> None:
+        """Remove the journal file."""
+        self._journal_path.unlink(missing_ok=True)
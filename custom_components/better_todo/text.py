@@ -9,19 +9,19 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
+from .runtime import BetterTodoConfigEntry
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: BetterTodoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Better ToDo text platform."""
-    entities = [
-        TaskUIDText(entry),
-        RecurrenceEndDateText(entry),
-    ]
-    async_add_entities(entities, True)
+    runtime_data = entry.runtime_data
+    runtime_data.task_uid = TaskUIDText(entry)
+    runtime_data.recurrence_end_date = RecurrenceEndDateText(entry)
+    async_add_entities([runtime_data.task_uid, runtime_data.recurrence_end_date], True)
 
 
 class TaskUIDText(TextEntity):
@@ -2,23 +2,28 @@
 from __future__ import annotations
 
 import logging
+import time
 import uuid
-from dataclasses import asdict, replace
-from datetime import datetime, timedelta
+from dataclasses import asdict, dataclass, field, replace
+from datetime import date
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.todo import TodoItem, TodoItemStatus
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_FRIENDLY_NAME, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers import storage
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util import dt as dt_util
 
 if TYPE_CHECKING:
     pass
 
 from .const import (
+    ATTR_RECURRENCE_ANCHOR_DATE,
+    ATTR_RECURRENCE_ANCHOR_INDEX,
     ATTR_RECURRENCE_CURRENT_COUNT,
     ATTR_RECURRENCE_ENABLED,
     ATTR_RECURRENCE_END_COUNT,
@@ -26,32 +31,88 @@ from .const import (
     ATTR_RECURRENCE_END_ENABLED,
     ATTR_RECURRENCE_END_TYPE,
     ATTR_RECURRENCE_INTERVAL,
+    ATTR_RECURRENCE_NEXT_DUE,
     ATTR_RECURRENCE_UNIT,
+    BATCH_OP_CREATE,
+    BATCH_OP_DELETE,
+    BATCH_OP_MOVE,
+    BATCH_OP_SET_RECURRENCE,
+    BATCH_OP_UPDATE,
+    CONF_EXPOSE_ITEMS,
+    CONF_MISSED_OCCURRENCES,
+    CONF_SAVE_DELAY,
+    CONF_STATE_WRITE_INTERVAL,
+    DEFAULT_EXPOSE_ITEMS,
+    DEFAULT_MISSED_OCCURRENCES,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_STATE_WRITE_INTERVAL,
     DOMAIN,
     ENTITY_DOMAIN,
-    GROUP_FORTHCOMING,
-    GROUP_NO_DUE_DATE,
-    GROUP_THIS_WEEK,
+    MISSED_OCCURRENCES_CREATE,
     RECURRENCE_UNIT_DAYS,
+    SIGNAL_ITEMS_UPDATED,
+    SORT_DUE,
+    SORT_POSITION,
+    SORT_SUMMARY,
 )
+from .grouping import (
+    TaskGroups,
+    async_get_week_scheduler,
+    parse_due,
+    week_start_day,
+    week_window,
+)
+from .recurrence import (
+    OccurrenceCache,
+    RecurrenceScheduler,
+    async_get_recurrence_scheduler,
+    latest_reached,
+    next_occurrence,
+    occurrence,
+    occurrence_dates,
+)
+from .runtime import (
+    BetterTodoConfigEntry,
+    BetterTodoData,
+    async_get_list_registry,
+)
+from .task_list import TaskList
+from .task_store import OP_CREATE, OP_DELETE, OP_MOVE, OP_RECURRENCE, OP_UPDATE, TaskStore
+from .view import grouped_view, is_header_summary
 
 _LOGGER = logging.getLogger(__name__)
 
-# Header prefixes for group identification (used for backward compatibility with standard todo-list card)
-# These are removed when using the custom better-todo-card
-HEADER_PREFIX = "--- "
-HEADER_SUFFIX = " ---"
-
-STORAGE_VERSION = 1
-
 # Task status constants (using core TodoItemStatus)
 STATUS_NEEDS_ACTION = TodoItemStatus.NEEDS_ACTION
 STATUS_COMPLETED = TodoItemStatus.COMPLETED
 
 
+@dataclass
+class _Batch:
+    """Operations of a batch that is being applied."""
+
+    refs: dict[str, str] = field(default_factory=dict)
+    results: list[dict[str, Any]] = field(default_factory=list)
+    # (uid, item, previous_uid, recurrence data) before each operation
+    undo: list[tuple[str, TodoItem | None, str | None, dict[str, Any] | None]] = field(
+        default_factory=list
+    )
+    records: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    changes: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _patched(
+    item: TodoItem, changes: dict[str, Any], exclude: tuple[str, ...] = ("uid",)
+) -> TodoItem:
+    """Return a copy of a task with the changed fields replaced."""
+    return replace(item, **{
+        key: value for key, value in changes.items() if key not in exclude
+    })
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: BetterTodoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Better ToDo entity."""
@@ -59,15 +120,9 @@ async def async_setup_entry(
     entity = BetterTodoEntity(hass, entry)
     await entity.async_load_data()
     async_add_entities([entity], True)
-    
-    # Store entity reference for service access
-    # Store using entry_id to ensure reliable lookup regardless of entity_id collisions
-    if entry.entry_id in hass.data[DOMAIN]:
-        hass.data[DOMAIN][entry.entry_id]["entity"] = entity
-        # Also store in entities dict by entity_id for backward compatibility with services
-        # Note: entity_id might get a suffix (_2, _3, etc.) if there are collisions
-        hass.data[DOMAIN][entry.entry_id]["entities"][entity.entity_id] = entity
-        _LOGGER.debug("Stored entity reference for entry %s with entity_id %s", entry.entry_id, entity.entity_id)
+
+    # Direct reference for services and diagnostics of this entry
+    entry.runtime_data.entity = entity
 
 
 class BetterTodoEntity(Entity):
@@ -76,28 +131,66 @@ class BetterTodoEntity(Entity):
     This entity inherits from Entity (not TodoListEntity) to prevent Better ToDo
     tasks from appearing in Home Assistant's native "To-do lists" dashboard.
     All functionality is provided through the custom Better ToDo panel.
+
+    Changes to the tasks (service calls, batches and the recurrence and week
+    timers) run on the event loop and never await between reading and
+    writing the task list, storage being write-behind, so they cannot
+    interleave and need no lock.
     """
 
     _attr_has_entity_name = True
     _attr_name = None  # Will use the device name
     _attr_icon = "mdi:format-list-checks"
+    # The full task list is only useful in the live state, history keeps the summary
+    _unrecorded_attributes = frozenset({"items", "todo_items", "recurrence_data"})
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, entry: BetterTodoConfigEntry) -> None:
         """Initialize BetterTodoEntity."""
         self._entry = entry
         self._attr_unique_id = entry.entry_id
         self._attr_name = None  # Will use the device name
-        self._items: list[TodoItem] = []
+        self._items: TaskList[TodoItem] = TaskList()
+        # Active tasks sorted into the grouped view, kept up to date on each change
+        self._groups = TaskGroups(
+            week_window(dt_util.now().date(), week_start_day(hass.config.language))
+        )
+        # Local date the overdue and due today counts refer to
+        self._today: date = dt_util.now().date()
         # Store recurrence metadata for each task (keyed by uid)
         self._recurrence_data: dict[str, dict[str, Any]] = {}
+        # Shared scheduler that reopens completed recurring tasks, set once added
+        self._recurrence_scheduler: RecurrenceScheduler | None = None
+        # Projected occurrence dates for get_occurrences, per task
+        self._occurrence_cache = OccurrenceCache()
+        # Journal records and subscriber changes held back while a batch runs
+        self._batch: _Batch | None = None
+        # Bumped on every change to the tasks, their recurrence or their grouping
+        self._version = 0
+        # State attributes of a version, and the serialized dict of each task
+        self._attributes_cache: tuple[tuple[int, str | None], dict[str, Any]] | None = None
+        self._item_dicts: dict[str, tuple[TodoItem, dict[str, Any]]] = {}
         self._hass = hass
         self._entity_id: str | None = None
+        self._expose_items: bool = entry.data.get(CONF_EXPOSE_ITEMS, DEFAULT_EXPOSE_ITEMS)
+        self._missed_occurrences: str = entry.data.get(
+            CONF_MISSED_OCCURRENCES, DEFAULT_MISSED_OCCURRENCES
+        )
+        # State writes closer together than this are coalesced into a trailing write
+        self._state_write_interval = float(
+            entry.data.get(CONF_STATE_WRITE_INTERVAL, DEFAULT_STATE_WRITE_INTERVAL)
+        )
+        self._last_state_write = 0.0
+        self._unsub_state_write: CALLBACK_TYPE | None = None
+        self._state_writes = 0
+        self._state_writes_saved = 0
         
-        # Storage for persistent task data
-        self._store = storage.Store(
+        # Journaled storage: each mutation appends a small change record and
+        # records are coalesced into a single write after the configured delay
+        self._store = TaskStore(
             hass,
-            STORAGE_VERSION,
-            f"{DOMAIN}.{entry.entry_id}.tasks"
+            entry.entry_id,
+            float(entry.data.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)),
+            self._snapshot_data,
         )
         
         _LOGGER.info("Initialized Better ToDo entity for '%s' (entry_id: %s)", 
@@ -110,7 +203,9 @@ class BetterTodoEntity(Entity):
         if data:
             # Convert stored dicts back to TodoItem objects with error handling
             items_data = data.get("items", [])
-            self._items = []
+            self._items = TaskList()
+            headers: list[str | None] = []
+            generated_uids = 0
             for item in items_data:
                 try:
                     if isinstance(item, dict):
@@ -118,18 +213,42 @@ class BetterTodoEntity(Entity):
                         if "summary" not in item:
                             _LOGGER.warning("Skipping item without summary: %s", item)
                             continue
-                        self._items.append(TodoItem(**item))
-                    else:
-                        self._items.append(item)
+                        item = TodoItem(**item)
+                    # Older versions stored the group header rows as tasks
+                    if is_header_summary(item.summary):
+                        headers.append(item.uid)
+                        continue
+                    # Tasks from old versions may lack a UID, which the index needs
+                    if item.uid is None:
+                        generated_uids += 1
+                    todo_item = self._ensure_item_uid(item)
+                    if todo_item.uid in self._items:
+                        _LOGGER.warning("Skipping task with duplicate uid: %s", todo_item.uid)
+                        continue
+                    self._items.append(todo_item)
                 except (TypeError, ValueError) as err:
                     _LOGGER.error("Failed to load task item: %s - %s", item, err)
             self._recurrence_data = data.get("recurrence_data", {})
+            self._rebuild_groups()
             _LOGGER.info("Loaded %d tasks for %s", len(self._items), self._entry.data.get("name"))
+            if headers:
+                for uid in headers:
+                    if uid is not None and uid not in self._items:
+                        self._recurrence_data.pop(uid, None)
+                _LOGGER.info("Removed %d stored group header(s) from %s",
+                             len(headers), self._entry.data.get("name"))
+            if generated_uids:
+                _LOGGER.info("Assigned UIDs to %d task(s) from %s",
+                             generated_uids, self._entry.data.get("name"))
+            # Journal records refer to the generated UIDs, so the snapshot
+            # must hold them too or the tasks are replayed twice on restart
+            if headers or generated_uids:
+                await self.async_save_data()
         else:
             _LOGGER.info("No existing data found for %s, starting fresh", self._entry.data.get("name"))
 
-    async def async_save_data(self) -> None:
-        """Save task data to storage."""
+    def _snapshot_data(self) -> dict[str, Any]:
+        """Build the full storage payload used for journal compaction."""
         # Convert TodoItem objects to dicts for JSON serialization
         items_data = []
         for item in self._items:
@@ -140,25 +259,191 @@ class BetterTodoEntity(Entity):
             else:
                 _LOGGER.warning("Unknown item type during save: %s", type(item))
         
-        await self._store.async_save({
+        _LOGGER.debug("Saved %d tasks for %s", len(items_data), self._entry.data.get("name"))
+        return {
             "items": items_data,
             "recurrence_data": self._recurrence_data,
-        })
-        _LOGGER.debug("Saved %d tasks for %s", len(items_data), self._entry.data.get("name"))
+        }
+
+    async def async_save_data(self) -> None:
+        """Save a full snapshot of the task data immediately."""
+        await self._store.async_compact()
+
+    async def async_flush(self) -> None:
+        """Write pending task changes to storage, if any."""
+        await self._store.async_flush()
+
+    async def async_added_to_hass(self) -> None:
+        """Register the list, resync item subscribers and follow week and recurrence changes."""
+        await super().async_added_to_hass()
+
+        # Services and websocket commands find the list by its current entity_id
+        self.async_on_remove(async_get_list_registry(self.hass).async_register(self))
+
+        # The week window is shared by every list and advanced by a timer,
+        # so grouping never needs to look at the clock
+        scheduler = async_get_week_scheduler(self.hass)
+        self._groups.set_window(scheduler.window)
+        self._today = scheduler.today
+        self.async_on_remove(scheduler.async_add_listener(self._async_week_changed))
+        self.async_on_remove(scheduler.async_add_day_listener(self._async_day_changed))
+
+        # Completed recurring tasks waiting for their next occurrence
+        self._recurrence_scheduler = async_get_recurrence_scheduler(self.hass)
+        self.async_on_remove(
+            self._recurrence_scheduler.async_register(
+                self._entry.entry_id, self._async_occurrences_due
+            )
+        )
+        self._recurrence_scheduler.async_schedule(
+            self._entry.entry_id, self._pending_occurrences()
+        )
+
+        # Subscribers may have been following a previous instance of this list
+        # (e.g. before an options reload), so hand them a fresh snapshot
+        self._async_notify_change({"type": "snapshot", **self.items_snapshot()})
+
+        async def _async_flush_on_stop(event: Event) -> None:
+            await self.async_flush()
+
+        self.async_on_remove(
+            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_on_stop)
+        )
+        self.async_on_remove(self._async_cancel_state_write)
+
+    def items_snapshot(self) -> dict[str, Any]:
+        """Return every task and the recurrence data in list order."""
+        return {
+            "items": [self._item_dict(item) for item in self.todo_items],
+            "recurrence_data": self._recurrence_data,
+            "week": self._week_payload(),
+        }
+
+    def _week_payload(self) -> dict[str, str]:
+        """Return the current week window for websocket subscribers."""
+        start, end = self._groups.window
+        return {"start": start.isoformat(), "end": end.isoformat()}
+
+    @callback
+    def _async_week_changed(self, window: tuple[date, date]) -> None:
+        """Regroup dated tasks when a new week starts or the language changes."""
+        self._groups.set_window(window)
+        self._version += 1
+        # Lets open cards regroup without waiting for a task change
+        self._async_notify_change({"type": "week", **self._week_payload()})
+        if self._expose_items:
+            self._async_write_state()
+
+    @callback
+    def _async_day_changed(self, today: date) -> None:
+        """Update the overdue and due today counts for a new day."""
+        self._today = today
+        self._version += 1
+        self._async_write_state()
+
+    @callback
+    def _async_write_state(self) -> None:
+        """Write the entity state, coalescing bursts of changes.
+
+        Without a minimum interval the state is written on every change. With
+        one, a change after a quiet period is still written immediately, and
+        further changes within the interval are written together once it ends.
+        """
+        if self._state_write_interval <= 0:
+            self._state_writes += 1
+            self.async_write_ha_state()
+            return
+        if self._unsub_state_write is not None:
+            self._state_writes_saved += 1
+            return
+        wait = self._last_state_write + self._state_write_interval - time.monotonic()
+        if wait <= 0:
+            self._async_write_state_now()
+            return
+        self._unsub_state_write = async_call_later(self.hass, wait, self._async_trailing_state_write)
+
+    @callback
+    def _async_trailing_state_write(self, _now: Any) -> None:
+        """Write the state held back during a burst."""
+        self._unsub_state_write = None
+        self._async_write_state_now()
+
+    @callback
+    def _async_write_state_now(self) -> None:
+        """Write the entity state and start a new interval."""
+        self._async_cancel_state_write()
+        self._last_state_write = time.monotonic()
+        self._state_writes += 1
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the entity state and announce the list if its catalog entry changed."""
+        super().async_write_ha_state()
+        # Also runs for writes made by Home Assistant, e.g. when the list is renamed
+        async_get_list_registry(self.hass).async_update_catalog(self)
+
+    @callback
+    def _async_cancel_state_write(self) -> None:
+        """Drop a pending trailing state write."""
+        if self._unsub_state_write is not None:
+            self._unsub_state_write()
+            self._unsub_state_write = None
+
+    @callback
+    def _async_notify_change(self, change: dict[str, Any]) -> None:
+        """Send a per-item change to websocket subscribers of this list."""
+        if self._batch is not None:
+            self._batch.changes.append(change)
+            return
+        async_dispatcher_send(
+            self._hass, SIGNAL_ITEMS_UPDATED.format(self._entry.entry_id), change
+        )
+
+    @callback
+    def _async_journal(self, op: str, **payload: Any) -> None:
+        """Queue a change record for storage."""
+        self._version += 1
+        if self._batch is not None:
+            self._batch.records.append((op, payload))
+            return
+        self._store.async_append(op, **payload)
+
+    @property
+    def storage_stats(self) -> dict[str, Any]:
+        """Return journaled persistence statistics."""
+        return self._store.stats
 
     @property
     def todo_items(self) -> list[TodoItem]:
         """Return the To-do items in the To-do list."""
-        # Filter out header items and return actual tasks
-        return [item for item in self._items if not self._is_header_item(item)]
+        return list(self._items)
 
     @property
     def state(self) -> int:
         """Return the state of the entity - number of active (incomplete) tasks."""
-        return len([
-            item for item in self._items 
-            if not self._is_header_item(item) and item.status != STATUS_COMPLETED
-        ])
+        return len(self._groups)
+
+    @property
+    def catalog_entry(self) -> dict[str, Any]:
+        """Return the list's entry in the list catalog."""
+        state = self.hass.states.get(self.entity_id)
+        name = state.attributes.get(ATTR_FRIENDLY_NAME) if state is not None else None
+        return {
+            "entity_id": self.entity_id,
+            "name": name or self._entry.data["name"],
+            "active_tasks": len(self._groups),
+        }
+
+    @property
+    def entry_id(self) -> str:
+        """Return the config entry id of this list."""
+        return self._entry.entry_id  # type: ignore[no-any-return]
+
+    @property
+    def runtime_data(self) -> BetterTodoData:
+        """Return the runtime data of this list's config entry."""
+        return self._entry.runtime_data  # type: ignore[no-any-return]
 
     @property
     def entity_id(self) -> str:
@@ -182,262 +467,154 @@ class BetterTodoEntity(Entity):
             return replace(item, uid=str(uuid.uuid4()))
         return item
 
-    def _get_group_label(self, group: str) -> str:
-        """Get the translated label for a group category.
-        
-        Returns the appropriate label based on the system language.
-        Note: GROUP_DONE is no longer used - completed tasks are handled by HA's native UI.
-        """
-        if self.hass is None:
-            language = "en"
-        else:
-            language = self.hass.config.language
-        
-        # Spanish translations
-        if language.startswith("es"):
-            labels = {
-                GROUP_NO_DUE_DATE: "Sin fecha de vencimiento",
-                GROUP_THIS_WEEK: "Esta semana",
-                GROUP_FORTHCOMING: "Próximamente",
-            }
-        else:
-            # English and other languages default to English
-            labels = {
-                GROUP_NO_DUE_DATE: "No due date",
-                GROUP_THIS_WEEK: "This week",
-                GROUP_FORTHCOMING: "Forthcoming",
-            }
-        
-        return labels.get(group, group)
-
-    def _is_header_item(self, item: TodoItem) -> bool:
-        """Check if an item is a category header.
-        
-        Headers are identified by having a summary starting with the header prefix.
-        """
-        if not item.summary:
-            return False
-        return bool(item.summary.startswith(HEADER_PREFIX) and item.summary.endswith(HEADER_SUFFIX))
-
-    def _get_header_group(self, item: TodoItem) -> str | None:
-        """Extract the group from a header item.
-        
-        Returns the group key if this is a header, None otherwise.
-        Note: GROUP_DONE labels removed - completed tasks use HA's native UI.
-        """
-        if not self._is_header_item(item):
-            return None
-        
-        # Remove prefix and suffix to get the label
-        label = item.summary[len(HEADER_PREFIX):-len(HEADER_SUFFIX)]
-        
-        # Map back to group keys
-        if self.hass is None:
-            language = "en"
-        else:
-            language = self.hass.config.language
-        
-        if language.startswith("es"):
-            label_to_group = {
-                "Sin fecha de vencimiento": GROUP_NO_DUE_DATE,
-                "Esta semana": GROUP_THIS_WEEK,
-                "Próximamente": GROUP_FORTHCOMING,
-            }
-        else:
-            label_to_group = {
-                "No due date": GROUP_NO_DUE_DATE,
-                "This week": GROUP_THIS_WEEK,
-                "Forthcoming": GROUP_FORTHCOMING,
-            }
-        
-        return label_to_group.get(label)
-
-    def _create_header_item(self, group: str) -> TodoItem:
-        """Create a header item for a group category."""
-        label = self._get_group_label(group)
-        return TodoItem(
-            uid=f"header_{group}",
-            summary=f"{HEADER_PREFIX}{label}{HEADER_SUFFIX}",
-            status=STATUS_NEEDS_ACTION,
-        )
-
     def _get_week_start_day(self) -> int:
         """Get the first day of the week based on locale settings.
         
         Returns:
             0 for Monday (used in most locales including Spanish)
             6 for Sunday (used in US English and some other locales)
-        
-        Home Assistant's language/locale determines the week start:
-        - Spanish (es): Monday (0)
-        - English (en): Sunday (6) for US, Monday (0) for UK/others
-        
-        This uses Python's weekday() where Monday=0, Sunday=6
         """
-        if self.hass is None:
-            # Default to Monday if hass not available
-            return 0
-        
-        # Get the language from Home Assistant configuration
-        language = self.hass.config.language
-        
-        # Map languages to their first weekday
-        # Sunday (6) for US English and similar locales
-        # Monday (0) for most other locales including Spanish
-        sunday_first_locales = ["en-US", "en_US"]
-        
-        # Check if the language uses Sunday as first day
-        if language in sunday_first_locales:
-            return 6  # Sunday
-        
-        # Default to Monday for all other locales (including "es", "en-GB", etc.)
-        return 0  # Monday
+        return week_start_day(self._hass.config.language)
 
-    def _get_item_group(self, item: TodoItem) -> str:
-        """Get the group category for a todo item.
-        
-        Returns one of: GROUP_NO_DUE_DATE, GROUP_THIS_WEEK, GROUP_FORTHCOMING
-        Note: Completed items are not grouped here - they use HA's native "Completed" section
-        """
-        # Check if item has no due date
-        if not item.due:
-            return GROUP_NO_DUE_DATE
-        
-        # Parse the due date
-        try:
-            # due can be a date string in format YYYY-MM-DD
-            if isinstance(item.due, str):
-                due_date = datetime.strptime(item.due, "%Y-%m-%d").date()
-            else:
-                due_date = item.due
-            
-            # Get current date in the user's timezone
-            now = dt_util.now().date()
-            
-            # Get the week start day based on locale
-            week_start = self._get_week_start_day()
-            
-            # Calculate the start and end of the current week
-            # weekday() returns 0=Monday, 6=Sunday
-            current_weekday = now.weekday()
-            
-            if week_start == 0:  # Week starts on Monday
-                # Calculate days since Monday
-                days_since_start = current_weekday
-                # Calculate days until Sunday (end of week)
-                days_until_end = 6 - current_weekday
-            else:  # Week starts on Sunday (week_start == 6)
-                # Calculate days since Sunday
-                days_since_start = (current_weekday + 1) % 7
-                # Calculate days until Saturday (end of week)
-                days_until_end = 6 - days_since_start
-            
-            week_start_date = now - timedelta(days=days_since_start)
-            week_end_date = now + timedelta(days=days_until_end)
-            
-            # Categorize: task is "this week" if due date is within current week
-            if week_start_date <= due_date <= week_end_date:
-                return GROUP_THIS_WEEK
-            else:
-                return GROUP_FORTHCOMING
-        except (ValueError, AttributeError, TypeError):
-            # If we can't parse the date, treat as no due date
-            return GROUP_NO_DUE_DATE
+    def _group_item(self, item: TodoItem) -> None:
+        """Record the parsed due date of an item and put it in its group bucket if it is active."""
+        if item.uid is None:
+            return
+        self._groups.add(
+            item.uid,
+            item.due,
+            self._items.rank(item.uid),
+            active=item.status != STATUS_COMPLETED,
+        )
 
-    def _sort_items(self, items: list[TodoItem]) -> list[TodoItem]:
-        """Sort items by group and due date, inserting category headers.
-        
-        Order: No due date -> This week -> Forthcoming
-        Completed items are handled by HA's native "Completed" section.
-        Within each group, sort by due date (earliest first).
-        Inserts header items between groups for visual separation.
-        """
-        # Filter out existing header items and only keep active (non-completed) task items
-        actual_items = [item for item in items 
-                       if not self._is_header_item(item) 
-                       and item.status != STATUS_COMPLETED]
-        
-        if not actual_items:
-            return []
-        
-        # Define group order (only active task groups)
-        group_order = {
-            GROUP_NO_DUE_DATE: 0,
-            GROUP_THIS_WEEK: 1,
-            GROUP_FORTHCOMING: 2,
-        }
-        
-        # Group items by category (only active tasks)
-        grouped: dict[str, list[TodoItem]] = {
-            GROUP_NO_DUE_DATE: [],
-            GROUP_THIS_WEEK: [],
-            GROUP_FORTHCOMING: [],
-        }
-        
-        for item in actual_items:
-            group = self._get_item_group(item)
-            if group in grouped:
-                grouped[group].append(item)
-        
-        # Sort items within each group by due date
-        for group in grouped:
-            grouped[group].sort(key=lambda item: item.due if item.due else "")
-        
-        # Build final list with headers
-        result: list[TodoItem] = []
-        
-        for group in sorted(group_order.keys(), key=lambda g: group_order[g]):
-            group_items = grouped[group]
-            if group_items:  # Only add header if group has items
-                # Add header
-                result.append(self._create_header_item(group))
-                # Add items in this group
-                result.extend(group_items)
-        
-        return result
+    def _rebuild_groups(self) -> None:
+        """Rebuild every group bucket from the task list."""
+        self._groups = TaskGroups(self._groups.window)
+        for item in self._items:
+            self._group_item(item)
+
+    def _item_dict(self, item: TodoItem) -> dict[str, Any]:
+        """Return the serialized task, reused until the task is replaced."""
+        assert item.uid is not None
+        cached = self._item_dicts.get(item.uid)
+        if cached is not None and cached[0] is item:
+            return cached[1]
+        data = asdict(item)
+        self._item_dicts[item.uid] = (item, data)
+        return data
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes including all task data."""
-        # Get actual task items (no headers, no completed for active list)
-        active_items = [
-            item for item in self._items 
-            if not self._is_header_item(item) and item.status != STATUS_COMPLETED
-        ]
+        """Return a compact summary of the list.
         
-        # Get completed items
-        completed_items = [
-            item for item in self._items 
-            if not self._is_header_item(item) and item.status == STATUS_COMPLETED
-        ]
+        Clients that need the tasks themselves use the better_todo/items
+        websocket commands, which send per-item changes instead of the full list.
+        The attributes are built once per change to the list (and language,
+        which names the group headers).
+        """
+        key = (self._version, self.hass.config.language if self.hass else None)
+        if self._attributes_cache is not None and self._attributes_cache[0] == key:
+            return self._attributes_cache[1]
+
+        # Counts are kept up to date by the groups, none of them scans the list
+        active_count = len(self._groups)
+        completed_count = self._groups.completed
+        overdue_count, due_today_count, next_due = self._groups.due_summary(self._today)
+        attributes: dict[str, Any] = {
+            "total_tasks": active_count + completed_count,
+            "active_tasks": active_count,
+            "completed_tasks": completed_count,
+            "recurring_tasks": len(self._recurrence_data),
+            "overdue_tasks": overdue_count,
+            "due_today_tasks": due_today_count,
+            "next_due": next_due.isoformat() if next_due is not None else None,
+        }
+        if self._expose_items:
+            attributes.update(self._item_attributes())
+        self._attributes_cache = (key, attributes)
+        return attributes
+
+    def _item_attributes(self) -> dict[str, Any]:
+        """Return the full task list attributes for clients that read them from the state."""
+        # Active items first, then completed ones, each in list order
+        active_items = [item for item in self._items if item.status != STATUS_COMPLETED]
+        completed_items = [item for item in self._items if item.status == STATUS_COMPLETED]
         
         # For native todo-list card compatibility, provide a clean items list
         # without headers, just the actual tasks
         all_items = active_items + completed_items
         
-        # Convert TodoItem objects to dicts for attributes
-        all_items_dict = [asdict(item) for item in all_items]
+        # Convert TodoItem objects to dicts for attributes, unchanged tasks
+        # reuse the dict from the previous state
+        all_items_dict = [self._item_dict(item) for item in all_items]
         
-        # Also provide sorted items with headers for custom cards (backward compatibility)
-        sorted_items_with_headers = self._sort_items(self._items)
-        sorted_items_dict = [asdict(item) for item in sorted_items_with_headers]
+        # Also provide the grouped view with header rows for custom cards
+        # (backward compatibility), ordered: No due date -> This week -> Forthcoming
+        def rows(uids: list[str]) -> list[dict[str, Any]]:
+            return [self._item_dict(item) for uid in uids if (item := self._items.get(uid)) is not None]
+
+        sorted_items_dict = grouped_view(
+            self._groups.grouped(), rows, self.hass.config.language if self.hass else None
+        )
         
         return {
             "items": all_items_dict,  # Clean list for native card
             "todo_items": sorted_items_dict,  # With headers for custom cards
             "recurrence_data": self._recurrence_data,
-            "total_tasks": len(all_items),
         }
 
-    async def async_create_todo_item(self, item: TodoItem) -> None:
-        """Create a To-do item."""
+    async def async_create_todo_item(
+        self, item: TodoItem, recurrence: dict[str, Any] | None = None
+    ) -> TodoItem | None:
+        """Create a To-do item, returns the stored item.
+
+        The recurrence settings (keyword arguments of set_task_recurrence) are
+        applied with the same state write.
+        """
         # Ensure the item has a UID
         item = self._ensure_item_uid(item)
-        self._items.append(item)
+        assert item.uid is not None
+        if item.uid in self._items:
+            _LOGGER.warning("Task with uid %s already exists", item.uid)
+            return None
+        self._async_append_item(item)
+        if recurrence:
+            self._async_set_recurrence(item.uid, **recurrence)
         _LOGGER.info("Created task '%s' (uid: %s) in %s", 
                      item.summary, item.uid, self._entry.data.get("name"))
-        await self.async_save_data()
-        self.async_write_ha_state()
+        self._async_write_state()
+        return item
+
+    @callback
+    def _async_append_item(self, item: TodoItem) -> None:
+        """Add an item with a new UID at the end of the list."""
+        assert item.uid is not None
+        self._items.append(item)
+        self._group_item(item)
+        self._async_journal(OP_CREATE, item=asdict(item))
+        self._async_notify_change({
+            "type": "add",
+            "item": asdict(item),
+            "previous_uid": self._items.previous_uid(item.uid),
+        })
+
+    async def async_create_todo_items(self, items: list[TodoItem]) -> list[dict[str, Any]]:
+        """Create several To-do items with a single state write.
+
+        Returns one result per item, with the UID of the new task or an error.
+        """
+        results: list[dict[str, Any]] = []
+        for item in items:
+            item = self._ensure_item_uid(item)
+            if item.uid in self._items:
+                results.append({"uid": item.uid, "error": "already_exists"})
+                continue
+            self._async_append_item(item)
+            results.append({"uid": item.uid})
+        _LOGGER.info("Created %d task(s) in %s",
+                     sum("error" not in result for result in results), self._entry.data.get("name"))
+        self._async_write_state()
+        return results
 
     async def async_update_todo_item(self, item: TodoItem) -> None:
         """Update a To-do item."""
@@ -447,79 +624,237 @@ class BetterTodoEntity(Entity):
             _LOGGER.error("Cannot update task without UID")
             return
 
-        # Find and update the item by uid
-        updated = False
-        for idx, existing_item in enumerate(self._items):
-            if existing_item.uid == item.uid:
-                self._items[idx] = item
-                updated = True
-                break
-        
-        if updated:
+        if self._async_replace_item(item):
             _LOGGER.info("Updated task '%s' (uid: %s) in %s", 
                          item.summary, item.uid, self._entry.data.get("name"))
         else:
             _LOGGER.warning("Task with uid %s not found for update", item.uid)
         
-        await self.async_save_data()
-        self.async_write_ha_state()
+        self._async_write_state()
 
-    async def async_delete_todo_items(self, uids: list[str]) -> None:
-        """Delete To-do items."""
-        initial_count = len(self._items)
-        self._items = [item for item in self._items if item.uid not in uids]
-        deleted_count = initial_count - len(self._items)
-        
-        # Clean up recurrence data for deleted items
+    async def async_update_todo_items(self, changes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Update several To-do items with a single state write.
+
+        Each change has the UID of a task and the fields to change, other fields
+        keep their value. Returns one result per change.
+        """
+        results: list[dict[str, Any]] = []
+        for change in changes:
+            uid = change["uid"]
+            existing = self._items.get(uid)
+            if existing is None:
+                results.append({"uid": uid, "error": "not_found"})
+                continue
+            self._async_replace_item(_patched(existing, change))
+            results.append({"uid": uid})
+        _LOGGER.info("Updated %d task(s) in %s",
+                     sum("error" not in result for result in results), self._entry.data.get("name"))
+        self._async_write_state()
+        return results
+
+    @callback
+    def _async_replace_item(self, item: TodoItem) -> bool:
+        """Replace the task with the same UID, returns False if there is none."""
+        assert item.uid is not None
+        previous = self._items.get(item.uid)
+        if previous is None or not self._items.replace(item):
+            return False
+        self._group_item(item)
+        self._async_journal(OP_UPDATE, item=asdict(item))
+        self._async_notify_change({"type": "update", "item": asdict(item)})
+        if item.uid in self._recurrence_data:
+            self._async_update_recurrence(previous, item)
+        return True
+
+    async def async_batch(self, operations: list[dict[str, Any]]) -> dict[str, Any]:
+        """Apply a sequence of operations as one atomic change.
+
+        Operations are create, update, move, delete and set_recurrence. A
+        create operation may name its task with a ref, and later operations
+        can use that ref wherever they take a UID. If any operation fails,
+        every task the batch touched is restored and the error is raised.
+        Otherwise the changes are journaled and sent to subscribers together,
+        with a single state write.
+        """
+        batch = self._batch = _Batch()
+        try:
+            for index, operation in enumerate(operations):
+                batch.results.append(self._async_apply_operation(batch, index, operation))
+        except Exception:
+            self._batch = None
+            self._async_rollback(batch)
+            raise
+        self._batch = None
+
+        for op, payload in batch.records:
+            self._store.async_append(op, **payload)
+        for change in batch.changes:
+            self._async_notify_change(change)
+        _LOGGER.info("Applied %d operation(s) to %s", len(operations), self._entry.data.get("name"))
+        self._async_write_state()
+        return {"results": batch.results, "refs": batch.refs}
+
+    @callback
+    def _async_apply_operation(
+        self, batch: _Batch, index: int, operation: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Apply one batch operation, recording how to undo it."""
+        op = operation["op"]
+        if op == BATCH_OP_CREATE:
+            item = self._ensure_item_uid(TodoItem(
+                summary=operation["summary"],
+                description=operation.get("description"),
+                due=operation.get("due"),
+            ))
+            assert item.uid is not None
+            self._async_save_undo(batch, item.uid)
+            self._async_append_item(item)
+            if ref := operation.get("ref"):
+                batch.refs[ref] = item.uid
+            return {"uid": item.uid}
+
+        uid = batch.refs.get(operation["uid"], operation["uid"])
+        if uid not in self._items:
+            raise ServiceValidationError(
+                f"Operation {index + 1} ({op}): task {operation['uid']} not found"
+            )
+        self._async_save_undo(batch, uid)
+
+        if op == BATCH_OP_UPDATE:
+            existing = self._items.get(uid)
+            assert existing is not None
+            self._async_replace_item(_patched(existing, operation, exclude=("op", "uid")))
+        elif op == BATCH_OP_MOVE:
+            previous_uid = operation.get("previous_uid")
+            self._async_move_item(uid, batch.refs.get(previous_uid, previous_uid) if previous_uid else None)
+        elif op == BATCH_OP_DELETE:
+            self._async_remove_items([uid])
+        elif op == BATCH_OP_SET_RECURRENCE:
+            self._async_set_recurrence(
+                uid,
+                operation[ATTR_RECURRENCE_ENABLED],
+                operation.get(ATTR_RECURRENCE_INTERVAL),
+                operation.get(ATTR_RECURRENCE_UNIT),
+                operation.get(ATTR_RECURRENCE_END_ENABLED, False),
+                operation.get(ATTR_RECURRENCE_END_TYPE),
+                operation.get(ATTR_RECURRENCE_END_COUNT),
+                operation.get(ATTR_RECURRENCE_END_DATE),
+            )
+        else:
+            raise ServiceValidationError(f"Operation {index + 1}: unknown operation {op}")
+        return {"uid": uid}
+
+    @callback
+    def _async_save_undo(self, batch: _Batch, uid: str) -> None:
+        """Remember a task as it is before an operation changes it."""
+        item = self._items.get(uid)
+        data = self._recurrence_data.get(uid)
+        batch.undo.append((
+            uid,
+            item,
+            self._items.previous_uid(uid) if item is not None else None,
+            dict(data) if data is not None else None,
+        ))
+
+    @callback
+    def _async_rollback(self, batch: _Batch) -> None:
+        """Restore every task a failed batch touched, newest change first."""
+        for uid, item, previous_uid, data in reversed(batch.undo):
+            if item is None:
+                # Created by the batch
+                self._items.remove(uid)
+                self._groups.discard(uid)
+                self._item_dicts.pop(uid, None)
+            else:
+                if not self._items.replace(item):
+                    self._items.append(item)
+                self._items.move(uid, previous_uid)
+            if data is None:
+                self._recurrence_data.pop(uid, None)
+            else:
+                self._recurrence_data[uid] = data
+            self._occurrence_cache.discard(uid)
+
+        # Regroup and reschedule once every task is back in place
+        touched = {uid for uid, *_ in batch.undo}
+        # Tasks next to a restored one may have been given new ranks
+        for uid in self._items.pop_renumbered():
+            if uid not in touched and (item := self._items.get(uid)) is not None:
+                self._group_item(item)
+        for uid in touched:
+            if (item := self._items.get(uid)) is not None:
+                self._group_item(item)
+            else:
+                self._groups.discard(uid)
+            self._async_schedule_recurrence(uid)
+        self._version += 1
+        _LOGGER.warning("Rolled back a batch of changes to %s", self._entry.data.get("name"))
+
+    async def async_delete_todo_items(self, uids: list[str]) -> list[str]:
+        """Delete To-do items, returns the UIDs that were deleted."""
+        deleted: list[str] = self._async_remove_items(uids)
+        if not deleted:
+            # Only unknown UIDs, nothing changed
+            return deleted
+        _LOGGER.info("Deleted %d task(s) from %s", len(deleted), self._entry.data.get("name"))
+        self._async_write_state()
+        return deleted
+
+    @callback
+    def _async_remove_items(self, uids: list[str]) -> list[str]:
+        """Remove tasks and their recurrence data, returns the UIDs that existed."""
+        deleted: list[str] = []
         for uid in uids:
+            if self._items.remove(uid) is None:
+                continue
+            deleted.append(uid)
+            self._groups.discard(uid)
+            # Clean up recurrence data for deleted items
             self._recurrence_data.pop(uid, None)
+            self._occurrence_cache.discard(uid)
+            self._item_dicts.pop(uid, None)
+        if not deleted:
+            return deleted
+        if self._recurrence_scheduler is not None:
+            self._recurrence_scheduler.async_unschedule(self._entry.entry_id, deleted)
         
-        _LOGGER.info("Deleted %d task(s) from %s", deleted_count, self._entry.data.get("name"))
-        await self.async_save_data()
-        self.async_write_ha_state()
+        self._async_journal(OP_DELETE, uids=list(deleted))
+        self._async_notify_change({"type": "remove", "uids": list(deleted)})
+        return deleted
 
     async def async_move_todo_item(
         self, uid: str, previous_uid: str | None = None
     ) -> None:
         """Move a To-do item (required by TodoListEntity)."""
-        # Find the item to move
-        item_to_move = None
-        for idx, item in enumerate(self._items):
-            if item.uid == uid:
-                item_to_move = self._items.pop(idx)
-                break
-
-        if item_to_move is None:
-            return
+        if self._async_move_item(uid, previous_uid):
+            self._async_write_state()
 
-        # Find the position to insert
-        if previous_uid is None:
-            # Move to the beginning
-            self._items.insert(0, item_to_move)
-        else:
-            # Find previous item and insert after it
-            inserted = False
-            for idx, item in enumerate(self._items):
-                if item.uid == previous_uid:
-                    self._items.insert(idx + 1, item_to_move)
-                    inserted = True
-                    break
-            # If previous_uid not found, append at the end
-            if not inserted:
-                self._items.append(item_to_move)
-
-        await self.async_save_data()
-        self.async_write_ha_state()
+    @callback
+    def _async_move_item(self, uid: str, previous_uid: str | None) -> bool:
+        """Move a task after previous_uid, returns False if nothing moved."""
+        # A task cannot move after itself: ignore it rather than journal and
+        # send a move that replay and the cards would apply as a move to the end
+        if previous_uid == uid:
+            return False
+        # Moves to the beginning without previous_uid, and to the end if
+        # previous_uid is not found
+        if not self._items.move(uid, previous_uid):
+            return False
+        # Tasks next to the moved one may have been given new ranks
+        for renumbered_uid in {uid, *self._items.pop_renumbered()}:
+            if (item := self._items.get(renumbered_uid)) is not None:
+                self._group_item(item)
+
+        self._async_journal(OP_MOVE, uid=uid, previous_uid=previous_uid)
+        self._async_notify_change({"type": "move", "uid": uid, "previous_uid": previous_uid})
+        return True
 
     def get_item_by_uid(self, uid: str) -> TodoItem | None:
         """Get a task item by its UID.
         
         Public method for accessing items without exposing internal list.
         """
-        for item in self._items:
-            if item.uid == uid:
-                return item
-        return None
+        return self._items.get(uid)
 
     def set_task_recurrence(
         self,
@@ -533,12 +868,40 @@ class BetterTodoEntity(Entity):
         recurrence_end_date: str | None = None,
     ) -> None:
         """Set recurrence configuration for a task."""
-        # Check if task exists using generator expression for efficiency
-        if not any(item.uid == uid for item in self._items):
-            return
+        if self._async_set_recurrence(
+            uid,
+            recurrence_enabled,
+            recurrence_interval,
+            recurrence_unit,
+            recurrence_end_enabled,
+            recurrence_end_type,
+            recurrence_end_count,
+            recurrence_end_date,
+        ):
+            self._async_write_state()
+
+    @callback
+    def _async_set_recurrence(
+        self,
+        uid: str,
+        recurrence_enabled: bool,
+        recurrence_interval: int | None = None,
+        recurrence_unit: str | None = None,
+        recurrence_end_enabled: bool = False,
+        recurrence_end_type: str | None = None,
+        recurrence_end_count: int | None = None,
+        recurrence_end_date: str | None = None,
+    ) -> bool:
+        """Set the recurrence of a task, returns False if it does not exist."""
+        if uid not in self._items:
+            return False
+
+        previous = self._recurrence_data.get(uid)
+        if self._recurrence_scheduler is not None:
+            self._recurrence_scheduler.async_unschedule(self._entry.entry_id, [uid])
 
         if recurrence_enabled:
-            self._recurrence_data[uid] = {
+            data = {
                 ATTR_RECURRENCE_ENABLED: True,
                 ATTR_RECURRENCE_INTERVAL: recurrence_interval or 1,
                 ATTR_RECURRENCE_UNIT: recurrence_unit or RECURRENCE_UNIT_DAYS,
@@ -547,16 +910,284 @@ class BetterTodoEntity(Entity):
                 ATTR_RECURRENCE_END_COUNT: recurrence_end_count,
                 ATTR_RECURRENCE_END_DATE: recurrence_end_date,
                 ATTR_RECURRENCE_CURRENT_COUNT: 0,
+                ATTR_RECURRENCE_ANCHOR_DATE: None,
+                ATTR_RECURRENCE_ANCHOR_INDEX: 0,
+                ATTR_RECURRENCE_NEXT_DUE: None,
             }
+            if previous and previous.get(ATTR_RECURRENCE_ENABLED):
+                # Changing the settings of a recurring task keeps its progress
+                for key in (
+                    ATTR_RECURRENCE_CURRENT_COUNT,
+                    ATTR_RECURRENCE_ANCHOR_DATE,
+                    ATTR_RECURRENCE_ANCHOR_INDEX,
+                    ATTR_RECURRENCE_NEXT_DUE,
+                ):
+                    data[key] = previous.get(key, data[key])
+            if data[ATTR_RECURRENCE_ANCHOR_DATE] is None:
+                due = self._groups.due_of(uid)
+                if due is not None:
+                    data[ATTR_RECURRENCE_ANCHOR_DATE] = due.isoformat()
+                    data[ATTR_RECURRENCE_ANCHOR_INDEX] = data[ATTR_RECURRENCE_CURRENT_COUNT]
+            if data[ATTR_RECURRENCE_NEXT_DUE] is not None:
+                # Waiting to reopen, the next occurrence follows the new settings
+                self._set_next_due(data, next_occurrence(data))
+            self._recurrence_data[uid] = data
         else:
             self._recurrence_data.pop(uid, None)
+            self._occurrence_cache.discard(uid)
 
-        self.async_write_ha_state()
+        self._async_schedule_recurrence(uid)
+        self._async_recurrence_changed(uid)
+        return True
+
+    @callback
+    def _async_recurrence_changed(self, uid: str) -> None:
+        """Persist the recurrence data of a task and send it to subscribers."""
+        data = self._recurrence_data.get(uid)
+        self._async_journal(OP_RECURRENCE, uid=uid, data=data)
+        self._async_notify_change({"type": "recurrence", "uid": uid, "data": data})
+
+    @staticmethod
+    def _set_next_due(data: dict[str, Any], next_due: date | None) -> None:
+        """Set the date a completed recurring task is reopened on."""
+        data[ATTR_RECURRENCE_NEXT_DUE] = next_due.isoformat() if next_due else None
+
+    def _recurrence_fire_date(self, item: TodoItem, data: dict[str, Any]) -> date | None:
+        """Return the date the recurrence engine next needs to act on a task.
+
+        A completed task is reopened on its next due date. An open task
+        misses its current occurrence once the next one is reached.
+        """
+        if not data.get(ATTR_RECURRENCE_ENABLED):
+            return None
+        if item.status == STATUS_COMPLETED:
+            return parse_due(data.get(ATTR_RECURRENCE_NEXT_DUE))
+        return occurrence(data, (data.get(ATTR_RECURRENCE_CURRENT_COUNT) or 0) + 1)
+
+    @callback
+    def _async_schedule_recurrence(self, uid: str) -> None:
+        """Schedule (or cancel) the next recurrence action for a task."""
+        if self._recurrence_scheduler is None:
+            return
+        data = self._recurrence_data.get(uid)
+        item = self._items.get(uid)
+        fire_date = self._recurrence_fire_date(item, data) if data and item else None
+        if fire_date is None:
+            self._recurrence_scheduler.async_unschedule(self._entry.entry_id, [uid])
+        else:
+            self._recurrence_scheduler.async_schedule(self._entry.entry_id, [(uid, fire_date)])
+
+    def _pending_occurrences(self) -> list[tuple[str, date]]:
+        """Return recurring tasks with the date the engine next acts on them."""
+        pending = []
+        for uid, data in self._recurrence_data.items():
+            item = self._items.get(uid)
+            if item is not None and (fire_date := self._recurrence_fire_date(item, data)):
+                pending.append((uid, fire_date))
+        return pending
+
+    @callback
+    def _async_update_recurrence(self, previous: TodoItem, item: TodoItem) -> None:
+        """Advance the recurrence of a task when it is completed.
+
+        Completing an occurrence increments the count and computes the next
+        due date, unless an end condition is met. Reopening the task before
+        that date undoes the completion. Changing the due date of an open
+        occurrence re-anchors the series.
+        """
+        uid = item.uid
+        data = self._recurrence_data.get(uid) if uid else None
+        if uid is None or not data or not data.get(ATTR_RECURRENCE_ENABLED):
+            return
+
+        count = data.get(ATTR_RECURRENCE_CURRENT_COUNT) or 0
+        if previous.status != STATUS_COMPLETED and item.status == STATUS_COMPLETED:
+            if parse_due(data.get(ATTR_RECURRENCE_ANCHOR_DATE)) is None:
+                # Without a due date the series starts on the day of completion
+                anchor = self._groups.due_of(uid) or dt_util.now().date()
+                data[ATTR_RECURRENCE_ANCHOR_DATE] = anchor.isoformat()
+                data[ATTR_RECURRENCE_ANCHOR_INDEX] = count
+            data[ATTR_RECURRENCE_CURRENT_COUNT] = count + 1
+            next_due = next_occurrence(data)
+            self._set_next_due(data, next_due)
+            if next_due is None:
+                _LOGGER.info("Recurrence of task %s in %s has ended", uid, self._entry.data.get("name"))
+        elif previous.status == STATUS_COMPLETED and item.status != STATUS_COMPLETED:
+            if data.get(ATTR_RECURRENCE_NEXT_DUE) is None:
+                # Completed before the recurrence was set up, or after it ended
+                self._async_schedule_recurrence(uid)
+                return
+            data[ATTR_RECURRENCE_CURRENT_COUNT] = max(count - 1, 0)
+            self._set_next_due(data, None)
+        elif item.due != previous.due and item.status != STATUS_COMPLETED:
+            # A new due date for the open occurrence moves the whole series
+            due = self._groups.due_of(uid)
+            data[ATTR_RECURRENCE_ANCHOR_DATE] = due.isoformat() if due else None
+            data[ATTR_RECURRENCE_ANCHOR_INDEX] = count
+        else:
+            return
+        self._async_schedule_recurrence(uid)
+        self._async_recurrence_changed(uid)
+
+    @callback
+    def _async_occurrences_due(self, uids: list[str]) -> None:
+        """Move recurring tasks on to the latest occurrence that has been reached.
+
+        Completed tasks are reopened with the new due date. Occurrences that
+        were reached without being completed, while the task was open or while
+        Home Assistant was down, are skipped or kept as one task each,
+        depending on the list options. The whole batch is a single state write
+        and a single (coalesced) journal write.
+        """
+        today = dt_util.now().date()
+        changed = False
+        missed_total = 0
+        for uid in uids:
+            data = self._recurrence_data.get(uid)
+            item = self._items.get(uid)
+            if not data or item is None:
+                continue
+            count = data.get(ATTR_RECURRENCE_CURRENT_COUNT) or 0
+            latest = latest_reached(data, today)
+            due = occurrence(data, latest) if latest is not None else None
+            if (
+                latest is None
+                or due is None
+                or (item.status != STATUS_COMPLETED and latest == count)
+            ):
+                # Nothing reached yet, e.g. after a time zone change
+                self._async_schedule_recurrence(uid)
+                continue
+
+            missed = latest - count
+            if missed and self._missed_occurrences == MISSED_OCCURRENCES_CREATE:
+                for missed_due in occurrence_dates(data, count, latest):
+                    self._async_append_item(TodoItem(
+                        uid=str(uuid.uuid4()),
+                        summary=item.summary,
+                        description=item.description,
+                        due=missed_due.isoformat(),
+                        status=STATUS_NEEDS_ACTION,
+                    ))
+            missed_total += missed
+
+            data[ATTR_RECURRENCE_CURRENT_COUNT] = latest
+            self._set_next_due(data, None)
+            reopened = replace(item, status=STATUS_NEEDS_ACTION, due=due.isoformat())
+            self._items.replace(reopened)
+            self._group_item(reopened)
+            _LOGGER.debug("Recurring task '%s' (uid: %s) is now due %s in %s",
+                          reopened.summary, uid, due, self._entry.data.get("name"))
+            self._async_journal(OP_UPDATE, item=asdict(reopened))
+            self._async_notify_change({"type": "update", "item": asdict(reopened)})
+            self._async_schedule_recurrence(uid)
+            self._async_recurrence_changed(uid)
+            changed = True
+
+        if missed_total:
+            _LOGGER.info("%s %d missed occurrence(s) of recurring tasks in %s",
+                         "Created" if self._missed_occurrences == MISSED_OCCURRENCES_CREATE
+                         else "Skipped",
+                         missed_total, self._entry.data.get("name"))
+        if changed:
+            self._async_write_state()
 
     def get_task_recurrence(self, uid: str) -> dict[str, Any] | None:
         """Get recurrence configuration for a task."""
         return self._recurrence_data.get(uid)
 
+    def get_occurrences(self, start: date, end: date) -> list[dict[str, Any]]:
+        """Return upcoming occurrences of recurring tasks between start and end."""
+        occurrences = []
+        for uid, data in self._recurrence_data.items():
+            item = self._items.get(uid)
+            if item is None or not data.get(ATTR_RECURRENCE_ENABLED):
+                continue
+            for due in self._occurrence_cache.occurrences(uid, data, start, end):
+                occurrences.append({
+                    "uid": uid,
+                    "summary": item.summary,
+                    "due": due.isoformat(),
+                })
+        return occurrences
+
+    def query_tasks(
+        self,
+        status: str | None = None,
+        group: str | None = None,
+        due_start: date | None = None,
+        due_end: date | None = None,
+        search: str | None = None,
+        sort: str = SORT_POSITION,
+    ) -> list[dict[str, Any]]:
+        """Return the tasks matching every given filter, sorted.
+
+        Active tasks are read from the group buckets, which are indexed by
+        group and due date, so only matching tasks are visited. Completed tasks
+        are not indexed and are found with a scan. Each task has its group
+        (None for completed tasks).
+        """
+        uids: list[str] = []
+        if status != STATUS_COMPLETED:
+            uids.extend(self._groups.uids(group, due_start, due_end))
+        if status != STATUS_NEEDS_ACTION and group is None:
+            for item in self._items:
+                if item.status != STATUS_COMPLETED or item.uid is None:
+                    continue
+                if due_start is not None or due_end is not None:
+                    due = self._groups.due_of(item.uid)
+                    if (
+                        due is None
+                        or (due_start is not None and due < due_start)
+                        or (due_end is not None and due > due_end)
+                    ):
+                        continue
+                uids.append(item.uid)
+
+        # (rank, item) of each match, rank being the list position
+        matches: list[tuple[float, TodoItem]] = []
+        needle = search.casefold() if search else None
+        for uid in uids:
+            item = self._items.get(uid)
+            if item is None:
+                continue
+            if needle is not None and needle not in item.summary.casefold() and (
+                not item.description or needle not in item.description.casefold()
+            ):
+                continue
+            matches.append((self._items.rank(uid), item))
+
+        if sort == SORT_DUE:
+            # Tasks without a due date last
+            due_of = self._groups.due_of
+            matches.sort(key=lambda match: (due_of(match[1].uid) or date.max, match[0]))
+        elif sort == SORT_SUMMARY:
+            matches.sort(key=lambda match: (match[1].summary.casefold(), match[0]))
+        else:
+            matches.sort(key=lambda match: match[0])
+
+        return [
+            {**self._item_dict(item), "group": self._groups.group_of(item.uid)}
+            for _rank, item in matches
+        ]
+
+    @property
+    def state_write_stats(self) -> dict[str, Any]:
+        """Return state write statistics."""
+        return {
+            "min_interval": self._state_write_interval,
+            "writes": self._state_writes,
+            "writes_saved": self._state_writes_saved,
+        }
+
+    @property
+    def occurrence_cache_stats(self) -> dict[str, int]:
+        """Return get_occurrences cache statistics."""
+        return {
+            "hits": self._occurrence_cache.hits,
+            "misses": self._occurrence_cache.misses,
+        }
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information about this entity."""
@@ -0,0 +1,85 @@
+"""View projection for Better ToDo integration.
+
+The task list never stores group headers. Clients that still read the grouped
+list with a header row in front of each group (the ``todo_items`` attribute)
+get it from ``grouped_view``. Header rows only depend on the language, so they
+are built once per language and shared by every list.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import asdict
+from functools import cache
+from typing import Any
+
+from homeassistant.components.todo import TodoItem, TodoItemStatus
+
+from .const import GROUP_FORTHCOMING, GROUP_NO_DUE_DATE, GROUP_THIS_WEEK
+
+# Header rows are marked by their summary, which the standard todo-list card shows as is
+HEADER_PREFIX = "--- "
+HEADER_SUFFIX = " ---"
+
+# Group labels by language, other languages use English
+_GROUP_LABELS: dict[str, dict[str, str]] = {
+    "en": {
+        GROUP_NO_DUE_DATE: "No due date",
+        GROUP_THIS_WEEK: "This week",
+        GROUP_FORTHCOMING: "Forthcoming",
+    },
+    "es": {
+        GROUP_NO_DUE_DATE: "Sin fecha de vencimiento",
+        GROUP_THIS_WEEK: "Esta semana",
+        GROUP_FORTHCOMING: "Próximamente",
+    },
+}
+
+
+def _label_language(language: str | None) -> str:
+    """Return the language group labels are shown in."""
+    if language and language.startswith("es"):
+        return "es"
+    return "en"
+
+
+def group_label(group: str, language: str | None) -> str:
+    """Return the translated label of a group."""
+    return _GROUP_LABELS[_label_language(language)].get(group, group)
+
+
+def is_header_summary(summary: str | None) -> bool:
+    """Return True if a summary is a header row, as stored by older versions."""
+    return bool(summary and summary.startswith(HEADER_PREFIX) and summary.endswith(HEADER_SUFFIX))
+
+
+@cache
+def _header_rows(language: str) -> dict[str, dict[str, Any]]:
+    """Return the header row of each group for a label language."""
+    return {
+        group: asdict(
+            TodoItem(
+                uid=f"header_{group}",
+                summary=f"{HEADER_PREFIX}{label}{HEADER_SUFFIX}",
+                status=TodoItemStatus.NEEDS_ACTION,
+            )
+        )
+        for group, label in _GROUP_LABELS[language].items()
+    }
+
+
+def grouped_view(
+    groups: Iterable[tuple[str, list[str]]],
+    rows: Callable[[list[str]], Iterable[dict[str, Any]]],
+    language: str | None,
+) -> list[dict[str, Any]]:
+    """Return the rows of each group of tasks, each group after its header row.
+
+    groups are (group, uids) pairs in display order, and rows returns the
+    serialized tasks of a list of uids.
+    """
+    headers = _header_rows(_label_language(language))
+    result: list[dict[str, Any]] = []
+    for group, uids in groups:
+        result.append(headers[group])
+        result.extend(rows(uids))
+    return result
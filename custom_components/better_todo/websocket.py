@@ -0,0 +1,132 @@
+"""Websocket API for Better ToDo integration.
+
+Frontend cards use these commands instead of reading the task list from the
+entity state attributes:
+- better_todo/items/get: Return every task of a list once
+- better_todo/items/subscribe: Send a snapshot, then per-item changes
+  (add/update/remove/move/recurrence) as they happen
+
+The panel and the dashboard card find the lists with these commands instead of
+scanning every entity state:
+- better_todo/lists/get: Return the list catalog (entity_id, name and
+  active_tasks of every list)
+- better_todo/lists/subscribe: Send the catalog, then add/update/remove
+  changes when a list is added, removed, renamed or its active count changes
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import SIGNAL_ITEMS_UPDATED, SIGNAL_LISTS_UPDATED
+from .runtime import async_get_list_registry
+
+if TYPE_CHECKING:
+    from .todo import BetterTodoEntity
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the Better ToDo websocket commands."""
+    websocket_api.async_register_command(hass, websocket_get_items)
+    websocket_api.async_register_command(hass, websocket_subscribe_items)
+    websocket_api.async_register_command(hass, websocket_get_lists)
+    websocket_api.async_register_command(hass, websocket_subscribe_lists)
+
+
+def _get_entity(hass: HomeAssistant, entity_id: str) -> BetterTodoEntity | None:
+    """Find a Better ToDo entity by entity_id."""
+    return async_get_list_registry(hass).get(entity_id)  # type: ignore[no-any-return]
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "better_todo/items/get",
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def websocket_get_items(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the tasks of a Better ToDo list."""
+    entity = _get_entity(hass, msg["entity_id"])
+    if entity is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"Entity {msg['entity_id']} not found"
+        )
+        return
+
+    connection.send_result(msg["id"], entity.items_snapshot())
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "better_todo/items/subscribe",
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def websocket_subscribe_items(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to per-item changes of a Better ToDo list."""
+    entity = _get_entity(hass, msg["entity_id"])
+    if entity is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"Entity {msg['entity_id']} not found"
+        )
+        return
+
+    @callback
+    def _forward_change(change: dict[str, Any]) -> None:
+        """Forward an item change to the client."""
+        connection.send_message(websocket_api.event_message(msg["id"], change))
+
+    # Subscribe by config entry so the subscription survives list reloads and renames
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_ITEMS_UPDATED.format(entity.unique_id), _forward_change
+    )
+    connection.send_result(msg["id"])
+    _forward_change({"type": "snapshot", **entity.items_snapshot()})
+
+
+@websocket_api.websocket_command({vol.Required("type"): "better_todo/lists/get"})
+@callback
+def websocket_get_lists(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the Better ToDo list catalog."""
+    connection.send_result(msg["id"], {"lists": async_get_list_registry(hass).catalog()})
+
+
+@websocket_api.websocket_command({vol.Required("type"): "better_todo/lists/subscribe"})
+@callback
+def websocket_subscribe_lists(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to the Better ToDo list catalog."""
+
+    @callback
+    def _forward_change(change: dict[str, Any]) -> None:
+        """Forward a catalog change to the client."""
+        connection.send_message(websocket_api.event_message(msg["id"], change))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_LISTS_UPDATED, _forward_change
+    )
+    connection.send_result(msg["id"])
+    _forward_change({"type": "snapshot", "lists": async_get_list_registry(hass).catalog()})
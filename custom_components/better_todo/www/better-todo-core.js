@@ -0,0 +1,1049 @@
+/**
+ * Better ToDo Core
+ *
+ * Shared module imported by the Better ToDo cards and panel.
+ *
+ * Tasks are no longer published in the entity state attributes. Instead, the
+ * cards subscribe to the better_todo/items/subscribe websocket command, which
+ * sends a snapshot of the list followed by per-item changes:
+ * - snapshot: { items, recurrence_data, week }
+ * - add: { item, previous_uid }
+ * - update: { item }
+ * - remove: { uids }
+ * - move: { uid, previous_uid }
+ * - recurrence: { uid, data }
+ * - week: { start, end } when a new week starts or the language changes, so
+ *   cards regroup even if no task changed
+ *
+ * The lists themselves come from the better_todo/lists/subscribe websocket
+ * command, so the panel and cards never scan every entity state. It sends
+ * the catalog, then a change when a list is added, removed, renamed or its
+ * active count changes:
+ * - snapshot: { lists } with { entity_id, name, active_tasks } per list
+ * - add: { list }
+ * - update: { entity_id, list } where entity_id is the list's previous one
+ * - remove: { entity_id }
+ *
+ * VirtualList renders long task lists by only creating the rows that are
+ * visible in their scroll container.
+ *
+ * The grouping, sorting, task dialog and service calls shared by the cards
+ * and panel live here too, so browsers download and compile them once.
+ * groupItems and splitItems are memoized per subscription version, so a
+ * render that follows an unrelated update reuses the previous result.
+ */
+
+export const BETTER_TODO_CORE_VERSION = "1.4.0";
+
+// Completed tasks shown per page when the Completed section is expanded
+export const COMPLETED_PAGE_SIZE = 50;
+
+/**
+ * Insert an item after the item with the given uid
+ * @param {Array} items - Items in list order (modified in place)
+ * @param {Object} item - Item to insert
+ * @param {string|null} previousUid - UID to insert after, null for the start
+ */
+function insertAfter(items, item, previousUid) {
+  if (previousUid === null || previousUid === undefined) {
+    items.unshift(item);
+    return;
+  }
+  const index = items.findIndex(i => i.uid === previousUid);
+  if (index === -1) {
+    items.push(item);
+  } else {
+    items.splice(index + 1, 0, item);
+  }
+}
+
+/**
+ * Keeps a local copy of one list's tasks in sync with the backend
+ *
+ * Usage:
+ *   this._tasks = new TodoItemsSubscription(() => this.render());
+ *   this._tasks.connect(hass, 'better_todo.tasks');
+ *   ... this._tasks.items, this._tasks.recurrenceData ...
+ *   this._tasks.disconnect();
+ */
+export class TodoItemsSubscription {
+  constructor(onChange) {
+    this._onChange = onChange;
+    this._entityId = null;
+    this._unsubscribe = null;
+    this.items = [];
+    this.recurrenceData = {};
+    this.week = null;
+    this.loaded = false;
+    // Incremented on every change of the local copy, memoized views key on it
+    this.version = 0;
+  }
+
+  get entityId() {
+    return this._entityId;
+  }
+
+  /**
+   * Subscribe to an entity, unless already subscribed to it
+   * @param {Object} hass - Home Assistant object
+   * @param {string} entityId - Better ToDo entity ID
+   */
+  connect(hass, entityId) {
+    if (!hass?.connection || !entityId) return;
+    if (this._unsubscribe && this._entityId === entityId) return;
+
+    this.disconnect();
+    this._entityId = entityId;
+    this._unsubscribe = hass.connection.subscribeMessage(
+      (event) => this._handleEvent(event),
+      { type: 'better_todo/items/subscribe', entity_id: entityId }
+    );
+    this._unsubscribe.catch((err) => {
+      console.error('[Better ToDo] Failed to subscribe to', entityId, err);
+      this._unsubscribe = null;
+    });
+  }
+
+  /**
+   * Stop receiving changes and forget the local copy
+   */
+  disconnect() {
+    if (this._unsubscribe) {
+      this._unsubscribe.then(unsub => unsub()).catch(() => {});
+      this._unsubscribe = null;
+    }
+    this._entityId = null;
+    this.items = [];
+    this.recurrenceData = {};
+    this.week = null;
+    this.loaded = false;
+    this.version += 1;
+  }
+
+  /**
+   * Find a task by uid
+   * @param {string} uid - Task UID
+   * @returns {Object|undefined}
+   */
+  getItem(uid) {
+    return this.items.find(i => i.uid === uid);
+  }
+
+  _handleEvent(event) {
+    switch (event.type) {
+      case 'snapshot':
+        this.items = event.items || [];
+        this.recurrenceData = event.recurrence_data || {};
+        this.week = event.week || null;
+        this.loaded = true;
+        break;
+      case 'add':
+        insertAfter(this.items, event.item, event.previous_uid);
+        break;
+      case 'update': {
+        const index = this.items.findIndex(i => i.uid === event.item.uid);
+        if (index !== -1) {
+          this.items[index] = event.item;
+        }
+        break;
+      }
+      case 'remove': {
+        const uids = new Set(event.uids);
+        this.items = this.items.filter(i => !uids.has(i.uid));
+        uids.forEach(uid => delete this.recurrenceData[uid]);
+        break;
+      }
+      case 'move': {
+        const index = this.items.findIndex(i => i.uid === event.uid);
+        if (index !== -1) {
+          const [item] = this.items.splice(index, 1);
+          insertAfter(this.items, item, event.previous_uid);
+        }
+        break;
+      }
+      case 'recurrence':
+        if (event.data) {
+          this.recurrenceData[event.uid] = event.data;
+        } else {
+          delete this.recurrenceData[event.uid];
+        }
+        break;
+      case 'week':
+        this.week = { start: event.start, end: event.end };
+        break;
+      default:
+        return;
+    }
+    this.version += 1;
+    this._onChange(this, event);
+  }
+}
+
+/**
+ * Keeps a local copy of the Better ToDo list catalog in sync with the backend
+ *
+ * Usage:
+ *   this._lists = new ListCatalogSubscription(() => this.render());
+ *   this._lists.connect(hass);
+ *   ... this._lists.lists, this._lists.getList(entityId) ...
+ *   this._lists.disconnect();
+ */
+export class ListCatalogSubscription {
+  constructor(onChange) {
+    this._onChange = onChange;
+    this._unsubscribe = null;
+    // Catalog entries by entity ID
+    this._lists = new Map();
+    this.loaded = false;
+  }
+
+  /**
+   * Lists in catalog order (by entity ID)
+   * @returns {Array<Object>}
+   */
+  get lists() {
+    return Array.from(this._lists.values());
+  }
+
+  /**
+   * Subscribe to the catalog, unless already subscribed
+   * @param {Object} hass - Home Assistant object
+   */
+  connect(hass) {
+    if (!hass?.connection || this._unsubscribe) return;
+
+    this._unsubscribe = hass.connection.subscribeMessage(
+      (event) => this._handleEvent(event),
+      { type: 'better_todo/lists/subscribe' }
+    );
+    this._unsubscribe.catch((err) => {
+      console.error('[Better ToDo] Failed to subscribe to the list catalog', err);
+      this._unsubscribe = null;
+    });
+  }
+
+  /**
+   * Stop receiving changes and forget the local copy
+   */
+  disconnect() {
+    if (this._unsubscribe) {
+      this._unsubscribe.then(unsub => unsub()).catch(() => {});
+      this._unsubscribe = null;
+    }
+    this._lists = new Map();
+    this.loaded = false;
+  }
+
+  /**
+   * Find a list by entity ID
+   * @param {string} entityId - Better ToDo entity ID
+   * @returns {Object|undefined} - { entity_id, name, active_tasks }
+   */
+  getList(entityId) {
+    return this._lists.get(entityId);
+  }
+
+  _handleEvent(event) {
+    switch (event.type) {
+      case 'snapshot':
+        this._lists = new Map(event.lists.map(list => [list.entity_id, list]));
+        this.loaded = true;
+        break;
+      case 'add':
+      case 'update':
+        this._lists.delete(event.entity_id);
+        this._lists.set(event.list.entity_id, event.list);
+        this._lists = new Map(
+          Array.from(this._lists).sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0))
+        );
+        break;
+      case 'remove':
+        this._lists.delete(event.entity_id);
+        break;
+      default:
+        return;
+    }
+    this._onChange(this, event);
+  }
+}
+
+/**
+ * Make the children of a container the given nodes, in this order
+ * Nodes already in place are not touched, other nodes are moved or removed.
+ * @param {HTMLElement} container - Parent element
+ * @param {Array<Node>} nodes - Desired children
+ */
+export function placeChildren(container, nodes) {
+  let current = container.firstChild;
+  for (const node of nodes) {
+    if (node === current) {
+      current = current.nextSibling;
+    } else {
+      container.insertBefore(node, current);
+    }
+  }
+  while (current) {
+    const next = current.nextSibling;
+    container.removeChild(current);
+    current = next;
+  }
+}
+
+/**
+ * Check whether two tasks would render the same
+ * @param {Object} a - Task
+ * @param {Object} b - Task
+ * @returns {boolean}
+ */
+export function sameTask(a, b) {
+  return a.uid === b.uid
+    && a.summary === b.summary
+    && a.description === b.description
+    && a.due === b.due
+    && a.status === b.status;
+}
+
+/**
+ * Renders the visible rows of a long list of tasks
+ *
+ * Only the rows inside the scroll container's viewport, plus a few rows of
+ * overscan on each side, exist in the DOM. Two spacers stand in for the rows
+ * above and below. Row heights are estimated until a row has been rendered
+ * and measured. Rows keep one node per task uid and are only patched when
+ * their task changed.
+ *
+ * Usage:
+ *   this._list = new VirtualList(container, {
+ *     createRow: () => document.createElement('div'),
+ *     patchRow: (node, item) => { node.textContent = item.summary; },
+ *   });
+ *   this._list.attach(scroller);
+ *   this._list.setItems(items);
+ *   this._list.detach();
+ */
+export class VirtualList {
+  /**
+   * @param {HTMLElement} container - Element the rows are rendered into
+   * @param {Object} options - createRow(item), patchRow(node, item),
+   *   estimatedHeight (px, default 48) and overscan (rows, default 8)
+   */
+  constructor(container, options) {
+    this._container = container;
+    this._createRow = options.createRow;
+    this._patchRow = options.patchRow;
+    this._estimatedHeight = options.estimatedHeight || 48;
+    this._overscan = options.overscan ?? 8;
+    this._topSpacer = document.createElement('div');
+    this._bottomSpacer = document.createElement('div');
+    this._items = [];
+    // Rendered rows by uid: { node, item }
+    this._rows = new Map();
+    // Measured row heights by uid
+    this._heights = new Map();
+    this._scroller = null;
+    this._resizeObserver = null;
+    this._frame = null;
+    this._onScroll = () => this._schedule();
+  }
+
+  /**
+   * Follow the scroll position of an element, or of the window without one
+   * @param {HTMLElement|null} scroller - Scroll container of the list
+   */
+  attach(scroller) {
+    this.detach();
+    this._scroller = scroller;
+    (scroller || window).addEventListener('scroll', this._onScroll, { passive: true });
+    window.addEventListener('resize', this._onScroll);
+    if (scroller && window.ResizeObserver) {
+      // Also covers the scroller becoming visible, e.g. when a tab is shown
+      this._resizeObserver = new ResizeObserver(this._onScroll);
+      this._resizeObserver.observe(scroller);
+    }
+    this._schedule();
+  }
+
+  /**
+   * Stop following the scroll position
+   */
+  detach() {
+    (this._scroller || window).removeEventListener('scroll', this._onScroll);
+    window.removeEventListener('resize', this._onScroll);
+    if (this._resizeObserver) {
+      this._resizeObserver.disconnect();
+      this._resizeObserver = null;
+    }
+    if (this._frame !== null) {
+      cancelAnimationFrame(this._frame);
+      this._frame = null;
+    }
+    this._scroller = null;
+  }
+
+  /**
+   * Show a new list of tasks, rendering the visible rows right away
+   * @param {Array} items - Tasks in display order
+   */
+  setItems(items) {
+    this._items = items;
+    if (this._heights.size > 2 * items.length + 100) {
+      const uids = new Set(items.map(item => item.uid));
+      this._heights.forEach((height, uid) => {
+        if (!uids.has(uid)) this._heights.delete(uid);
+      });
+    }
+    this._render();
+  }
+
+  _schedule() {
+    if (this._frame !== null) return;
+    this._frame = requestAnimationFrame(() => {
+      this._frame = null;
+      this._render();
+    });
+  }
+
+  /**
+   * Return the part of the list, in px from its top, that is on screen
+   */
+  _viewport() {
+    const containerTop = this._container.getBoundingClientRect().top;
+    if (!this._scroller) {
+      return { top: -containerTop, height: window.innerHeight };
+    }
+    const scrollerTop = this._scroller.getBoundingClientRect().top;
+    return { top: scrollerTop - containerTop, height: this._scroller.clientHeight };
+  }
+
+  _render() {
+    const items = this._items;
+    const heights = items.map(item => this._heights.get(item.uid) ?? this._estimatedHeight);
+    const viewport = this._viewport();
+
+    // First and last rows on screen
+    let start = 0;
+    let top = 0;
+    while (start < items.length && top + heights[start] <= viewport.top) {
+      top += heights[start];
+      start += 1;
+    }
+    let end = start;
+    let bottom = top;
+    while (end < items.length && bottom < viewport.top + viewport.height) {
+      bottom += heights[end];
+      end += 1;
+    }
+
+    // Add the overscan rows
+    const first = Math.max(0, start - this._overscan);
+    for (let i = first; i < start; i += 1) {
+      top -= heights[i];
+    }
+    const last = Math.min(items.length, end + this._overscan);
+    let after = 0;
+    for (let i = last; i < items.length; i += 1) {
+      after += heights[i];
+    }
+
+    const rows = new Map();
+    const nodes = [this._topSpacer];
+    for (let i = first; i < last; i += 1) {
+      const item = items[i];
+      let row = this._rows.get(item.uid);
+      if (!row) {
+        row = { node: this._createRow(item), item: null };
+      }
+      if (!row.item || !sameTask(row.item, item)) {
+        this._patchRow(row.node, item);
+      }
+      row.item = item;
+      rows.set(item.uid, row);
+      nodes.push(row.node);
+    }
+    nodes.push(this._bottomSpacer);
+
+    this._topSpacer.style.height = `${top}px`;
+    this._bottomSpacer.style.height = `${after}px`;
+    placeChildren(this._container, nodes);
+    this._rows = rows;
+
+    // Measure the rendered rows, and render again if the estimates were off
+    let remeasured = false;
+    for (let i = first; i < last; i += 1) {
+      const uid = items[i].uid;
+      const height = rows.get(uid).node.offsetHeight;
+      if (height && height !== heights[i]) {
+        this._heights.set(uid, height);
+        remeasured = true;
+      }
+    }
+    if (remeasured) {
+      this._schedule();
+    }
+  }
+}
+
+// Group labels by language, other languages use English
+const GROUP_LABELS = {
+  en: {
+    no_due_date: 'No due date',
+    this_week: 'This week',
+    forthcoming: 'Forthcoming',
+    completed: 'Completed'
+  },
+  es: {
+    no_due_date: 'Sin fecha de vencimiento',
+    this_week: 'Esta semana',
+    forthcoming: 'Próximamente',
+    completed: 'Completadas'
+  }
+};
+
+// Last result of each memoized view, by subscription: { key, value }
+const splitCache = new WeakMap();
+const groupCache = new WeakMap();
+
+/**
+ * Return a value computed once per key, recomputing it when the key changes
+ * @param {WeakMap} cache - Cache of the view
+ * @param {Object} tasks - TodoItemsSubscription
+ * @param {string} key - Everything the value depends on
+ * @param {Function} compute - Computes the value
+ */
+function memoized(cache, tasks, key, compute) {
+  const cached = cache.get(tasks);
+  if (cached && cached.key === key) {
+    return cached.value;
+  }
+  const value = compute();
+  cache.set(tasks, { key, value });
+  return value;
+}
+
+/**
+ * Escape HTML to prevent XSS
+ * @param {string} text - Text to escape
+ * @returns {string}
+ */
+export function escapeHtml(text) {
+  const div = document.createElement('div');
+  div.textContent = text;
+  return div.innerHTML;
+}
+
+/**
+ * Get translated label for a group
+ * @param {string} group - Group key
+ * @param {string} language - Home Assistant language
+ * @returns {string} - Translated label
+ */
+export function groupLabel(group, language) {
+  const lang = (language || 'en').startsWith('es') ? 'es' : 'en';
+  return GROUP_LABELS[lang][group] || group;
+}
+
+/**
+ * Format due date for display
+ * @param {string} due - Due date string
+ * @param {string} language - Home Assistant language
+ * @returns {string} - Formatted date
+ */
+export function formatDueDate(due, language) {
+  if (!due) return '';
+  try {
+    const date = new Date(due);
+    return date.toLocaleDateString(language, {
+      month: 'short',
+      day: 'numeric'
+    });
+  } catch (e) {
+    return due;
+  }
+}
+
+/**
+ * Compare tasks by due date, tasks without one last
+ * Due dates are YYYY-MM-DD strings, which sort as dates.
+ */
+function compareDue(a, b) {
+  if (!a.due) return b.due ? 1 : 0;
+  if (!b.due) return -1;
+  return a.due < b.due ? -1 : a.due > b.due ? 1 : 0;
+}
+
+/**
+ * Split a list's tasks into active and completed ones, in list order
+ * @param {TodoItemsSubscription} tasks - Subscription of the list
+ * @returns {Object} - { active, completed }
+ */
+export function splitItems(tasks) {
+  return memoized(splitCache, tasks, String(tasks.version), () => {
+    const active = [];
+    const completed = [];
+    tasks.items.forEach(item => {
+      (item.status === 'completed' ? completed : active).push(item);
+    });
+    return { active, completed };
+  });
+}
+
+/**
+ * Group a list's tasks and sort each group by due date
+ * Dated tasks are in this week when their due date is inside the week sent
+ * by the backend, which follows the Home Assistant language and time zone.
+ * @param {TodoItemsSubscription} tasks - Subscription of the list
+ * @returns {Object} - { no_due_date, this_week, forthcoming, completed }
+ */
+export function groupItems(tasks) {
+  const week = tasks.week;
+  const key = `${tasks.version}/${week?.start}/${week?.end}`;
+  return memoized(groupCache, tasks, key, () => {
+    const groups = {
+      no_due_date: [],
+      this_week: [],
+      forthcoming: [],
+      completed: []
+    };
+    tasks.items.forEach(item => {
+      if (item.status === 'completed') {
+        groups.completed.push(item);
+      } else if (!item.due) {
+        groups.no_due_date.push(item);
+      } else {
+        const due = item.due.slice(0, 10);
+        const inWeek = week && due >= week.start && due <= week.end;
+        groups[inWeek ? 'this_week' : 'forthcoming'].push(item);
+      }
+    });
+    // Sorting is stable, so tasks with the same due date keep the list order
+    groups.this_week.sort(compareDue);
+    groups.forthcoming.sort(compareDue);
+    groups.completed.sort(compareDue);
+    return groups;
+  });
+}
+
+/**
+ * Render a group of tasks after its header, nothing for an empty group
+ * @param {string} group - Group key
+ * @param {Array} items - Tasks of the group
+ * @param {string} language - Home Assistant language
+ * @returns {string} - HTML string
+ */
+export function renderGroup(group, items, language) {
+  if (items.length === 0) {
+    return '';
+  }
+  
+  const itemsHtml = items.map(item => renderItem(item, language)).join('');
+  
+  return `
+    <div class="header" role="separator">
+      <h2>${escapeHtml(groupLabel(group, language))}</h2>
+    </div>
+    ${itemsHtml}
+  `;
+}
+
+/**
+ * Render a task using Home Assistant's check list item
+ * @param {Object} item - Task
+ * @param {string} language - Home Assistant language
+ * @returns {string} - HTML string
+ */
+export function renderItem(item, language) {
+  const checked = item.status === 'completed' ? 'checked' : '';
+  const dueDate = formatDueDate(item.due, language);
+  const dueHtml = dueDate ? `<div class="secondary">${escapeHtml(dueDate)}</div>` : '';
+  
+  return `
+    <ha-check-list-item data-uid="${escapeHtml(item.uid)}">
+      <ha-checkbox 
+        slot="start"
+        ${checked}
+        data-uid="${escapeHtml(item.uid)}"
+      ></ha-checkbox>
+      <div>
+        <div>${escapeHtml(item.summary)}</div>
+        ${dueHtml}
+      </div>
+    </ha-check-list-item>
+  `;
+}
+
+/**
+ * Mark a task as completed or not
+ * @param {Object} hass - Home Assistant object
+ * @param {string} entityId - Better ToDo entity ID
+ * @param {string} uid - Task UID
+ * @param {boolean} completed - New status
+ * @returns {Promise}
+ */
+export function setTaskStatus(hass, entityId, uid, completed) {
+  return hass.callService('better_todo', 'update_task', {
+    entity_id: entityId,
+    uid: uid,
+    status: completed ? 'completed' : 'needs_action'
+  });
+}
+
+/**
+ * Open the task creation/edit dialog
+ * @param {Object} hass - Home Assistant object
+ * @param {Object|null} item - Task to edit, or null for a new task
+ * @param {Object|null} recurrenceData - Recurrence settings of the task
+ * @param {Function} onSave - Called with the form element when saved
+ */
+export function openTaskDialog(hass, item, recurrenceData, onSave) {
+  const isEdit = item !== null;
+  const language = hass.language || 'en';
+  const isSpanish = language.startsWith('es');
+  
+  // Create dialog
+  const dialog = document.createElement('ha-dialog');
+  dialog.heading = isSpanish 
+    ? (isEdit ? 'Editar tarea' : 'Nueva tarea')
+    : (isEdit ? 'Edit Task' : 'New Task');
+  
+  const content = document.createElement('div');
+  content.style.padding = '16px';
+  
+  // Build form HTML
+  content.innerHTML = `
+    <style>
+      .form-row {
+        margin-bottom: 16px;
+      }
+      .form-row label {
+        display: block;
+        margin-bottom: 4px;
+        font-weight: 500;
+      }
+      .form-row input[type="text"],
+      .form-row input[type="date"],
+      .form-row input[type="number"],
+      .form-row textarea,
+      .form-row select {
+        width: 100%;
+        padding: 8px;
+        border: 1px solid var(--divider-color);
+        border-radius: 4px;
+        background-color: var(--card-background-color);
+        color: var(--primary-text-color);
+        font-family: inherit;
+        font-size: 14px;
+      }
+      .form-row textarea {
+        min-height: 80px;
+        resize: vertical;
+      }
+      .checkbox-row {
+        display: flex;
+        align-items: center;
+        margin-bottom: 16px;
+      }
+      .checkbox-row input[type="checkbox"] {
+        margin-right: 8px;
+      }
+      .section-title {
+        font-weight: 600;
+        margin-top: 20px;
+        margin-bottom: 12px;
+        padding-bottom: 8px;
+        border-bottom: 1px solid var(--divider-color);
+      }
+      .inline-fields {
+        display: flex;
+        gap: 12px;
+      }
+      .inline-fields .form-row {
+        flex: 1;
+      }
+      .radio-group {
+        margin-left: 24px;
+        padding: 8px;
+        background-color: var(--secondary-background-color);
+        border-radius: 4px;
+      }
+      .radio-option {
+        display: flex;
+        align-items: center;
+        margin-bottom: 8px;
+      }
+      .radio-option input[type="radio"] {
+        margin-right: 8px;
+      }
+      .radio-option label {
+        margin: 0 8px 0 0;
+        min-width: 80px;
+      }
+      .disabled {
+        opacity: 0.5;
+        pointer-events: none;
+      }
+    </style>
+    
+    <div class="checkbox-row">
+      <input type="checkbox" id="task-status" ${isEdit && item.status === 'completed' ? 'checked' : ''}>
+      <label for="task-status">${isSpanish ? 'Tarea completada' : 'Task completed'}</label>
+    </div>
+    
+    <div class="form-row">
+      <label for="task-summary">${isSpanish ? 'Nombre de la tarea' : 'Task name'} *</label>
+      <input type="text" id="task-summary" value="${isEdit ? escapeHtml(item.summary) : ''}" required>
+    </div>
+    
+    <div class="form-row">
+      <label for="task-description">${isSpanish ? 'Descripción' : 'Description'}</label>
+      <textarea id="task-description">${isEdit && item.description ? escapeHtml(item.description) : ''}</textarea>
+    </div>
+    
+    <div class="form-row">
+      <label for="task-due">${isSpanish ? 'Fecha de vencimiento' : 'Due date'}</label>
+      <input type="date" id="task-due" value="${isEdit && item.due ? item.due : ''}">
+    </div>
+    
+    <div class="section-title">${isSpanish ? 'Repetición' : 'Recurrence'}</div>
+    
+    <div class="checkbox-row">
+      <input type="checkbox" id="recurrence-enabled" ${recurrenceData?.recurrence_enabled ? 'checked' : ''}>
+      <label for="recurrence-enabled">${isSpanish ? 'Activar repetición' : 'Enable recurrence'}</label>
+    </div>
+    
+    <div id="recurrence-settings" class="${recurrenceData?.recurrence_enabled ? '' : 'disabled'}">
+      <div class="inline-fields">
+        <div class="form-row">
+          <label for="recurrence-interval">${isSpanish ? 'Cada' : 'Every'}</label>
+          <input type="number" id="recurrence-interval" min="1" max="365" value="${recurrenceData?.recurrence_interval || 1}">
+        </div>
+        <div class="form-row">
+          <label for="recurrence-unit">${isSpanish ? 'Unidad' : 'Unit'}</label>
+          <select id="recurrence-unit">
+            <option value="days" ${recurrenceData?.recurrence_unit === 'days' || !recurrenceData ? 'selected' : ''}>${isSpanish ? 'días' : 'days'}</option>
+            <option value="weeks" ${recurrenceData?.recurrence_unit === 'weeks' ? 'selected' : ''}>${isSpanish ? 'semanas' : 'weeks'}</option>
+            <option value="months" ${recurrenceData?.recurrence_unit === 'months' ? 'selected' : ''}>${isSpanish ? 'meses' : 'months'}</option>
+            <option value="years" ${recurrenceData?.recurrence_unit === 'years' ? 'selected' : ''}>${isSpanish ? 'años' : 'years'}</option>
+          </select>
+        </div>
+      </div>
+    </div>
+    
+    <div class="section-title">${isSpanish ? 'Detener repetición' : 'Stop recurrence'}</div>
+    
+    <div class="checkbox-row">
+      <input type="checkbox" id="recurrence-end-enabled" ${recurrenceData?.recurrence_end_enabled ? 'checked' : ''}>
+      <label for="recurrence-end-enabled">${isSpanish ? 'Activar límite de repetición' : 'Enable recurrence limit'}</label>
+    </div>
+    
+    <div id="recurrence-end-settings" class="${recurrenceData?.recurrence_end_enabled ? '' : 'disabled'}">
+      <div class="radio-group">
+        <div class="radio-option">
+          <input type="radio" id="end-type-count" name="end-type" value="count" 
+            ${!recurrenceData?.recurrence_end_type || recurrenceData?.recurrence_end_type === 'count' ? 'checked' : ''}>
+          <label for="end-type-count">${isSpanish ? 'Después de' : 'After'}</label>
+          <input type="number" id="recurrence-end-count" min="1" max="999" value="${recurrenceData?.recurrence_end_count || 1}" 
+            style="width: 100px; margin-right: 8px;">
+          <span>${isSpanish ? 'repeticiones' : 'repetitions'}</span>
+        </div>
+        <div class="radio-option">
+          <input type="radio" id="end-type-date" name="end-type" value="date"
+            ${recurrenceData?.recurrence_end_type === 'date' ? 'checked' : ''}>
+          <label for="end-type-date">${isSpanish ? 'Hasta' : 'Until'}</label>
+          <input type="date" id="recurrence-end-date" value="${recurrenceData?.recurrence_end_date || ''}" style="flex: 1;">
+        </div>
+      </div>
+    </div>
+  `;
+  
+  dialog.appendChild(content);
+  
+  // Add event listeners for checkbox toggles
+  const recurrenceEnabledCheckbox = content.querySelector('#recurrence-enabled');
+  const recurrenceSettings = content.querySelector('#recurrence-settings');
+  const recurrenceEndEnabledCheckbox = content.querySelector('#recurrence-end-enabled');
+  const recurrenceEndSettings = content.querySelector('#recurrence-end-settings');
+  
+  recurrenceEnabledCheckbox.addEventListener('change', (e) => {
+    if (e.target.checked) {
+      recurrenceSettings.classList.remove('disabled');
+    } else {
+      recurrenceSettings.classList.add('disabled');
+    }
+  });
+  
+  recurrenceEndEnabledCheckbox.addEventListener('change', (e) => {
+    if (e.target.checked) {
+      recurrenceEndSettings.classList.remove('disabled');
+    } else {
+      recurrenceEndSettings.classList.add('disabled');
+    }
+  });
+  
+  // Add event listeners for radio buttons
+  const endCountInput = content.querySelector('#recurrence-end-count');
+  const endDateInput = content.querySelector('#recurrence-end-date');
+  const endTypeCountRadio = content.querySelector('#end-type-count');
+  const endTypeDateRadio = content.querySelector('#end-type-date');
+  
+  endCountInput.addEventListener('focus', () => {
+    endTypeCountRadio.checked = true;
+  });
+  
+  endDateInput.addEventListener('focus', () => {
+    endTypeDateRadio.checked = true;
+  });
+  
+  // Set dialog properties
+  dialog.setAttribute('open', '');
+  dialog.setAttribute('scrimClickAction', '');
+  dialog.setAttribute('escapeKeyAction', '');
+  
+  // Add action buttons
+  const actionsDiv = document.createElement('div');
+  actionsDiv.slot = 'primaryAction';
+  actionsDiv.innerHTML = `
+    <mwc-button>
+      ${isSpanish ? 'Guardar' : 'Save'}
+    </mwc-button>
+  `;
+  dialog.appendChild(actionsDiv);
+  
+  const secondaryActionsDiv = document.createElement('div');
+  secondaryActionsDiv.slot = 'secondaryAction';
+  secondaryActionsDiv.innerHTML = `
+    <mwc-button>
+      ${isSpanish ? 'Cancelar' : 'Cancel'}
+    </mwc-button>
+  `;
+  dialog.appendChild(secondaryActionsDiv);
+  
+  // Append to body
+  document.body.appendChild(dialog);
+  
+  // Setup button handlers
+  const saveButton = dialog.querySelector('[slot="primaryAction"] mwc-button');
+  const cancelButton = dialog.querySelector('[slot="secondaryAction"] mwc-button');
+  
+  saveButton.addEventListener('click', () => {
+    onSave(content);
+    dialog.close();
+  });
+  
+  cancelButton.addEventListener('click', () => {
+    dialog.close();
+  });
+  
+  // Remove dialog when closed
+  dialog.addEventListener('closed', () => {
+    dialog.remove();
+  });
+}
+
+
+/**
+ * Create or update a task from the task dialog form
+ * @param {Object} hass - Home Assistant object
+ * @param {string} entityId - Better ToDo entity ID
+ * @param {Object|null} item - Task being edited, or null for a new task
+ * @param {HTMLElement} content - Form element of the dialog
+ * @param {Function} notify - Shows an error message, alert() by default
+ */
+export async function saveTask(hass, entityId, item, content, notify = message => alert(message)) {
+  const isEdit = item !== null;
+  
+  // Get form values
+  const status = content.querySelector('#task-status').checked ? 'completed' : 'needs_action';
+  const summary = content.querySelector('#task-summary').value.trim();
+  const description = content.querySelector('#task-description').value.trim();
+  const due = content.querySelector('#task-due').value;
+  
+  // Validate
+  if (!summary) {
+    notify(hass.language?.startsWith('es') ? 'El nombre de la tarea es obligatorio' : 'Task name is required');
+    return;
+  }
+  
+  // Get recurrence values
+  const recurrenceEnabled = content.querySelector('#recurrence-enabled').checked;
+  const recurrenceInterval = parseInt(content.querySelector('#recurrence-interval').value) || 1;
+  const recurrenceUnit = content.querySelector('#recurrence-unit').value;
+  const recurrenceEndEnabled = content.querySelector('#recurrence-end-enabled').checked;
+  const endType = content.querySelector('input[name="end-type"]:checked').value;
+  const endCount = parseInt(content.querySelector('#recurrence-end-count').value) || 1;
+  const endDate = content.querySelector('#recurrence-end-date').value;
+  
+  try {
+    if (isEdit) {
+      // Update existing task
+      await hass.callService('better_todo', 'update_task', {
+        entity_id: entityId,
+        uid: item.uid,
+        summary: summary,
+        description: description || null,
+        due: due || null,
+        status: status,
+      });
+      
+      // Set recurrence
+      if (recurrenceEnabled) {
+        const recurrenceData = {
+          entity_id: entityId,
+          task_uid: item.uid,
+          recurrence_enabled: true,
+          recurrence_interval: recurrenceInterval,
+          recurrence_unit: recurrenceUnit,
+          recurrence_end_enabled: recurrenceEndEnabled,
+        };
+        
+        if (recurrenceEndEnabled) {
+          recurrenceData.recurrence_end_type = endType;
+          if (endType === 'count') {
+            recurrenceData.recurrence_end_count = endCount;
+          } else {
+            recurrenceData.recurrence_end_date = endDate;
+          }
+        }
+        
+        await hass.callService('better_todo', 'set_task_recurrence', recurrenceData);
+      } else {
+        // Disable recurrence
+        await hass.callService('better_todo', 'set_task_recurrence', {
+          entity_id: entityId,
+          task_uid: item.uid,
+          recurrence_enabled: false,
+        });
+      }
+    } else {
+      // Create new task, with its recurrence in the same call so there is
+      // no need to look the new task up afterwards
+      const taskData = {
+        entity_id: entityId,
+        summary: summary,
+        description: description || undefined,
+        due: due || undefined,
+      };
+      
+      if (recurrenceEnabled) {
+        taskData.recurrence_enabled = true;
+        taskData.recurrence_interval = recurrenceInterval;
+        taskData.recurrence_unit = recurrenceUnit;
+        taskData.recurrence_end_enabled = recurrenceEndEnabled;
+        
+        if (recurrenceEndEnabled) {
+          taskData.recurrence_end_type = endType;
+          if (endType === 'count') {
+            taskData.recurrence_end_count = endCount;
+          } else {
+            taskData.recurrence_end_date = endDate;
+          }
+        }
+      }
+      
+      await hass.callService('better_todo', 'create_task', taskData);
+    }
+  } catch (error) {
+    console.error('[Better ToDo] Error saving task:', error);
+    notify(hass.language?.startsWith('es') ? 'Error al guardar la tarea' : 'Error saving task');
+  }
+}
+
@@ -5,8 +5,22 @@
  * Layout:
  * - Left section: List of all Better ToDo lists
  * - Right section: Tasks from the selected list with category headers
+ *
+ * Tasks of the selected list are received through the better_todo/items/subscribe
+ * websocket command, and the lists through better_todo/lists/subscribe.
  */
 
+import {
+  escapeHtml,
+  groupItems,
+  ListCatalogSubscription,
+  openTaskDialog,
+  renderGroup,
+  saveTask,
+  setTaskStatus,
+  TodoItemsSubscription,
+} from './better-todo-core.js';
+
 class BetterTodoDashboardCard extends HTMLElement {
   constructor() {
     super();
@@ -14,6 +28,25 @@ class BetterTodoDashboardCard extends HTMLElement {
     this._config = null;
     this._selectedEntity = null;
     this._cardElement = null;
+    this._tasks = new TodoItemsSubscription(() => this._updateCard());
+    // Lists come from the catalog subscription instead of hass.states
+    this._lists = new ListCatalogSubscription(() => this._updateCard());
+    // Language the card was last rendered in
+    this._language = null;
+  }
+
+  connectedCallback() {
+    if (this._hass) {
+      this._lists.connect(this._hass);
+    }
+    if (this._hass && this._selectedEntity) {
+      this._tasks.connect(this._hass, this._selectedEntity);
+    }
+  }
+
+  disconnectedCallback() {
+    this._lists.disconnect();
+    this._tasks.disconnect();
   }
 
   setConfig(config) {
@@ -24,7 +57,12 @@ class BetterTodoDashboardCard extends HTMLElement {
 
   set hass(hass) {
     this._hass = hass;
-    this._updateCard();
+    this._lists.connect(hass);
+    // Lists and tasks render when their subscriptions change, other state
+    // changes in Home Assistant only matter if the language changed
+    if (hass.language !== this._language) {
+      this._updateCard();
+    }
   }
 
   _createCard() {
@@ -36,192 +74,13 @@ class BetterTodoDashboardCard extends HTMLElement {
 
   /**
    * Get all Better ToDo entities
-   * Note: This filters for all better_todo.* entities.
-   * Better ToDo entities now use their own domain to prevent appearing
-   * in other todo integrations' interfaces.
+   * Note: Better ToDo entities use their own domain to prevent appearing
+   * in other todo integrations' interfaces. The list catalog is sorted by
+   * entity ID.
    * @returns {Array} - Array of Better ToDo entity IDs
    */
   _getTodoEntities() {
-    if (!this._hass) return [];
-    
-    const entities = [];
-    Object.keys(this._hass.states).forEach(entityId => {
-      if (entityId.startsWith('better_todo.')) {
-        const state = this._hass.states[entityId];
-        // Check if this is a Better ToDo entity by looking for recurrence_data
-        if (state.attributes && state.attributes.recurrence_data !== undefined) {
-          entities.push(entityId);
-        }
-      }
-    });
-    
-    return entities.sort();
-  }
-
-  /**
-   * Get the start of the week based on locale
-   * Uses Intl.Locale when available for better locale detection
-   * @returns {number} 0 for Monday, 6 for Sunday
-   */
-  _getWeekStartDay() {
-    const language = this._hass.language || 'en';
-    
-    // Try to use Intl.Locale for better locale handling
-    try {
-      if (typeof Intl !== 'undefined' && Intl.Locale) {
-        const locale = new Intl.Locale(language);
-        // Check if weekInfo is available (newer browsers)
-        if (locale.weekInfo && locale.weekInfo.firstDay !== undefined) {
-          // weekInfo.firstDay: 1=Monday, 7=Sunday
-          return locale.weekInfo.firstDay === 7 ? 6 : 0;
-        }
-      }
-    } catch (e) {
-      // Fall back to hardcoded logic if Intl.Locale is not available
-    }
-    
-    // Fallback: US English traditionally starts on Sunday
-    const sundayFirstLocales = ['en-US', 'en_US'];
-    return sundayFirstLocales.includes(language) ? 6 : 0;
-  }
-
-  /**
-   * Calculate week boundaries
-   * @param {Date} now - Current date
-   * @returns {Object} - { start: Date, end: Date }
-   */
-  _getWeekBoundaries(now) {
-    const weekStart = this._getWeekStartDay();
-    const currentWeekday = now.getDay(); // 0=Sunday, 6=Saturday
-    
-    let daysToStart, daysToEnd;
-    
-    if (weekStart === 0) { // Week starts on Monday
-      const dayOfWeek = currentWeekday === 0 ? 6 : currentWeekday - 1;
-      daysToStart = dayOfWeek;
-      daysToEnd = 6 - dayOfWeek;
-    } else { // Week starts on Sunday
-      daysToStart = currentWeekday;
-      daysToEnd = 6 - currentWeekday;
-    }
-    
-    const start = new Date(now);
-    start.setDate(start.getDate() - daysToStart);
-    start.setHours(0, 0, 0, 0);
-    
-    const end = new Date(now);
-    end.setDate(end.getDate() + daysToEnd);
-    end.setHours(23, 59, 59, 999);
-    
-    return { start, end };
-  }
-
-  /**
-   * Get the group for a todo item
-   * @param {Object} item - Todo item
-   * @returns {string} - Group name
-   */
-  _getItemGroup(item) {
-    if (item.status === 'completed') {
-      return 'completed';
-    }
-    
-    if (!item.due) {
-      return 'no_due_date';
-    }
-    
-    try {
-      const dueDate = new Date(item.due);
-      const now = new Date();
-      now.setHours(0, 0, 0, 0);
-      
-      const weekBoundaries = this._getWeekBoundaries(now);
-      
-      if (dueDate >= weekBoundaries.start && dueDate <= weekBoundaries.end) {
-        return 'this_week';
-      } else {
-        return 'forthcoming';
-      }
-    } catch (e) {
-      return 'no_due_date';
-    }
-  }
-
-  /**
-   * Get translated label for a group
-   * @param {string} group - Group key
-   * @returns {string} - Translated label
-   */
-  _getGroupLabel(group) {
-    const language = this._hass.language || 'en';
-    
-    const labels = {
-      en: {
-        no_due_date: 'No due date',
-        this_week: 'This week',
-        forthcoming: 'Forthcoming',
-        completed: 'Completed'
-      },
-      es: {
-        no_due_date: 'Sin fecha de vencimiento',
-        this_week: 'Esta semana',
-        forthcoming: 'Próximamente',
-        completed: 'Completadas'
-      }
-    };
-    
-    const lang = language.startsWith('es') ? 'es' : 'en';
-    return labels[lang][group] || group;
-  }
-
-  /**
-   * Group and sort items
-   * @param {Array} items - Todo items
-   * @returns {Object} - Grouped items
-   */
-  _groupItems(items) {
-    const groups = {
-      no_due_date: [],
-      this_week: [],
-      forthcoming: [],
-      completed: []
-    };
-    
-    items.forEach(item => {
-      const group = this._getItemGroup(item);
-      if (groups[group]) {
-        groups[group].push(item);
-      }
-    });
-    
-    // Sort items within each group by due date
-    Object.keys(groups).forEach(group => {
-      groups[group].sort((a, b) => {
-        if (!a.due) return 1;
-        if (!b.due) return -1;
-        return new Date(a.due) - new Date(b.due);
-      });
-    });
-    
-    return groups;
-  }
-
-  /**
-   * Format due date for display
-   * @param {string} due - Due date string
-   * @returns {string} - Formatted date
-   */
-  _formatDueDate(due) {
-    if (!due) return '';
-    try {
-      const date = new Date(due);
-      return date.toLocaleDateString(this._hass.language, {
-        month: 'short',
-        day: 'numeric'
-      });
-    } catch (e) {
-      return due;
-    }
+    return this._lists.lists.map(list => list.entity_id);
   }
 
   /**
@@ -251,11 +110,7 @@ class BetterTodoDashboardCard extends HTMLElement {
     const entity = this._selectedEntity;
     
     try {
-      await this._hass.callService('todo', 'update_item', {
-        entity_id: entity,
-        item: uid,
-        status: completed ? 'completed' : 'needs_action'
-      });
+      await setTaskStatus(this._hass, entity, uid, completed);
     } catch (err) {
       console.error('Error updating todo item:', err);
       checkbox.checked = !completed;
@@ -273,11 +128,7 @@ class BetterTodoDashboardCard extends HTMLElement {
     if (!uid || !this._selectedEntity) return;
     
     // Find the item
-    const state = this._hass.states[this._selectedEntity];
-    if (!state) return;
-    
-    const items = state.attributes.items || [];
-    const item = items.find(i => i.uid === uid);
+    const item = this._tasks.getItem(uid);
     
     if (item) {
       this._openTaskDialog(item);
@@ -297,389 +148,22 @@ class BetterTodoDashboardCard extends HTMLElement {
    * @param {Object|null} item - Item to edit, or null for new item
    */
   _openTaskDialog(item) {
-    const isEdit = item !== null;
-    const language = this._hass.language || 'en';
-    const isSpanish = language.startsWith('es');
-    
-    // Get recurrence data for the item if editing
-    let recurrenceData = null;
-    if (isEdit) {
-      const state = this._hass.states[this._selectedEntity];
-      recurrenceData = state?.attributes?.recurrence_data?.[item.uid];
-    }
-    
-    // Create dialog
-    const dialog = document.createElement('ha-dialog');
-    dialog.heading = isSpanish 
-      ? (isEdit ? 'Editar tarea' : 'Nueva tarea')
-      : (isEdit ? 'Edit Task' : 'New Task');
-    
-    const content = document.createElement('div');
-    content.style.padding = '16px';
-    
-    // Build form HTML
-    content.innerHTML = `
-      <style>
-        .form-row {
-          margin-bottom: 16px;
-        }
-        .form-row label {
-          display: block;
-          margin-bottom: 4px;
-          font-weight: 500;
-        }
-        .form-row input[type="text"],
-        .form-row input[type="date"],
-        .form-row input[type="number"],
-        .form-row textarea,
-        .form-row select {
-          width: 100%;
-          padding: 8px;
-          border: 1px solid var(--divider-color);
-          border-radius: 4px;
-          background-color: var(--card-background-color);
-          color: var(--primary-text-color);
-          font-family: inherit;
-          font-size: 14px;
-        }
-        .form-row textarea {
-          min-height: 80px;
-          resize: vertical;
-        }
-        .checkbox-row {
-          display: flex;
-          align-items: center;
-          margin-bottom: 16px;
-        }
-        .checkbox-row input[type="checkbox"] {
-          margin-right: 8px;
-        }
-        .section-title {
-          font-weight: 600;
-          margin-top: 20px;
-          margin-bottom: 12px;
-          padding-bottom: 8px;
-          border-bottom: 1px solid var(--divider-color);
-        }
-        .inline-fields {
-          display: flex;
-          gap: 12px;
-        }
-        .inline-fields .form-row {
-          flex: 1;
-        }
-        .radio-group {
-          margin-left: 24px;
-          padding: 8px;
-          background-color: var(--secondary-background-color);
-          border-radius: 4px;
-        }
-        .radio-option {
-          display: flex;
-          align-items: center;
-          margin-bottom: 8px;
-        }
-        .radio-option input[type="radio"] {
-          margin-right: 8px;
-        }
-        .radio-option label {
-          margin: 0 8px 0 0;
-          min-width: 80px;
-        }
-        .disabled {
-          opacity: 0.5;
-          pointer-events: none;
-        }
-      </style>
-      
-      <div class="checkbox-row">
-        <input type="checkbox" id="task-status" ${isEdit && item.status === 'completed' ? 'checked' : ''}>
-        <label for="task-status">${isSpanish ? 'Tarea completada' : 'Task completed'}</label>
-      </div>
-      
-      <div class="form-row">
-        <label for="task-summary">${isSpanish ? 'Nombre de la tarea' : 'Task name'} *</label>
-        <input type="text" id="task-summary" value="${isEdit ? item.summary : ''}" required>
-      </div>
-      
-      <div class="form-row">
-        <label for="task-description">${isSpanish ? 'Descripción' : 'Description'}</label>
-        <textarea id="task-description">${isEdit && item.description ? item.description : ''}</textarea>
-      </div>
-      
-      <div class="form-row">
-        <label for="task-due">${isSpanish ? 'Fecha de vencimiento' : 'Due date'}</label>
-        <input type="date" id="task-due" value="${isEdit && item.due ? item.due : ''}">
-      </div>
-      
-      <div class="section-title">${isSpanish ? 'Repetición' : 'Recurrence'}</div>
-      
-      <div class="checkbox-row">
-        <input type="checkbox" id="recurrence-enabled" ${recurrenceData?.recurrence_enabled ? 'checked' : ''}>
-        <label for="recurrence-enabled">${isSpanish ? 'Activar repetición' : 'Enable recurrence'}</label>
-      </div>
-      
-      <div id="recurrence-settings" class="${recurrenceData?.recurrence_enabled ? '' : 'disabled'}">
-        <div class="inline-fields">
-          <div class="form-row">
-            <label for="recurrence-interval">${isSpanish ? 'Cada' : 'Every'}</label>
-            <input type="number" id="recurrence-interval" min="1" max="365" value="${recurrenceData?.recurrence_interval || 1}">
-          </div>
-          <div class="form-row">
-            <label for="recurrence-unit">${isSpanish ? 'Unidad' : 'Unit'}</label>
-            <select id="recurrence-unit">
-              <option value="days" ${recurrenceData?.recurrence_unit === 'days' || !recurrenceData ? 'selected' : ''}>${isSpanish ? 'días' : 'days'}</option>
-              <option value="weeks" ${recurrenceData?.recurrence_unit === 'weeks' ? 'selected' : ''}>${isSpanish ? 'semanas' : 'weeks'}</option>
-              <option value="months" ${recurrenceData?.recurrence_unit === 'months' ? 'selected' : ''}>${isSpanish ? 'meses' : 'months'}</option>
-              <option value="years" ${recurrenceData?.recurrence_unit === 'years' ? 'selected' : ''}>${isSpanish ? 'años' : 'years'}</option>
-            </select>
-          </div>
-        </div>
-      </div>
-      
-      <div class="section-title">${isSpanish ? 'Detener repetición' : 'Stop recurrence'}</div>
-      
-      <div class="checkbox-row">
-        <input type="checkbox" id="recurrence-end-enabled" ${recurrenceData?.recurrence_end_enabled ? 'checked' : ''}>
-        <label for="recurrence-end-enabled">${isSpanish ? 'Activar límite de repetición' : 'Enable recurrence limit'}</label>
-      </div>
-      
-      <div id="recurrence-end-settings" class="${recurrenceData?.recurrence_end_enabled ? '' : 'disabled'}">
-        <div class="radio-group">
-          <div class="radio-option">
-            <input type="radio" id="end-type-count" name="end-type" value="count" 
-              ${!recurrenceData?.recurrence_end_type || recurrenceData?.recurrence_end_type === 'count' ? 'checked' : ''}>
-            <label for="end-type-count">${isSpanish ? 'Después de' : 'After'}</label>
-            <input type="number" id="recurrence-end-count" min="1" max="999" value="${recurrenceData?.recurrence_end_count || 1}" 
-              style="width: 100px; margin-right: 8px;">
-            <span>${isSpanish ? 'repeticiones' : 'repetitions'}</span>
-          </div>
-          <div class="radio-option">
-            <input type="radio" id="end-type-date" name="end-type" value="date"
-              ${recurrenceData?.recurrence_end_type === 'date' ? 'checked' : ''}>
-            <label for="end-type-date">${isSpanish ? 'Hasta' : 'Until'}</label>
-            <input type="date" id="recurrence-end-date" value="${recurrenceData?.recurrence_end_date || ''}" style="flex: 1;">
-          </div>
-        </div>
-      </div>
-    `;
-    
-    dialog.appendChild(content);
-    
-    // Add event listeners for checkbox toggles
-    const recurrenceEnabledCheckbox = content.querySelector('#recurrence-enabled');
-    const recurrenceSettings = content.querySelector('#recurrence-settings');
-    const recurrenceEndEnabledCheckbox = content.querySelector('#recurrence-end-enabled');
-    const recurrenceEndSettings = content.querySelector('#recurrence-end-settings');
-    
-    recurrenceEnabledCheckbox.addEventListener('change', (e) => {
-      if (e.target.checked) {
-        recurrenceSettings.classList.remove('disabled');
-      } else {
-        recurrenceSettings.classList.add('disabled');
-      }
-    });
-    
-    recurrenceEndEnabledCheckbox.addEventListener('change', (e) => {
-      if (e.target.checked) {
-        recurrenceEndSettings.classList.remove('disabled');
-      } else {
-        recurrenceEndSettings.classList.add('disabled');
-      }
-    });
-    
-    // Add event listeners for radio buttons to select when their inputs are focused
-    const endCountInput = content.querySelector('#recurrence-end-count');
-    const endDateInput = content.querySelector('#recurrence-end-date');
-    const endTypeCountRadio = content.querySelector('#end-type-count');
-    const endTypeDateRadio = content.querySelector('#end-type-date');
-    
-    endCountInput.addEventListener('focus', () => {
-      endTypeCountRadio.checked = true;
-    });
-    
-    endDateInput.addEventListener('focus', () => {
-      endTypeDateRadio.checked = true;
-    });
-    
-    // Set dialog properties
-    dialog.setAttribute('open', '');
-    dialog.setAttribute('scrimClickAction', '');
-    dialog.setAttribute('escapeKeyAction', '');
-    
-    // Add action buttons
-    const actionsDiv = document.createElement('div');
-    actionsDiv.slot = 'primaryAction';
-    actionsDiv.innerHTML = `
-      <mwc-button>
-        ${isSpanish ? 'Guardar' : 'Save'}
-      </mwc-button>
-    `;
-    dialog.appendChild(actionsDiv);
-    
-    const secondaryActionsDiv = document.createElement('div');
-    secondaryActionsDiv.slot = 'secondaryAction';
-    secondaryActionsDiv.innerHTML = `
-      <mwc-button>
-        ${isSpanish ? 'Cancelar' : 'Cancel'}
-      </mwc-button>
-    `;
-    dialog.appendChild(secondaryActionsDiv);
-    
-    // Append to body and show
-    document.body.appendChild(dialog);
-    
-    // Setup button click handlers (since @click in innerHTML doesn't work)
-    const saveButton = dialog.querySelector('[slot="primaryAction"] mwc-button');
-    const cancelButton = dialog.querySelector('[slot="secondaryAction"] mwc-button');
-    
-    saveButton.addEventListener('click', () => {
-      this._saveTask(item, content);
-      dialog.close();
+    const entityId = this._selectedEntity;
+    const recurrenceData = item ? this._tasks.recurrenceData[item.uid] : null;
+    openTaskDialog(this._hass, item, recurrenceData, (content) => {
+      saveTask(this._hass, entityId, item, content);
     });
-    
-    cancelButton.addEventListener('click', () => {
-      dialog.close();
-    });
-    
-    // Remove dialog from DOM when closed
-    dialog.addEventListener('closed', () => {
-      document.body.removeChild(dialog);
-    });
-  }
-
-  /**
-   * Save task from dialog
-   * @param {Object|null} item - Original item if editing, null if creating
-   * @param {HTMLElement} content - Dialog content element
-   */
-  async _saveTask(item, content) {
-    const isEdit = item !== null;
-    
-    // Get form values
-    const status = content.querySelector('#task-status').checked ? 'completed' : 'needs_action';
-    const summary = content.querySelector('#task-summary').value.trim();
-    const description = content.querySelector('#task-description').value.trim();
-    const due = content.querySelector('#task-due').value;
-    
-    // Validate required fields
-    if (!summary) {
-      alert(this._hass.language?.startsWith('es') ? 'El nombre de la tarea es obligatorio' : 'Task name is required');
-      return;
-    }
-    
-    // Get recurrence values
-    const recurrenceEnabled = content.querySelector('#recurrence-enabled').checked;
-    const recurrenceInterval = parseInt(content.querySelector('#recurrence-interval').value) || 1;
-    const recurrenceUnit = content.querySelector('#recurrence-unit').value;
-    const recurrenceEndEnabled = content.querySelector('#recurrence-end-enabled').checked;
-    const endType = content.querySelector('input[name="end-type"]:checked').value;
-    const endCount = parseInt(content.querySelector('#recurrence-end-count').value) || 1;
-    const endDate = content.querySelector('#recurrence-end-date').value;
-    
-    try {
-      if (isEdit) {
-        // Update existing task
-        await this._hass.callService('better_todo', 'update_task', {
-          entity_id: this._selectedEntity,
-          uid: item.uid,
-          summary: summary,
-          description: description || null,
-          due: due || null,
-          status: status,
-        });
-        
-        // Set recurrence if enabled
-        if (recurrenceEnabled) {
-          const recurrenceData = {
-            entity_id: this._selectedEntity,
-            task_uid: item.uid,
-            recurrence_enabled: true,
-            recurrence_interval: recurrenceInterval,
-            recurrence_unit: recurrenceUnit,
-            recurrence_end_enabled: recurrenceEndEnabled,
-          };
-          
-          if (recurrenceEndEnabled) {
-            recurrenceData.recurrence_end_type = endType;
-            if (endType === 'count') {
-              recurrenceData.recurrence_end_count = endCount;
-            } else {
-              recurrenceData.recurrence_end_date = endDate;
-            }
-          }
-          
-          await this._hass.callService('better_todo', 'set_task_recurrence', recurrenceData);
-        } else {
-          // Disable recurrence
-          await this._hass.callService('better_todo', 'set_task_recurrence', {
-            entity_id: this._selectedEntity,
-            task_uid: item.uid,
-            recurrence_enabled: false,
-          });
-        }
-      } else {
-        // Create new task
-        await this._hass.callService('better_todo', 'create_task', {
-          entity_id: this._selectedEntity,
-          summary: summary,
-          description: description || undefined,
-          due: due || undefined,
-        });
-        
-        // If recurrence is enabled, we need to get the UID of the newly created task
-        // Note: This is a limitation since the create_task service doesn't return the UID.
-        // We wait for state update and find the task by matching summary.
-        // This could fail if multiple tasks have the same summary or if task creation
-        // takes longer than expected. A future improvement would be for the backend
-        // service to return the created task UID.
-        if (recurrenceEnabled) {
-          // Wait for the task to be created and state to update
-          await new Promise(resolve => setTimeout(resolve, 500));
-          
-          // Get the latest state
-          const state = this._hass.states[this._selectedEntity];
-          const items = state?.attributes?.items || [];
-          
-          // Find the newly created task (first one with matching summary)
-          const newTask = items.find(i => i.summary === summary);
-          
-          if (newTask) {
-            const recurrenceData = {
-              entity_id: this._selectedEntity,
-              task_uid: newTask.uid,
-              recurrence_enabled: true,
-              recurrence_interval: recurrenceInterval,
-              recurrence_unit: recurrenceUnit,
-              recurrence_end_enabled: recurrenceEndEnabled,
-            };
-            
-            if (recurrenceEndEnabled) {
-              recurrenceData.recurrence_end_type = endType;
-              if (endType === 'count') {
-                recurrenceData.recurrence_end_count = endCount;
-              } else {
-                recurrenceData.recurrence_end_date = endDate;
-              }
-            }
-            
-            await this._hass.callService('better_todo', 'set_task_recurrence', recurrenceData);
-          }
-        }
-      }
-    } catch (err) {
-      console.error('Error saving task:', err);
-      alert(this._hass.language?.startsWith('es') ? 'Error al guardar la tarea' : 'Error saving task');
-    }
   }
 
   /**
    * Update the card content
    */
   _updateCard() {
-    if (!this._hass || !this._cardElement) {
+    // Wait for the list catalog instead of showing an empty card
+    if (!this._hass || !this._cardElement || !this._lists.loaded) {
       return;
     }
+    this._language = this._hass.language;
 
     const entities = this._getTodoEntities();
     
@@ -693,9 +177,10 @@ class BetterTodoDashboardCard extends HTMLElement {
     }
 
     // Auto-select first entity if none selected
-    if (!this._selectedEntity || !this._hass.states[this._selectedEntity]) {
+    if (!this._selectedEntity || !this._lists.getList(this._selectedEntity)) {
       this._selectedEntity = entities[0];
     }
+    this._tasks.connect(this._hass, this._selectedEntity);
 
     // Build the two-section layout
     const listsHtml = this._renderListsPanel(entities);
@@ -948,18 +433,16 @@ class BetterTodoDashboardCard extends HTMLElement {
     const isSpanish = language.startsWith('es');
     
     const listsHtml = entities.map(entityId => {
-      const state = this._hass.states[entityId];
-      // Use friendly_name from attributes (not entity ID)
-      const name = state.attributes.friendly_name || state.attributes.name || entityId.split('.')[1].replace(/_/g, ' ');
-      // Use 'items' instead of 'todo_items' to avoid headers
-      const items = state.attributes.items || [];
-      const activeCount = items.filter(item => item.status !== 'completed').length;
+      const list = this._lists.getList(entityId);
+      // Use the list's friendly name (not entity ID)
+      const name = list.name || entityId.split('.')[1].replace(/_/g, ' ');
+      const activeCount = list.active_tasks;
       const isSelected = entityId === this._selectedEntity;
       
       return `
-        <div class="list-item ${isSelected ? 'selected' : ''}" data-entity="${this._escapeHtml(entityId)}">
+        <div class="list-item ${isSelected ? 'selected' : ''}" data-entity="${escapeHtml(entityId)}">
           <ha-icon class="list-item-icon" icon="mdi:format-list-checks"></ha-icon>
-          <div class="list-item-name">${this._escapeHtml(name)}</div>
+          <div class="list-item-name">${escapeHtml(name)}</div>
           <div class="list-item-count">${activeCount}</div>
         </div>
       `;
@@ -978,15 +461,6 @@ class BetterTodoDashboardCard extends HTMLElement {
     return listsHtml + addListButton;
   }
   
-  /**
-   * Escape HTML to prevent XSS
-   */
-  _escapeHtml(text) {
-    const div = document.createElement('div');
-    div.textContent = text;
-    return div.innerHTML;
-  }
-
   /**
    * Render the tasks panel
    * @returns {string} - HTML string
@@ -996,77 +470,30 @@ class BetterTodoDashboardCard extends HTMLElement {
       return '<p>Select a list</p>';
     }
     
-    const state = this._hass.states[this._selectedEntity];
-    if (!state) {
+    const list = this._lists.getList(this._selectedEntity);
+    if (!list) {
       return '<p>List not found</p>';
     }
     
-    // Use 'items' instead of 'todo_items' to get clean list without headers
-    const items = state.attributes.items || [];
     // Get friendly name properly - it updates dynamically based on selected entity
-    const title = state.attributes.friendly_name || state.attributes.name || this._selectedEntity.split('.')[1].replace(/_/g, ' ');
+    const title = list.name || this._selectedEntity.split('.')[1].replace(/_/g, ' ');
+    const language = this._hass.language;
     
-    // Group items
-    const groups = this._groupItems(items);
+    // Tasks come from the websocket subscription of the selected list,
+    // grouped once per change of the list
+    const groups = groupItems(this._tasks);
     
     return `
       <div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 16px;">
-        <h1 style="margin: 0;">${this._escapeHtml(title)}</h1>
+        <h1 style="margin: 0;">${escapeHtml(title)}</h1>
         <ha-icon-button class="add-task-button">
           <ha-icon icon="mdi:plus"></ha-icon>
         </ha-icon-button>
       </div>
-      ${this._renderGroup('no_due_date', groups.no_due_date)}
-      ${this._renderGroup('this_week', groups.this_week)}
-      ${this._renderGroup('forthcoming', groups.forthcoming)}
-      ${this._renderGroup('completed', groups.completed)}
-    `;
-  }
-
-  /**
-   * Render a group section with header
-   * @param {string} group - Group key
-   * @param {Array} items - Items in the group
-   * @returns {string} - HTML string
-   */
-  _renderGroup(group, items) {
-    if (items.length === 0) {
-      return '';
-    }
-    
-    const label = this._getGroupLabel(group);
-    const itemsHtml = items.map(item => this._renderItem(item)).join('');
-    
-    return `
-      <div class="header" role="separator">
-        <h2>${label}</h2>
-      </div>
-      ${itemsHtml}
-    `;
-  }
-
-  /**
-   * Render a todo item
-   * @param {Object} item - Todo item
-   * @returns {string} - HTML string
-   */
-  _renderItem(item) {
-    const checked = item.status === 'completed' ? 'checked' : '';
-    const dueDate = this._formatDueDate(item.due);
-    const dueHtml = dueDate ? `<div class="secondary">${this._escapeHtml(dueDate)}</div>` : '';
-    
-    return `
-      <ha-check-list-item data-uid="${this._escapeHtml(item.uid)}">
-        <ha-checkbox 
-          slot="start"
-          ${checked}
-          data-uid="${this._escapeHtml(item.uid)}"
-        ></ha-checkbox>
-        <div>
-          <div>${this._escapeHtml(item.summary)}</div>
-          ${dueHtml}
-        </div>
-      </ha-check-list-item>
+      ${renderGroup('no_due_date', groups.no_due_date, language)}
+      ${renderGroup('this_week', groups.this_week, language)}
+      ${renderGroup('forthcoming', groups.forthcoming, language)}
+      ${renderGroup('completed', groups.completed, language)}
     `;
   }
 
@@ -1092,7 +519,7 @@ window.customCards.push({
 });
 
 console.info(
-  '%c BETTER-TODO-DASHBOARD-CARD %c v1.0.0 ',
+  '%c BETTER-TODO-DASHBOARD-CARD %c v1.3.0 ',
   'background-color: #555;color: #fff;font-weight: bold;',
   'background-color: #4caf50;color: #fff;font-weight: bold;'
 );
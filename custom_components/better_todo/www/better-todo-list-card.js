@@ -10,9 +10,26 @@
  * - better_todo.delete_task
  * 
  * The card replicates the native todo-list card UI/UX exactly.
+ *
+ * Tasks are received through the better_todo/items/subscribe websocket
+ * command, so a single task change only transfers that task.
+ *
+ * Only the tasks visible in the card are rendered, so long lists stay fast.
+ * The card scrolls past max_height (default 480px), and completed tasks are
+ * collapsed and shown in pages.
  */
 
-const BETTER_TODO_LIST_CARD_VERSION = "0.10.0";
+import {
+  COMPLETED_PAGE_SIZE,
+  openTaskDialog,
+  saveTask,
+  setTaskStatus,
+  splitItems,
+  TodoItemsSubscription,
+  VirtualList,
+} from './better-todo-core.js';
+
+const BETTER_TODO_LIST_CARD_VERSION = "0.13.0";
 const DEBUG_MODE = true;
 
 function debugLog(message, ...args) {
@@ -31,6 +48,41 @@ class BetterTodoListCard extends HTMLElement {
     this._hass = null;
     this._config = null;
     this._entityId = null;
+    this._tasks = new TodoItemsSubscription(() => this._syncItems());
+    // Entity state the card was last rendered for
+    this._renderedState = null;
+    // Visible rows of the active and completed tasks, set once the card is built
+    this._activeList = null;
+    this._completedList = null;
+    this._completedExpanded = false;
+    this._completedShown = COMPLETED_PAGE_SIZE;
+  }
+
+  connectedCallback() {
+    if (this._hass) {
+      this._tasks.connect(this._hass, this._entityId);
+    }
+    this._attachLists();
+  }
+
+  disconnectedCallback() {
+    this._tasks.disconnect();
+    this._detachLists();
+  }
+
+  _attachLists() {
+    const scroller = this.querySelector('.card-content');
+    if (this._activeList && scroller) {
+      this._activeList.attach(scroller);
+      this._completedList.attach(scroller);
+    }
+  }
+
+  _detachLists() {
+    if (this._activeList) {
+      this._activeList.detach();
+      this._completedList.detach();
+    }
   }
 
   setConfig(config) {
@@ -42,12 +94,23 @@ class BetterTodoListCard extends HTMLElement {
     this._entityId = config.entity;
     
     debugLog('Card configured for entity:', this._entityId);
+    // Build the card again for the new configuration
+    this._detachLists();
+    this._activeList = null;
+    this._completedList = null;
+    this._renderedState = null;
     this.render();
   }
 
   set hass(hass) {
     this._hass = hass;
-    this.render();
+    this._tasks.connect(hass, this._entityId);
+    // Home Assistant sets hass for every state change in the instance, the
+    // card only needs to render when its own entity changed
+    const state = hass.states[this._entityId];
+    if (state !== this._renderedState) {
+      this.render();
+    }
   }
 
   get hass() {
@@ -65,8 +128,12 @@ class BetterTodoListCard extends HTMLElement {
     }
 
     const entityState = this._hass.states[this._entityId];
+    this._renderedState = entityState;
     if (!entityState) {
       errorLog('Entity not found:', this._entityId);
+      this._detachLists();
+      this._activeList = null;
+      this._completedList = null;
       this.innerHTML = `
         <ha-card>
           <div class="card-content">
@@ -80,9 +147,13 @@ class BetterTodoListCard extends HTMLElement {
     debugLog('Rendering card for entity:', this._entityId, entityState);
 
     const title = this._config.title || entityState.attributes.friendly_name || this._entityId;
-    const items = entityState.attributes.items || [];
-    const activeItems = items.filter(item => item.status !== 'completed');
-    const completedItems = items.filter(item => item.status === 'completed');
+
+    // The card is built once, later renders only update the title and tasks
+    if (this._activeList) {
+      this.querySelector('.card-header .name').textContent = title;
+      this._syncItems();
+      return;
+    }
 
     this.innerHTML = `
       <ha-card>
@@ -111,6 +182,7 @@ class BetterTodoListCard extends HTMLElement {
             padding: 0;
             flex: 1;
             overflow-y: auto;
+            max-height: var(--better-todo-list-max-height);
           }
           .empty-state {
             padding: 32px 16px;
@@ -168,61 +240,136 @@ class BetterTodoListCard extends HTMLElement {
             color: var(--secondary-text-color);
             background-color: var(--secondary-background-color);
             border-bottom: 1px solid var(--divider-color);
+            position: sticky;
+            top: 0;
+            z-index: 1;
+            display: flex;
+            align-items: center;
+            gap: 8px;
+            cursor: pointer;
+          }
+          .section-header ha-icon {
+            --mdc-icon-size: 20px;
+            transition: transform 0.2s;
+          }
+          .section-header.expanded ha-icon {
+            transform: rotate(90deg);
+          }
+          .show-more-button {
+            display: block;
+            width: 100%;
+            padding: 12px 16px;
+            border: none;
+            background: none;
+            color: var(--primary-color);
+            font-size: 14px;
+            cursor: pointer;
           }
         </style>
         
         <div class="card-header">
-          <div class="name">${title}</div>
+          <div class="name"></div>
           <mwc-icon-button id="add-button">
             <ha-icon icon="mdi:plus"></ha-icon>
           </mwc-icon-button>
         </div>
         
         <div class="card-content">
-          ${activeItems.length === 0 && completedItems.length === 0 ? `
-            <div class="empty-state">
-              <ha-icon icon="mdi:checkbox-marked-circle-outline"></ha-icon>
-              <p>No tasks</p>
-            </div>
-          ` : ''}
-          
-          ${activeItems.length > 0 ? `
-            <div class="active-section">
-              ${activeItems.map(item => this._renderItem(item, false)).join('')}
-            </div>
-          ` : ''}
-          
-          ${completedItems.length > 0 ? `
-            <div class="section-header">Completed</div>
-            <div class="completed-section">
-              ${completedItems.map(item => this._renderItem(item, true)).join('')}
-            </div>
-          ` : ''}
+          <div class="empty-state">
+            <ha-icon icon="mdi:checkbox-marked-circle-outline"></ha-icon>
+            <p>No tasks</p>
+          </div>
+          <div class="active-section"></div>
+          <div class="section-header">
+            <ha-icon icon="mdi:chevron-right"></ha-icon>
+            <span></span>
+          </div>
+          <div class="completed-section"></div>
+          <button class="show-more-button">Show more</button>
         </div>
       </ha-card>
     `;
 
+    this.querySelector('.card-header .name').textContent = title;
+    this.querySelector('.card-content').style.setProperty(
+      '--better-todo-list-max-height', this._config.max_height || '480px'
+    );
+    const rowOptions = {
+      createRow: () => this._createItemNode(),
+      patchRow: (node, item) => this._patchItemNode(node, item),
+    };
+    this._activeList = new VirtualList(this.querySelector('.active-section'), rowOptions);
+    this._completedList = new VirtualList(this.querySelector('.completed-section'), rowOptions);
+    this._attachLists();
     this._attachEventListeners();
+    this._syncItems();
   }
 
-  _renderItem(item, isCompleted) {
-    const dueText = item.due ? `📅 ${item.due}` : '';
-    return `
-      <div class="todo-item ${isCompleted ? 'completed' : ''}" data-uid="${item.uid}">
-        <ha-checkbox ${isCompleted ? 'checked' : ''}></ha-checkbox>
-        <div class="todo-item-content">
-          <div class="todo-item-summary">${this._escapeHtml(item.summary)}</div>
-          ${item.description ? `<div class="todo-item-description">${this._escapeHtml(item.description)}</div>` : ''}
-        </div>
-        ${dueText ? `<div class="todo-item-due">${dueText}</div>` : ''}
+  /**
+   * Show the current tasks, rendering only the visible rows
+   * Completed tasks are shown a page at a time once expanded.
+   */
+  _syncItems() {
+    if (!this._activeList) {
+      return;
+    }
+
+    const items = this._tasks.items;
+    const { active: activeItems, completed: completedItems } = splitItems(this._tasks);
+
+    this._activeList.setItems(activeItems);
+    this._completedList.setItems(
+      this._completedExpanded ? completedItems.slice(0, this._completedShown) : []
+    );
+
+    this.querySelector('.empty-state').style.display = items.length === 0 ? '' : 'none';
+    const completedHeader = this.querySelector('.section-header');
+    completedHeader.style.display = completedItems.length > 0 ? '' : 'none';
+    completedHeader.classList.toggle('expanded', this._completedExpanded);
+    completedHeader.querySelector('span').textContent = `Completed (${completedItems.length})`;
+    this.querySelector('.show-more-button').style.display =
+      this._completedExpanded && completedItems.length > this._completedShown ? '' : 'none';
+  }
+
+  /**
+   * Create the node of a task, filled in by _patchItemNode
+   */
+  _createItemNode() {
+    const node = document.createElement('div');
+    node.className = 'todo-item';
+    node.innerHTML = `
+      <ha-checkbox></ha-checkbox>
+      <div class="todo-item-content">
+        <div class="todo-item-summary"></div>
+        <div class="todo-item-description"></div>
       </div>
+      <div class="todo-item-due"></div>
     `;
+
+    // Checkbox listener, attached once per node
+    node.querySelector('ha-checkbox').addEventListener('change', (e) => {
+      this._toggleItemStatus(node.dataset.uid, e.target.checked);
+    });
+    return node;
   }
 
-  _escapeHtml(text) {
-    const div = document.createElement('div');
-    div.textContent = text;
-    return div.innerHTML;
+  /**
+   * Update the node of a task in place
+   */
+  _patchItemNode(node, item) {
+    const isCompleted = item.status === 'completed';
+    node.dataset.uid = item.uid;
+    node.classList.toggle('completed', isCompleted);
+    const checkbox = node.querySelector('ha-checkbox');
+    checkbox.checked = isCompleted;
+    checkbox.toggleAttribute('checked', isCompleted);
+    node.querySelector('.todo-item-summary').textContent = item.summary || '';
+    const description = node.querySelector('.todo-item-description');
+    description.textContent = item.description || '';
+    description.style.display = item.description ? '' : 'none';
+    const due = node.querySelector('.todo-item-due');
+    due.textContent = item.due ? `📅 ${item.due}` : '';
+    due.style.display = item.due ? '' : 'none';
   }
 
   _attachEventListeners() {
@@ -232,28 +379,28 @@ class BetterTodoListCard extends HTMLElement {
       addButton.addEventListener('click', () => this._openTaskDialog(null));
     }
 
-    // Checkboxes
-    const checkboxes = this.querySelectorAll('.todo-item ha-checkbox');
-    checkboxes.forEach(checkbox => {
-      checkbox.addEventListener('change', (e) => {
-        const todoItem = e.target.closest('.todo-item');
-        const uid = todoItem.dataset.uid;
-        const isCompleted = e.target.checked;
-        this._toggleItemStatus(uid, isCompleted);
-      });
+    // Expand or collapse the completed tasks
+    this.querySelector('.section-header').addEventListener('click', () => {
+      this._completedExpanded = !this._completedExpanded;
+      this._completedShown = COMPLETED_PAGE_SIZE;
+      this._syncItems();
+    });
+
+    // Show the next page of completed tasks
+    this.querySelector('.show-more-button').addEventListener('click', () => {
+      this._completedShown += COMPLETED_PAGE_SIZE;
+      this._syncItems();
     });
 
-    // Click on item to edit
-    const items = this.querySelectorAll('.todo-item');
-    items.forEach(item => {
-      item.addEventListener('click', (e) => {
-        // Don't trigger if clicking on checkbox
-        if (e.target.tagName !== 'HA-CHECKBOX') {
-          const uid = item.dataset.uid;
-          debugLog('Item clicked:', uid);
-          this._handleItemClick(uid);
-        }
-      });
+    // Click on item to edit, handled once for every current and future item
+    this.querySelector('.card-content').addEventListener('click', (e) => {
+      const item = e.target.closest('.todo-item');
+      // Don't trigger if clicking on checkbox
+      if (item && !e.target.closest('ha-checkbox')) {
+        const uid = item.dataset.uid;
+        debugLog('Item clicked:', uid);
+        this._handleItemClick(uid);
+      }
     });
   }
 
@@ -261,11 +408,7 @@ class BetterTodoListCard extends HTMLElement {
     debugLog('Toggling item status:', uid, isCompleted);
 
     try {
-      await this._hass.callService('better_todo', 'update_task', {
-        entity_id: this._entityId,
-        uid: uid,
-        status: isCompleted ? 'completed' : 'needs_action',
-      });
+      await setTaskStatus(this._hass, this._entityId, uid, isCompleted);
       
       debugLog('Item status updated successfully');
     } catch (error) {
@@ -278,11 +421,7 @@ class BetterTodoListCard extends HTMLElement {
     if (!uid || !this._entityId) return;
     
     // Find the item
-    const entityState = this._hass.states[this._entityId];
-    if (!entityState) return;
-    
-    const items = entityState.attributes.items || [];
-    const item = items.find(i => i.uid === uid);
+    const item = this._tasks.getItem(uid);
     
     if (item) {
       this._openTaskDialog(item);
@@ -290,369 +429,11 @@ class BetterTodoListCard extends HTMLElement {
   }
 
   _openTaskDialog(item) {
-    const isEdit = item !== null;
-    const language = this._hass.language || 'en';
-    const isSpanish = language.startsWith('es');
-    
-    // Get recurrence data for the item if editing
-    let recurrenceData = null;
-    if (isEdit) {
-      const entityState = this._hass.states[this._entityId];
-      recurrenceData = entityState?.attributes?.recurrence_data?.[item.uid];
-    }
-    
-    // Create dialog
-    const dialog = document.createElement('ha-dialog');
-    dialog.heading = isSpanish 
-      ? (isEdit ? 'Editar tarea' : 'Nueva tarea')
-      : (isEdit ? 'Edit Task' : 'New Task');
-    
-    const content = document.createElement('div');
-    content.style.padding = '16px';
-    
-    // Build form HTML
-    content.innerHTML = `
-      <style>
-        .form-row {
-          margin-bottom: 16px;
-        }
-        .form-row label {
-          display: block;
-          margin-bottom: 4px;
-          font-weight: 500;
-        }
-        .form-row input[type="text"],
-        .form-row input[type="date"],
-        .form-row input[type="number"],
-        .form-row textarea,
-        .form-row select {
-          width: 100%;
-          padding: 8px;
-          border: 1px solid var(--divider-color);
-          border-radius: 4px;
-          background-color: var(--card-background-color);
-          color: var(--primary-text-color);
-          font-family: inherit;
-          font-size: 14px;
-        }
-        .form-row textarea {
-          min-height: 80px;
-          resize: vertical;
-        }
-        .checkbox-row {
-          display: flex;
-          align-items: center;
-          margin-bottom: 16px;
-        }
-        .checkbox-row input[type="checkbox"] {
-          margin-right: 8px;
-        }
-        .section-title {
-          font-weight: 600;
-          margin-top: 20px;
-          margin-bottom: 12px;
-          padding-bottom: 8px;
-          border-bottom: 1px solid var(--divider-color);
-        }
-        .inline-fields {
-          display: flex;
-          gap: 12px;
-        }
-        .inline-fields .form-row {
-          flex: 1;
-        }
-        .radio-group {
-          margin-left: 24px;
-          padding: 8px;
-          background-color: var(--secondary-background-color);
-          border-radius: 4px;
-        }
-        .radio-option {
-          display: flex;
-          align-items: center;
-          margin-bottom: 8px;
-        }
-        .radio-option input[type="radio"] {
-          margin-right: 8px;
-        }
-        .radio-option label {
-          margin: 0 8px 0 0;
-          min-width: 80px;
-        }
-        .disabled {
-          opacity: 0.5;
-          pointer-events: none;
-        }
-      </style>
-      
-      <div class="checkbox-row">
-        <input type="checkbox" id="task-status" ${isEdit && item.status === 'completed' ? 'checked' : ''}>
-        <label for="task-status">${isSpanish ? 'Tarea completada' : 'Task completed'}</label>
-      </div>
-      
-      <div class="form-row">
-        <label for="task-summary">${isSpanish ? 'Nombre de la tarea' : 'Task name'} *</label>
-        <input type="text" id="task-summary" value="${isEdit ? this._escapeHtml(item.summary) : ''}" required>
-      </div>
-      
-      <div class="form-row">
-        <label for="task-description">${isSpanish ? 'Descripción' : 'Description'}</label>
-        <textarea id="task-description">${isEdit && item.description ? this._escapeHtml(item.description) : ''}</textarea>
-      </div>
-      
-      <div class="form-row">
-        <label for="task-due">${isSpanish ? 'Fecha de vencimiento' : 'Due date'}</label>
-        <input type="date" id="task-due" value="${isEdit && item.due ? item.due : ''}">
-      </div>
-      
-      <div class="section-title">${isSpanish ? 'Repetición' : 'Recurrence'}</div>
-      
-      <div class="checkbox-row">
-        <input type="checkbox" id="recurrence-enabled" ${recurrenceData?.recurrence_enabled ? 'checked' : ''}>
-        <label for="recurrence-enabled">${isSpanish ? 'Activar repetición' : 'Enable recurrence'}</label>
-      </div>
-      
-      <div id="recurrence-settings" class="${recurrenceData?.recurrence_enabled ? '' : 'disabled'}">
-        <div class="inline-fields">
-          <div class="form-row">
-            <label for="recurrence-interval">${isSpanish ? 'Cada' : 'Every'}</label>
-            <input type="number" id="recurrence-interval" min="1" max="365" value="${recurrenceData?.recurrence_interval || 1}">
-          </div>
-          <div class="form-row">
-            <label for="recurrence-unit">${isSpanish ? 'Unidad' : 'Unit'}</label>
-            <select id="recurrence-unit">
-              <option value="days" ${recurrenceData?.recurrence_unit === 'days' || !recurrenceData ? 'selected' : ''}>${isSpanish ? 'días' : 'days'}</option>
-              <option value="weeks" ${recurrenceData?.recurrence_unit === 'weeks' ? 'selected' : ''}>${isSpanish ? 'semanas' : 'weeks'}</option>
-              <option value="months" ${recurrenceData?.recurrence_unit === 'months' ? 'selected' : ''}>${isSpanish ? 'meses' : 'months'}</option>
-              <option value="years" ${recurrenceData?.recurrence_unit === 'years' ? 'selected' : ''}>${isSpanish ? 'años' : 'years'}</option>
-            </select>
-          </div>
-        </div>
-      </div>
-      
-      <div class="section-title">${isSpanish ? 'Detener repetición' : 'Stop recurrence'}</div>
-      
-      <div class="checkbox-row">
-        <input type="checkbox" id="recurrence-end-enabled" ${recurrenceData?.recurrence_end_enabled ? 'checked' : ''}>
-        <label for="recurrence-end-enabled">${isSpanish ? 'Activar límite de repetición' : 'Enable recurrence limit'}</label>
-      </div>
-      
-      <div id="recurrence-end-settings" class="${recurrenceData?.recurrence_end_enabled ? '' : 'disabled'}">
-        <div class="radio-group">
-          <div class="radio-option">
-            <input type="radio" id="end-type-count" name="end-type" value="count" 
-              ${!recurrenceData?.recurrence_end_type || recurrenceData?.recurrence_end_type === 'count' ? 'checked' : ''}>
-            <label for="end-type-count">${isSpanish ? 'Después de' : 'After'}</label>
-            <input type="number" id="recurrence-end-count" min="1" max="999" value="${recurrenceData?.recurrence_end_count || 1}" 
-              style="width: 100px; margin-right: 8px;">
-            <span>${isSpanish ? 'repeticiones' : 'repetitions'}</span>
-          </div>
-          <div class="radio-option">
-            <input type="radio" id="end-type-date" name="end-type" value="date"
-              ${recurrenceData?.recurrence_end_type === 'date' ? 'checked' : ''}>
-            <label for="end-type-date">${isSpanish ? 'Hasta' : 'Until'}</label>
-            <input type="date" id="recurrence-end-date" value="${recurrenceData?.recurrence_end_date || ''}" style="flex: 1;">
-          </div>
-        </div>
-      </div>
-    `;
-    
-    dialog.appendChild(content);
-    
-    // Add event listeners for checkbox toggles
-    const recurrenceEnabledCheckbox = content.querySelector('#recurrence-enabled');
-    const recurrenceSettings = content.querySelector('#recurrence-settings');
-    const recurrenceEndEnabledCheckbox = content.querySelector('#recurrence-end-enabled');
-    const recurrenceEndSettings = content.querySelector('#recurrence-end-settings');
-    
-    recurrenceEnabledCheckbox.addEventListener('change', (e) => {
-      if (e.target.checked) {
-        recurrenceSettings.classList.remove('disabled');
-      } else {
-        recurrenceSettings.classList.add('disabled');
-      }
-    });
-    
-    recurrenceEndEnabledCheckbox.addEventListener('change', (e) => {
-      if (e.target.checked) {
-        recurrenceEndSettings.classList.remove('disabled');
-      } else {
-        recurrenceEndSettings.classList.add('disabled');
-      }
+    const entityId = this._entityId;
+    const recurrenceData = item ? this._tasks.recurrenceData[item.uid] : null;
+    openTaskDialog(this._hass, item, recurrenceData, (content) => {
+      saveTask(this._hass, entityId, item, content);
     });
-    
-    // Add event listeners for radio buttons
-    const endCountInput = content.querySelector('#recurrence-end-count');
-    const endDateInput = content.querySelector('#recurrence-end-date');
-    const endTypeCountRadio = content.querySelector('#end-type-count');
-    const endTypeDateRadio = content.querySelector('#end-type-date');
-    
-    endCountInput.addEventListener('focus', () => {
-      endTypeCountRadio.checked = true;
-    });
-    
-    endDateInput.addEventListener('focus', () => {
-      endTypeDateRadio.checked = true;
-    });
-    
-    // Set dialog properties
-    dialog.setAttribute('open', '');
-    dialog.setAttribute('scrimClickAction', '');
-    dialog.setAttribute('escapeKeyAction', '');
-    
-    // Add action buttons
-    const actionsDiv = document.createElement('div');
-    actionsDiv.slot = 'primaryAction';
-    actionsDiv.innerHTML = `
-      <mwc-button>
-        ${isSpanish ? 'Guardar' : 'Save'}
-      </mwc-button>
-    `;
-    dialog.appendChild(actionsDiv);
-    
-    const secondaryActionsDiv = document.createElement('div');
-    secondaryActionsDiv.slot = 'secondaryAction';
-    secondaryActionsDiv.innerHTML = `
-      <mwc-button>
-        ${isSpanish ? 'Cancelar' : 'Cancel'}
-      </mwc-button>
-    `;
-    dialog.appendChild(secondaryActionsDiv);
-    
-    // Append to body
-    document.body.appendChild(dialog);
-    
-    // Setup button handlers
-    const saveButton = dialog.querySelector('[slot="primaryAction"] mwc-button');
-    const cancelButton = dialog.querySelector('[slot="secondaryAction"] mwc-button');
-    
-    saveButton.addEventListener('click', () => {
-      this._saveTask(item, content);
-      dialog.close();
-    });
-    
-    cancelButton.addEventListener('click', () => {
-      dialog.close();
-    });
-    
-    // Remove dialog when closed
-    dialog.addEventListener('closed', () => {
-      document.body.removeChild(dialog);
-    });
-  }
-
-  async _saveTask(item, content) {
-    const isEdit = item !== null;
-    
-    // Get form values
-    const status = content.querySelector('#task-status').checked ? 'completed' : 'needs_action';
-    const summary = content.querySelector('#task-summary').value.trim();
-    const description = content.querySelector('#task-description').value.trim();
-    const due = content.querySelector('#task-due').value;
-    
-    // Validate
-    if (!summary) {
-      alert(this._hass.language?.startsWith('es') ? 'El nombre de la tarea es obligatorio' : 'Task name is required');
-      return;
-    }
-    
-    // Get recurrence values
-    const recurrenceEnabled = content.querySelector('#recurrence-enabled').checked;
-    const recurrenceInterval = parseInt(content.querySelector('#recurrence-interval').value) || 1;
-    const recurrenceUnit = content.querySelector('#recurrence-unit').value;
-    const recurrenceEndEnabled = content.querySelector('#recurrence-end-enabled').checked;
-    const endType = content.querySelector('input[name="end-type"]:checked').value;
-    const endCount = parseInt(content.querySelector('#recurrence-end-count').value) || 1;
-    const endDate = content.querySelector('#recurrence-end-date').value;
-    
-    try {
-      if (isEdit) {
-        // Update existing task
-        await this._hass.callService('better_todo', 'update_task', {
-          entity_id: this._entityId,
-          uid: item.uid,
-          summary: summary,
-          description: description || null,
-          due: due || null,
-          status: status,
-        });
-        
-        // Set recurrence
-        if (recurrenceEnabled) {
-          const recurrenceData = {
-            entity_id: this._entityId,
-            task_uid: item.uid,
-            recurrence_enabled: true,
-            recurrence_interval: recurrenceInterval,
-            recurrence_unit: recurrenceUnit,
-            recurrence_end_enabled: recurrenceEndEnabled,
-          };
-          
-          if (recurrenceEndEnabled) {
-            recurrenceData.recurrence_end_type = endType;
-            if (endType === 'count') {
-              recurrenceData.recurrence_end_count = endCount;
-            } else {
-              recurrenceData.recurrence_end_date = endDate;
-            }
-          }
-          
-          await this._hass.callService('better_todo', 'set_task_recurrence', recurrenceData);
-        } else {
-          // Disable recurrence
-          await this._hass.callService('better_todo', 'set_task_recurrence', {
-            entity_id: this._entityId,
-            task_uid: item.uid,
-            recurrence_enabled: false,
-          });
-        }
-      } else {
-        // Create new task
-        await this._hass.callService('better_todo', 'create_task', {
-          entity_id: this._entityId,
-          summary: summary,
-          description: description || undefined,
-          due: due || undefined,
-        });
-        
-        // If recurrence enabled, set it on new task
-        if (recurrenceEnabled) {
-          // Wait for state update
-          await new Promise(resolve => setTimeout(resolve, 500));
-          
-          const entityState = this._hass.states[this._entityId];
-          const items = entityState?.attributes?.items || [];
-          const newTask = items.find(i => i.summary === summary && !i.uid.startsWith('header_'));
-          
-          if (newTask) {
-            const recurrenceData = {
-              entity_id: this._entityId,
-              task_uid: newTask.uid,
-              recurrence_enabled: true,
-              recurrence_interval: recurrenceInterval,
-              recurrence_unit: recurrenceUnit,
-              recurrence_end_enabled: recurrenceEndEnabled,
-            };
-            
-            if (recurrenceEndEnabled) {
-              recurrenceData.recurrence_end_type = endType;
-              if (endType === 'count') {
-                recurrenceData.recurrence_end_count = endCount;
-              } else {
-                recurrenceData.recurrence_end_date = endDate;
-              }
-            }
-            
-            await this._hass.callService('better_todo', 'set_task_recurrence', recurrenceData);
-          }
-        }
-      }
-      
-      debugLog('Task saved successfully');
-    } catch (error) {
-      errorLog('Error saving task:', error);
-      alert(this._hass.language?.startsWith('es') ? 'Error al guardar la tarea' : 'Error saving task');
-    }
   }
 }
 
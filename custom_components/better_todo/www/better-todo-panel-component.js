@@ -10,9 +10,32 @@
  * 
  * Note: As of v0.9.0, Better ToDo entities no longer inherit from TodoListEntity,
  * so we use an inline card implementation instead of relying on external modules.
+ *
+ * Tasks of the selected list are received through the better_todo/items/subscribe
+ * websocket command instead of the entity state attributes, and the lists
+ * through better_todo/lists/subscribe instead of scanning hass.states.
+ *
+ * Rendering is keyed: the sidebar has one node per list and the task list one
+ * node per task uid. Nodes are patched in place when their list or task
+ * changes and are otherwise left alone, so updates do not rebuild the markup
+ * and the task input keeps its focus. Only the tasks visible in the scrolled
+ * area are rendered, and completed tasks are collapsed and shown in pages.
  */
 
-const BETTER_TODO_VERSION = "0.10.7";
+import {
+  COMPLETED_PAGE_SIZE,
+  escapeHtml,
+  ListCatalogSubscription,
+  openTaskDialog,
+  placeChildren,
+  saveTask,
+  setTaskStatus,
+  splitItems,
+  TodoItemsSubscription,
+  VirtualList,
+} from './better-todo-core.js';
+
+const BETTER_TODO_VERSION = "0.15.1";
 
 // Enable detailed logging for debugging
 // Set to false in production to avoid unnecessary console output
@@ -70,6 +93,50 @@ class BetterTodoPanel extends HTMLElement {
     super();
     this.hass = null;
     this._selectedEntityId = null;
+    this._tasks = new TodoItemsSubscription(() => this._syncTaskList());
+    // The lists come from the catalog subscription, which only sends changes
+    // of Better ToDo lists, so other entities never cause panel work
+    this._lists = new ListCatalogSubscription((lists, event) => this._onCatalogChange(event));
+    // Rendered sidebar nodes by entity ID
+    this._listNodes = new Map();
+    // Entity ID the task list skeleton was rendered for
+    this._taskListEntityId = null;
+    // Visible rows of the active and completed tasks
+    this._activeList = null;
+    this._completedList = null;
+    this._completedExpanded = false;
+    this._completedShown = COMPLETED_PAGE_SIZE;
+  }
+
+  connectedCallback() {
+    if (this._hass) {
+      this._lists.connect(this._hass);
+    }
+    if (this._hass && this._selectedEntityId) {
+      this._tasks.connect(this._hass, this._selectedEntityId);
+    }
+    this._attachTaskLists();
+  }
+
+  disconnectedCallback() {
+    this._lists.disconnect();
+    this._tasks.disconnect();
+    this._detachTaskLists();
+  }
+
+  _attachTaskLists() {
+    const scroller = this.querySelector('.main-content');
+    if (this._activeList && scroller) {
+      this._activeList.attach(scroller);
+      this._completedList.attach(scroller);
+    }
+  }
+
+  _detachTaskLists() {
+    if (this._activeList) {
+      this._activeList.detach();
+      this._completedList.detach();
+    }
   }
 
   setConfig(config) {
@@ -79,12 +146,11 @@ class BetterTodoPanel extends HTMLElement {
 
   set hass(hass) {
     this._hass = hass;
+    this._lists.connect(hass);
     if (!this._initialized) {
       this._initialized = true;
       debugLog('Initializing Better ToDo Panel');
       this._render();
-    } else {
-      this._updateContent();
     }
   }
 
@@ -93,34 +159,14 @@ class BetterTodoPanel extends HTMLElement {
   }
 
   /**
-   * Get all Better ToDo entities
+   * Get the Better ToDo lists in display order
+   * @returns {Array<Object>} - Catalog entries { entity_id, name, active_tasks }
    */
-  _getBetterTodoEntities() {
-    if (!this._hass) {
-      debugLog('Cannot get entities: hass not available');
-      return [];
-    }
-    
-    const entities = [];
-    Object.keys(this._hass.states).forEach(entityId => {
-      if (entityId.startsWith('better_todo.')) {
-        const state = this._hass.states[entityId];
-        // Check if this is a Better ToDo entity by checking for recurrence_data attribute
-        if (state.attributes && state.attributes.recurrence_data !== undefined) {
-          entities.push(entityId);
-          debugLog(`Found Better ToDo entity: ${entityId}`, state);
-        }
-      }
-    });
-    
-    debugLog(`Found ${entities.length} Better ToDo entities total`);
-    
-    // Sort entities: ascending alphabetical order (A-Z) with "Shopping List" always last
-    return entities.sort((a, b) => {
-      const stateA = this._hass.states[a];
-      const stateB = this._hass.states[b];
-      const nameA = stateA?.attributes?.friendly_name || a;
-      const nameB = stateB?.attributes?.friendly_name || b;
+  _getSortedLists() {
+    // Sort lists: ascending alphabetical order (A-Z) with "Shopping List" always last
+    return this._lists.lists.sort((a, b) => {
+      const nameA = a.name || a.entity_id;
+      const nameB = b.name || b.entity_id;
       
       // Shopping List always goes last
       const isShoppingA = nameA.toLowerCase().includes('shopping');
@@ -144,13 +190,6 @@ class BetterTodoPanel extends HTMLElement {
     }
 
     debugLog('Rendering Better ToDo Panel');
-    const entities = this._getBetterTodoEntities();
-    
-    // Auto-select first entity if none selected
-    if (!this._selectedEntityId && entities.length > 0) {
-      this._selectedEntityId = entities[0];
-      debugLog(`Auto-selected entity: ${this._selectedEntityId}`);
-    }
 
     this.innerHTML = `
       <style>
@@ -286,13 +325,37 @@ class BetterTodoPanel extends HTMLElement {
       </div>
     `;
 
+    // The sidebar and its button are only rendered once, so their handlers
+    // are attached here instead of after each update
+    this.querySelector('#lists-container').addEventListener('click', (e) => {
+      const item = e.target.closest('.list-item');
+      if (item && item.dataset.entity !== this._selectedEntityId) {
+        this._selectedEntityId = item.dataset.entity;
+        this._updateContent();
+      }
+    });
+    this.querySelector('#create-list-button').addEventListener('click', () => {
+      this._handleCreateList();
+    });
+
+    this._updateContent();
+  }
+
+  /**
+   * Keep the selection on a list whose entity ID changed, then update
+   * @param {Object} event - Catalog change from ListCatalogSubscription
+   */
+  _onCatalogChange(event) {
+    if (event.type === 'update' && event.entity_id === this._selectedEntityId) {
+      this._selectedEntityId = event.list.entity_id;
+    }
     this._updateContent();
   }
 
   /**
    * Update the panel content
    */
-  async _updateContent() {
+  _updateContent() {
     const listsContainer = this.querySelector('#lists-container');
     const contentContainer = this.querySelector('#content-container');
     
@@ -301,11 +364,22 @@ class BetterTodoPanel extends HTMLElement {
       return;
     }
 
+    // Wait for the list catalog instead of showing an empty panel
+    if (!this._lists.loaded) {
+      return;
+    }
+
     debugLog('Updating panel content');
-    const entities = this._getBetterTodoEntities();
+    const lists = this._getSortedLists();
+
+    // Auto-select first list if none is selected or the selected one was removed
+    if (lists.length > 0 && !this._lists.getList(this._selectedEntityId)) {
+      this._selectedEntityId = lists[0].entity_id;
+      debugLog(`Auto-selected entity: ${this._selectedEntityId}`);
+    }
 
     // Render lists sidebar
-    if (entities.length === 0) {
+    if (lists.length === 0) {
       listsContainer.innerHTML = `
         <div class="empty-state">
           <ha-icon icon="mdi:format-list-checks"></ha-icon>
@@ -314,82 +388,78 @@ class BetterTodoPanel extends HTMLElement {
         </div>
       `;
       contentContainer.innerHTML = '';
+      this._selectedEntityId = null;
+      this._tasks.disconnect();
+      this._listNodes = new Map();
+      this._taskListEntityId = null;
+      this._detachTaskLists();
+      this._activeList = null;
+      this._completedList = null;
       return;
     }
 
-    listsContainer.innerHTML = entities.map(entityId => {
-      const state = this._hass.states[entityId];
-      const name = state.attributes.friendly_name || entityId;
-      // Capitalize first letter of each word in the name
-      const displayName = capitalizeWords(name);
-      // Use 'items' attribute which contains clean task list
-      const items = state.attributes.items || [];
-      const activeCount = items.filter(item => item.status !== 'completed').length;
-      const isSelected = entityId === this._selectedEntityId;
+    this._syncLists(listsContainer, lists);
+
+    // Render main content with inline task list
+    const list = this._selectedEntityId ? this._lists.getList(this._selectedEntityId) : null;
+    if (list) {
+      const name = list.name || this._selectedEntityId;
+      
+      // Follow the selected list's tasks
+      this._tasks.connect(this._hass, this._selectedEntityId);
       
-      // Escape values for safe HTML attribute usage
-      const safeEntityId = this._escapeHtml(entityId);
-      const safeName = this._escapeHtml(displayName);
+      // Render the task list once per selected list, then only patch it
+      if (this._taskListEntityId !== this._selectedEntityId) {
+        this._renderTaskList(contentContainer, this._selectedEntityId, name);
+      } else {
+        this.querySelector('.task-list-header h1').textContent = name;
+      }
+      this._syncTaskList();
+    }
+  }
 
-      return `
-        <div class="list-item ${isSelected ? 'selected' : ''}" data-entity="${safeEntityId}">
+  /**
+   * Patch the sidebar to show the given lists, one node per list
+   * @param {HTMLElement} container - Lists container
+   * @param {Array<Object>} lists - Catalog entries in display order
+   */
+  _syncLists(container, lists) {
+    const listNodes = new Map();
+    const nodes = lists.map(list => {
+      const entityId = list.entity_id;
+      let node = this._listNodes.get(entityId);
+      if (!node) {
+        node = document.createElement('div');
+        node.className = 'list-item';
+        node.dataset.entity = entityId;
+        node.innerHTML = `
           <ha-icon icon="mdi:format-list-checks"></ha-icon>
           <div class="list-item-content">
-            <div class="list-item-name">${safeName}</div>
-            <div class="list-item-count">${activeCount} active</div>
+            <div class="list-item-name"></div>
+            <div class="list-item-count"></div>
           </div>
-        </div>
-      `;
-    }).join('');
-
-    // Add click handlers to list items
-    listsContainer.querySelectorAll('.list-item').forEach(item => {
-      item.addEventListener('click', () => {
-        this._selectedEntityId = item.dataset.entity;
-        this._updateContent();
-      });
+        `;
+      }
+      if (node._list !== list) {
+        // Capitalize first letter of each word in the name
+        const name = list.name || entityId;
+        node.querySelector('.list-item-name').textContent = capitalizeWords(name);
+        node.querySelector('.list-item-count').textContent = `${list.active_tasks} active`;
+        node._list = list;
+      }
+      node.classList.toggle('selected', entityId === this._selectedEntityId);
+      listNodes.set(entityId, node);
+      return node;
     });
-
-    // Add click handler to create list button
-    const createListButton = this.querySelector('#create-list-button');
-    if (createListButton) {
-      createListButton.addEventListener('click', () => {
-        this._handleCreateList();
-      });
-    }
-
-    // Render main content with inline task list
-    if (this._selectedEntityId) {
-      const state = this._hass.states[this._selectedEntityId];
-      const name = state.attributes.friendly_name || this._selectedEntityId;
-      
-      // Render task list inline
-      this._renderTaskList(contentContainer, this._selectedEntityId, name);
-    }
+    placeChildren(container, nodes);
+    this._listNodes = listNodes;
   }
 
   /**
    * Render an inline task list (no external card dependency)
    */
   _renderTaskList(container, entityId, title) {
-    const state = this._hass.states[entityId];
-    if (!state) {
-      errorLog('Entity state not found:', entityId);
-      return;
-    }
-
-    debugLog('Rendering task list for:', entityId, state);
-
-    // Get items from entity attributes
-    // Note: Using 'items' instead of 'todo_items' to fix display issue
-    // The panel was showing "You have no to-do items!" because 'todo_items'
-    // includes header items for custom cards, while 'items' provides clean
-    // task list for native card compatibility and proper rendering
-    const items = state.attributes.items || [];
-    const activeItems = items.filter(item => item.status !== 'completed');
-    const completedItems = items.filter(item => item.status === 'completed');
-
-    debugLog(`Found ${activeItems.length} active and ${completedItems.length} completed items`);
+    debugLog('Rendering task list for:', entityId);
 
     container.innerHTML = `
       <style>
@@ -510,6 +580,32 @@ class BetterTodoPanel extends HTMLElement {
           font-weight: 500;
           color: var(--secondary-text-color);
           background-color: var(--secondary-background-color);
+          position: sticky;
+          top: 0;
+          z-index: 1;
+        }
+        .completed-header {
+          display: flex;
+          align-items: center;
+          gap: 8px;
+          cursor: pointer;
+        }
+        .completed-header ha-icon {
+          --mdc-icon-size: 20px;
+          transition: transform 0.2s;
+        }
+        .completed-header.expanded ha-icon {
+          transform: rotate(90deg);
+        }
+        .show-more-button {
+          display: block;
+          width: 100%;
+          padding: 12px 16px;
+          border: none;
+          background: none;
+          color: var(--primary-color);
+          font-size: 14px;
+          cursor: pointer;
         }
         .empty-state {
           padding: 48px 16px;
@@ -550,7 +646,7 @@ class BetterTodoPanel extends HTMLElement {
       
       <div class="task-list-container">
         <div class="task-list-header">
-          <h1>${this._escapeHtml(title)}</h1>
+          <h1>${escapeHtml(title)}</h1>
         </div>
         
         <div class="task-card">
@@ -564,26 +660,18 @@ class BetterTodoPanel extends HTMLElement {
           </div>
           
           <div class="task-card-content">
-            ${activeItems.length === 0 && completedItems.length === 0 ? `
-              <div class="empty-state">
-                <ha-icon icon="mdi:checkbox-marked-circle-outline"></ha-icon>
-                <p>No tasks yet</p>
-                <p style="font-size: 0.9em;">Click "Add Task" to create your first task</p>
-              </div>
-            ` : ''}
-            
-            ${activeItems.length > 0 ? `
-              <div class="active-section">
-                ${activeItems.map(item => this._renderTaskItem(item, false)).join('')}
-              </div>
-            ` : ''}
-            
-            ${completedItems.length > 0 ? `
-              <div class="section-header">Completed</div>
-              <div class="completed-section">
-                ${completedItems.map(item => this._renderTaskItem(item, true)).join('')}
-              </div>
-            ` : ''}
+            <div class="empty-state" id="tasks-empty">
+              <ha-icon icon="mdi:checkbox-marked-circle-outline"></ha-icon>
+              <p>No tasks yet</p>
+              <p style="font-size: 0.9em;">Click "Add Task" to create your first task</p>
+            </div>
+            <div class="active-section" id="active-section"></div>
+            <div class="section-header completed-header" id="completed-header">
+              <ha-icon icon="mdi:chevron-right"></ha-icon>
+              <span></span>
+            </div>
+            <div class="completed-section" id="completed-section"></div>
+            <button class="show-more-button" id="completed-more">Show more</button>
           </div>
         </div>
         
@@ -593,13 +681,85 @@ class BetterTodoPanel extends HTMLElement {
       </div>
     `;
 
+    this._taskListEntityId = entityId;
+    this._completedExpanded = false;
+    this._completedShown = COMPLETED_PAGE_SIZE;
+    this._detachTaskLists();
+    const rowOptions = {
+      createRow: () => this._createTaskNode(),
+      patchRow: (node, item) => this._patchTaskNode(node, item, item.status === 'completed'),
+    };
+    this._activeList = new VirtualList(this.querySelector('#active-section'), rowOptions);
+    this._completedList = new VirtualList(this.querySelector('#completed-section'), rowOptions);
+    this._attachTaskLists();
     this._attachTaskListEventListeners(entityId);
   }
 
   /**
-   * Render a single task item
+   * Patch the task list to match the subscription
+   * Only the visible rows are rendered, and only the ones whose task changed
+   * are updated. Completed tasks are shown a page at a time once expanded.
+   */
+  _syncTaskList() {
+    if (!this._activeList) {
+      return;
+    }
+
+    // Get items from the websocket subscription (clean task list without headers)
+    const current = this._tasks.entityId === this._taskListEntityId;
+    const items = current ? this._tasks.items : [];
+    const { active: activeItems, completed: completedItems } = current
+      ? splitItems(this._tasks)
+      : { active: [], completed: [] };
+
+    debugLog(`Found ${activeItems.length} active and ${completedItems.length} completed items`);
+
+    this._activeList.setItems(activeItems);
+    this._completedList.setItems(
+      this._completedExpanded ? completedItems.slice(0, this._completedShown) : []
+    );
+
+    this.querySelector('#tasks-empty').style.display = items.length === 0 ? '' : 'none';
+    const completedHeader = this.querySelector('#completed-header');
+    completedHeader.style.display = completedItems.length > 0 ? '' : 'none';
+    completedHeader.classList.toggle('expanded', this._completedExpanded);
+    completedHeader.querySelector('span').textContent = `Completed (${completedItems.length})`;
+    this.querySelector('#completed-more').style.display =
+      this._completedExpanded && completedItems.length > this._completedShown ? '' : 'none';
+  }
+
+  /**
+   * Create the node of a task, filled in by _patchTaskNode
+   */
+  _createTaskNode() {
+    const node = document.createElement('div');
+    node.className = 'task-item';
+    node.innerHTML = `
+      <ha-checkbox></ha-checkbox>
+      <div class="task-item-content">
+        <div class="task-item-summary"></div>
+        <div class="task-item-description"></div>
+      </div>
+      <div class="task-item-due"><ha-icon icon="mdi:calendar"></ha-icon> <span></span></div>
+    `;
+
+    // Checkbox for toggling task status, attached once per node
+    const checkbox = node.querySelector('ha-checkbox');
+    checkbox.addEventListener('change', (e) => {
+      e.stopPropagation(); // Prevent event from bubbling to task item
+      this._toggleTaskStatus(this._taskListEntityId, node.dataset.uid, e.target.checked);
+    });
+    // Also prevent click events on checkbox from bubbling
+    checkbox.addEventListener('click', (e) => {
+      e.stopPropagation();
+    });
+    return node;
+  }
+
+  /**
+   * Update the node of a task in place
    */
-  _renderTaskItem(item, isCompleted) {
+  _patchTaskNode(node, item, isCompleted) {
     // Safely format due date with error handling
     let dueDate = '';
     if (item.due) {
@@ -610,33 +770,20 @@ class BetterTodoPanel extends HTMLElement {
         dueDate = String(item.due);
       }
     }
-    
-    const summary = this._escapeHtml(item.summary || '');
-    const description = item.description ? this._escapeHtml(item.description) : '';
-    // Escape UID for safe HTML attribute usage
-    const safeUid = this._escapeHtml(item.uid || '');
-    // Escape due date for safe HTML content
-    const safeDueDate = this._escapeHtml(dueDate);
-    
-    return `
-      <div class="task-item ${isCompleted ? 'completed' : ''}" data-uid="${safeUid}">
-        <ha-checkbox ${isCompleted ? 'checked' : ''}></ha-checkbox>
-        <div class="task-item-content">
-          <div class="task-item-summary">${summary}</div>
-          ${description ? `<div class="task-item-description">${description}</div>` : ''}
-        </div>
-        ${safeDueDate ? `<div class="task-item-due"><ha-icon icon="mdi:calendar"></ha-icon> ${safeDueDate}</div>` : ''}
-      </div>
-    `;
-  }
 
-  /**
-   * Escape HTML to prevent XSS
-   */
-  _escapeHtml(text) {
-    const div = document.createElement('div');
-    div.textContent = text;
-    return div.innerHTML;
+    // Text is set through textContent, so nothing needs escaping
+    node.dataset.uid = item.uid || '';
+    node.classList.toggle('completed', isCompleted);
+    const checkbox = node.querySelector('ha-checkbox');
+    checkbox.checked = isCompleted;
+    checkbox.toggleAttribute('checked', isCompleted);
+    node.querySelector('.task-item-summary').textContent = item.summary || '';
+    const description = node.querySelector('.task-item-description');
+    description.textContent = item.description || '';
+    description.style.display = item.description ? '' : 'none';
+    const due = node.querySelector('.task-item-due');
+    due.querySelector('span').textContent = dueDate;
+    due.style.display = dueDate ? '' : 'none';
   }
 
   /**
@@ -666,39 +813,31 @@ class BetterTodoPanel extends HTMLElement {
       fabBtn.addEventListener('click', () => this._openTaskDialog(entityId, null));
     }
 
-    // Checkboxes for toggling task status
-    const checkboxes = this.querySelectorAll('.task-item ha-checkbox');
-    checkboxes.forEach(checkbox => {
-      checkbox.addEventListener('change', (e) => {
-        e.stopPropagation(); // Prevent event from bubbling to task item
-        const taskItem = e.target.closest('.task-item');
-        const uid = taskItem.dataset.uid;
-        const isCompleted = e.target.checked;
-        this._toggleTaskStatus(entityId, uid, isCompleted);
-      });
-      
-      // Also prevent click events on checkbox from bubbling
-      checkbox.addEventListener('click', (e) => {
-        e.stopPropagation();
-      });
+    // Expand or collapse the completed tasks
+    this.querySelector('#completed-header').addEventListener('click', () => {
+      this._completedExpanded = !this._completedExpanded;
+      this._completedShown = COMPLETED_PAGE_SIZE;
+      this._syncTaskList();
     });
 
-    // Click on task item to edit
-    const taskItems = this.querySelectorAll('.task-item');
-    taskItems.forEach(item => {
-      item.addEventListener('click', (e) => {
-        // Only trigger if not clicking on checkbox or within checkbox area
-        const clickedCheckbox = e.target.closest('ha-checkbox');
-        if (!clickedCheckbox) {
-          const uid = item.dataset.uid;
-          const state = this._hass.states[entityId];
-          const items = state.attributes.items || [];
-          const task = items.find(t => t.uid === uid);
-          if (task) {
-            this._openTaskDialog(entityId, task);
-          }
-        }
-      });
+    // Show the next page of completed tasks
+    this.querySelector('#completed-more').addEventListener('click', () => {
+      this._completedShown += COMPLETED_PAGE_SIZE;
+      this._syncTaskList();
+    });
+
+    // Click on task item to edit, handled once for every current and future item
+    const content = this.querySelector('.task-card-content');
+    content.addEventListener('click', (e) => {
+      // Only trigger if not clicking on checkbox or within checkbox area
+      const item = e.target.closest('.task-item');
+      if (!item || e.target.closest('ha-checkbox')) {
+        return;
+      }
+      const task = this._tasks.getItem(item.dataset.uid);
+      if (task) {
+        this._openTaskDialog(entityId, task);
+      }
     });
   }
 
@@ -709,7 +848,7 @@ class BetterTodoPanel extends HTMLElement {
   _showToast(message) {
     if (this._hass) {
       // Sanitize message to prevent XSS
-      const safeMessage = this._escapeHtml(String(message));
+      const safeMessage = escapeHtml(String(message));
       this._hass.callService('persistent_notification', 'create', {
         message: safeMessage,
         title: 'Better ToDo',
@@ -755,11 +894,7 @@ class BetterTodoPanel extends HTMLElement {
     debugLog('Toggling task status:', uid, isCompleted);
 
     try {
-      await this._hass.callService('better_todo', 'update_task', {
-        entity_id: entityId,
-        uid: uid,
-        status: isCompleted ? 'completed' : 'needs_action',
-      });
+      await setTaskStatus(this._hass, entityId, uid, isCompleted);
       
       debugLog('Task status updated successfully');
       // The state will update automatically and trigger re-render
@@ -783,374 +918,11 @@ class BetterTodoPanel extends HTMLElement {
    * This opens the full task dialog with all options (description, due date, recurrence, etc.)
    */
   _openTaskDialog(entityId, task) {
-    const isEdit = task !== null;
-    const language = this._hass.language || 'en';
-    const isSpanish = language.startsWith('es');
-    
-    // Get recurrence data for the task if editing
-    let recurrenceData = null;
-    if (isEdit) {
-      const state = this._hass.states[entityId];
-      recurrenceData = state?.attributes?.recurrence_data?.[task.uid];
-    }
-    
-    // Create dialog
-    const dialog = document.createElement('ha-dialog');
-    dialog.heading = isSpanish 
-      ? (isEdit ? 'Editar tarea' : 'Nueva tarea')
-      : (isEdit ? 'Edit Task' : 'New Task');
-    
-    const content = document.createElement('div');
-    content.style.padding = '16px';
-    
-    // Build form HTML
-    content.innerHTML = `
-      <style>
-        .form-row {
-          margin-bottom: 16px;
-        }
-        .form-row label {
-          display: block;
-          margin-bottom: 4px;
-          font-weight: 500;
-        }
-        .form-row input[type="text"],
-        .form-row input[type="date"],
-        .form-row input[type="number"],
-        .form-row textarea,
-        .form-row select {
-          width: 100%;
-          padding: 8px;
-          border: 1px solid var(--divider-color);
-          border-radius: 4px;
-          background-color: var(--card-background-color);
-          color: var(--primary-text-color);
-          font-family: inherit;
-          font-size: 14px;
-        }
-        .form-row textarea {
-          min-height: 80px;
-          resize: vertical;
-        }
-        .checkbox-row {
-          display: flex;
-          align-items: center;
-          margin-bottom: 16px;
-        }
-        .checkbox-row input[type="checkbox"] {
-          margin-right: 8px;
-        }
-        .section-title {
-          font-weight: 600;
-          margin-top: 20px;
-          margin-bottom: 12px;
-          padding-bottom: 8px;
-          border-bottom: 1px solid var(--divider-color);
-        }
-        .inline-fields {
-          display: flex;
-          gap: 12px;
-        }
-        .inline-fields .form-row {
-          flex: 1;
-        }
-        .radio-group {
-          margin-left: 24px;
-          padding: 8px;
-          background-color: var(--secondary-background-color);
-          border-radius: 4px;
-        }
-        .radio-option {
-          display: flex;
-          align-items: center;
-          margin-bottom: 8px;
-        }
-        .radio-option input[type="radio"] {
-          margin-right: 8px;
-        }
-        .radio-option label {
-          margin: 0 8px 0 0;
-          min-width: 80px;
-        }
-        .disabled {
-          opacity: 0.5;
-          pointer-events: none;
-        }
-      </style>
-      
-      <div class="checkbox-row">
-        <input type="checkbox" id="task-status" ${isEdit && task.status === 'completed' ? 'checked' : ''}>
-        <label for="task-status">${isSpanish ? 'Tarea completada' : 'Task completed'}</label>
-      </div>
-      
-      <div class="form-row">
-        <label for="task-summary">${isSpanish ? 'Nombre de la tarea' : 'Task name'} *</label>
-        <input type="text" id="task-summary" value="${isEdit ? this._escapeHtml(task.summary) : ''}" required>
-      </div>
-      
-      <div class="form-row">
-        <label for="task-description">${isSpanish ? 'Descripción' : 'Description'}</label>
-        <textarea id="task-description">${isEdit && task.description ? this._escapeHtml(task.description) : ''}</textarea>
-      </div>
-      
-      <div class="form-row">
-        <label for="task-due">${isSpanish ? 'Fecha de vencimiento' : 'Due date'}</label>
-        <input type="date" id="task-due" value="${isEdit && task.due ? task.due : ''}">
-      </div>
-      
-      <div class="section-title">${isSpanish ? 'Repetición' : 'Recurrence'}</div>
-      
-      <div class="checkbox-row">
-        <input type="checkbox" id="recurrence-enabled" ${recurrenceData?.recurrence_enabled ? 'checked' : ''}>
-        <label for="recurrence-enabled">${isSpanish ? 'Activar repetición' : 'Enable recurrence'}</label>
-      </div>
-      
-      <div id="recurrence-settings" class="${recurrenceData?.recurrence_enabled ? '' : 'disabled'}">
-        <div class="inline-fields">
-          <div class="form-row">
-            <label for="recurrence-interval">${isSpanish ? 'Cada' : 'Every'}</label>
-            <input type="number" id="recurrence-interval" min="1" max="365" value="${recurrenceData?.recurrence_interval || 1}">
-          </div>
-          <div class="form-row">
-            <label for="recurrence-unit">${isSpanish ? 'Unidad' : 'Unit'}</label>
-            <select id="recurrence-unit">
-              <option value="days" ${recurrenceData?.recurrence_unit === 'days' || !recurrenceData ? 'selected' : ''}>${isSpanish ? 'días' : 'days'}</option>
-              <option value="weeks" ${recurrenceData?.recurrence_unit === 'weeks' ? 'selected' : ''}>${isSpanish ? 'semanas' : 'weeks'}</option>
-              <option value="months" ${recurrenceData?.recurrence_unit === 'months' ? 'selected' : ''}>${isSpanish ? 'meses' : 'months'}</option>
-              <option value="years" ${recurrenceData?.recurrence_unit === 'years' ? 'selected' : ''}>${isSpanish ? 'años' : 'years'}</option>
-            </select>
-          </div>
-        </div>
-      </div>
-      
-      <div class="section-title">${isSpanish ? 'Detener repetición' : 'Stop recurrence'}</div>
-      
-      <div class="checkbox-row">
-        <input type="checkbox" id="recurrence-end-enabled" ${recurrenceData?.recurrence_end_enabled ? 'checked' : ''}>
-        <label for="recurrence-end-enabled">${isSpanish ? 'Activar límite de repetición' : 'Enable recurrence limit'}</label>
-      </div>
-      
-      <div id="recurrence-end-settings" class="${recurrenceData?.recurrence_end_enabled ? '' : 'disabled'}">
-        <div class="radio-group">
-          <div class="radio-option">
-            <input type="radio" id="end-type-count" name="end-type" value="count" 
-              ${!recurrenceData?.recurrence_end_type || recurrenceData?.recurrence_end_type === 'count' ? 'checked' : ''}>
-            <label for="end-type-count">${isSpanish ? 'Después de' : 'After'}</label>
-            <input type="number" id="recurrence-end-count" min="1" max="999" value="${recurrenceData?.recurrence_end_count || 1}" 
-              style="width: 100px; margin-right: 8px;">
-            <span>${isSpanish ? 'repeticiones' : 'repetitions'}</span>
-          </div>
-          <div class="radio-option">
-            <input type="radio" id="end-type-date" name="end-type" value="date"
-              ${recurrenceData?.recurrence_end_type === 'date' ? 'checked' : ''}>
-            <label for="end-type-date">${isSpanish ? 'Hasta' : 'Until'}</label>
-            <input type="date" id="recurrence-end-date" value="${recurrenceData?.recurrence_end_date || ''}" style="flex: 1;">
-          </div>
-        </div>
-      </div>
-    `;
-    
-    dialog.appendChild(content);
-    
-    // Add event listeners for checkbox toggles
-    const recurrenceEnabledCheckbox = content.querySelector('#recurrence-enabled');
-    const recurrenceSettings = content.querySelector('#recurrence-settings');
-    const recurrenceEndEnabledCheckbox = content.querySelector('#recurrence-end-enabled');
-    const recurrenceEndSettings = content.querySelector('#recurrence-end-settings');
-    
-    recurrenceEnabledCheckbox.addEventListener('change', (e) => {
-      if (e.target.checked) {
-        recurrenceSettings.classList.remove('disabled');
-      } else {
-        recurrenceSettings.classList.add('disabled');
-      }
-    });
-    
-    recurrenceEndEnabledCheckbox.addEventListener('change', (e) => {
-      if (e.target.checked) {
-        recurrenceEndSettings.classList.remove('disabled');
-      } else {
-        recurrenceEndSettings.classList.add('disabled');
-      }
-    });
-    
-    // Add event listeners for radio buttons to select when their inputs are focused
-    const endCountInput = content.querySelector('#recurrence-end-count');
-    const endDateInput = content.querySelector('#recurrence-end-date');
-    const endTypeCountRadio = content.querySelector('#end-type-count');
-    const endTypeDateRadio = content.querySelector('#end-type-date');
-    
-    endCountInput.addEventListener('focus', () => {
-      endTypeCountRadio.checked = true;
-    });
-    
-    endDateInput.addEventListener('focus', () => {
-      endTypeDateRadio.checked = true;
-    });
-    
-    // Set dialog properties
-    dialog.setAttribute('open', '');
-    dialog.setAttribute('scrimClickAction', '');
-    dialog.setAttribute('escapeKeyAction', '');
-    
-    // Add action buttons
-    const actionsDiv = document.createElement('div');
-    actionsDiv.slot = 'primaryAction';
-    actionsDiv.innerHTML = `
-      <mwc-button>
-        ${isSpanish ? 'Guardar' : 'Save'}
-      </mwc-button>
-    `;
-    dialog.appendChild(actionsDiv);
-    
-    const secondaryActionsDiv = document.createElement('div');
-    secondaryActionsDiv.slot = 'secondaryAction';
-    secondaryActionsDiv.innerHTML = `
-      <mwc-button>
-        ${isSpanish ? 'Cancelar' : 'Cancel'}
-      </mwc-button>
-    `;
-    dialog.appendChild(secondaryActionsDiv);
-    
-    // Append to body and show
-    document.body.appendChild(dialog);
-    
-    // Setup button click handlers
-    const saveButton = dialog.querySelector('[slot="primaryAction"] mwc-button');
-    const cancelButton = dialog.querySelector('[slot="secondaryAction"] mwc-button');
-    
-    saveButton.addEventListener('click', () => {
-      this._saveTaskFromDialog(entityId, task, content);
-      dialog.close();
-    });
-    
-    cancelButton.addEventListener('click', () => {
-      dialog.close();
-    });
-    
-    // Remove dialog from DOM when closed
-    dialog.addEventListener('closed', () => {
-      document.body.removeChild(dialog);
+    const recurrenceData = task ? this._tasks.recurrenceData[task.uid] : null;
+    openTaskDialog(this._hass, task, recurrenceData, (content) => {
+      saveTask(this._hass, entityId, task, content, (message) => this._showToast(message));
     });
   }
-
-  /**
-   * Save task from dialog
-   */
-  async _saveTaskFromDialog(entityId, task, content) {
-    const isEdit = task !== null;
-    
-    // Get form values
-    const status = content.querySelector('#task-status').checked ? 'completed' : 'needs_action';
-    const summary = content.querySelector('#task-summary').value.trim();
-    const description = content.querySelector('#task-description').value.trim();
-    const due = content.querySelector('#task-due').value;
-    
-    // Validate required fields
-    if (!summary) {
-      this._showToast(this._hass.language?.startsWith('es') ? 'El nombre de la tarea es obligatorio' : 'Task name is required');
-      return;
-    }
-    
-    // Get recurrence values
-    const recurrenceEnabled = content.querySelector('#recurrence-enabled').checked;
-    const recurrenceInterval = parseInt(content.querySelector('#recurrence-interval').value) || 1;
-    const recurrenceUnit = content.querySelector('#recurrence-unit').value;
-    const recurrenceEndEnabled = content.querySelector('#recurrence-end-enabled').checked;
-    const endType = content.querySelector('input[name="end-type"]:checked').value;
-    const endCount = parseInt(content.querySelector('#recurrence-end-count').value) || 1;
-    const endDate = content.querySelector('#recurrence-end-date').value;
-    
-    try {
-      if (isEdit) {
-        // Update existing task
-        await this._hass.callService('better_todo', 'update_task', {
-          entity_id: entityId,
-          uid: task.uid,
-          summary: summary,
-          description: description || null,
-          due: due || null,
-          status: status,
-        });
-        
-        // Set recurrence if enabled
-        if (recurrenceEnabled) {
-          const recurrenceData = {
-            entity_id: entityId,
-            task_uid: task.uid,
-            recurrence_enabled: true,
-            recurrence_interval: recurrenceInterval,
-            recurrence_unit: recurrenceUnit,
-            recurrence_end_enabled: recurrenceEndEnabled,
-          };
-          
-          if (recurrenceEndEnabled) {
-            recurrenceData.recurrence_end_type = endType;
-            if (endType === 'count') {
-              recurrenceData.recurrence_end_count = endCount;
-            } else {
-              recurrenceData.recurrence_end_date = endDate;
-            }
-          }
-          
-          await this._hass.callService('better_todo', 'set_task_recurrence', recurrenceData);
-        } else {
-          // Disable recurrence
-          await this._hass.callService('better_todo', 'set_task_recurrence', {
-            entity_id: entityId,
-            task_uid: task.uid,
-            recurrence_enabled: false,
-          });
-        }
-      } else {
-        // Create new task
-        await this._hass.callService('better_todo', 'create_task', {
-          entity_id: entityId,
-          summary: summary,
-          description: description || undefined,
-          due: due || undefined,
-        });
-        
-        // If recurrence is enabled, we need to get the UID of the newly created task
-        if (recurrenceEnabled) {
-          // Wait for the task to be created and state to update
-          await new Promise(resolve => setTimeout(resolve, 500));
-          
-          // Get the latest state
-          const state = this._hass.states[entityId];
-          const items = state?.attributes?.items || [];
-          
-          // Find the newly created task
-          const newTask = items.find(i => i.summary === summary && i.status === 'needs_action');
-          
-          if (newTask) {
-            const recurrenceData = {
-              entity_id: entityId,
-              task_uid: newTask.uid,
-              recurrence_enabled: true,
-              recurrence_interval: recurrenceInterval,
-              recurrence_unit: recurrenceUnit,
-              recurrence_end_enabled: recurrenceEndEnabled,
-            };
-            
-            if (recurrenceEndEnabled) {
-              recurrenceData.recurrence_end_type = endType;
-              if (endType === 'count') {
-                recurrenceData.recurrence_end_count = endCount;
-              } else {
-                recurrenceData.recurrence_end_date = endDate;
-              }
-            }
-            
-            await this._hass.callService('better_todo', 'set_task_recurrence', recurrenceData);
-          }
-        }
-      }
-    } catch (err) {
-      errorLog('Error saving task:', err);
-      this._showToast(this._hass.language?.startsWith('es') ? 'Error al guardar la tarea' : 'Error saving task');
-    }
-  }
 }
 
 // Only define the custom element if it hasn't been defined yet
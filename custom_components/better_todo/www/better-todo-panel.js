@@ -173,7 +173,7 @@ class BetterTodoPanel {
         const state = this.hass.states[entityId];
         // Check if this is a Better ToDo entity
         // We can identify them by checking if they have our custom attributes
-        if (state.attributes && state.attributes.recurrence_data !== undefined) {
+        if (state.attributes && state.attributes.total_tasks !== undefined) {
           entities.push(entityId);
         }
       }
@@ -10,12 +10,34 @@
  * Usage in yaml:
  * type: custom:better-todo-simple-card
  * entity: better_todo.tasks
+ *
+ * Tasks are received through the better_todo/items/subscribe websocket command.
  */
 
+import { escapeHtml, setTaskStatus, splitItems, TodoItemsSubscription } from './better-todo-core.js';
+
 class BetterTodoSimpleCard extends HTMLElement {
   constructor() {
     super();
     this.attachShadow({ mode: 'open' });
+    this._tasks = new TodoItemsSubscription(() => {
+      const entityState = this._hass?.states[this._entity];
+      if (entityState) {
+        this._render(entityState);
+      }
+    });
+    // What the card was last rendered from: { state, version }
+    this._rendered = {};
+  }
+
+  connectedCallback() {
+    if (this._hass) {
+      this._tasks.connect(this._hass, this._entity);
+    }
+  }
+
+  disconnectedCallback() {
+    this._tasks.disconnect();
   }
 
   /**
@@ -27,6 +49,7 @@ class BetterTodoSimpleCard extends HTMLElement {
     }
     this._config = config;
     this._entity = config.entity;
+    this._rendered = {};
   }
 
   /**
@@ -39,12 +62,17 @@ class BetterTodoSimpleCard extends HTMLElement {
     const entityState = hass.states[this._entity];
     
     if (!entityState) {
+      this._rendered = {};
       this._renderError('Entity not found: ' + this._entity);
       return;
     }
 
-    // Render the card
-    this._render(entityState);
+    // Follow the entity's tasks and render the card, unless neither the
+    // entity nor its tasks changed since the last render
+    this._tasks.connect(hass, this._entity);
+    if (entityState !== this._rendered.state || this._tasks.version !== this._rendered.version) {
+      this._render(entityState);
+    }
   }
 
   /**
@@ -61,7 +89,7 @@ class BetterTodoSimpleCard extends HTMLElement {
     this.shadowRoot.innerHTML = `
       <ha-card>
         <div class="card-content">
-          <div class="error">${this._escapeHtml(message)}</div>
+          <div class="error">${escapeHtml(message)}</div>
         </div>
       </ha-card>
       <style>
@@ -73,30 +101,20 @@ class BetterTodoSimpleCard extends HTMLElement {
     `;
   }
 
-  /**
-   * Escape HTML to prevent XSS
-   */
-  _escapeHtml(text) {
-    const div = document.createElement('div');
-    div.textContent = text;
-    return div.innerHTML;
-  }
-
   /**
    * Render the card
    */
   _render(entityState) {
-    const items = entityState.attributes.items || [];
+    this._rendered = { state: entityState, version: this._tasks.version };
     const title = this._config.title || entityState.attributes.friendly_name || 'To-do List';
     
     // Separate active and completed items
-    const activeItems = items.filter(item => item.status === 'needs_action');
-    const completedItems = items.filter(item => item.status === 'completed');
+    const { active: activeItems, completed: completedItems } = splitItems(this._tasks);
 
     this.shadowRoot.innerHTML = `
       <ha-card>
         <div class="card-header">
-          <div class="name">${this._escapeHtml(title)}</div>
+          <div class="name">${escapeHtml(title)}</div>
         </div>
         <div class="card-content">
           ${this._renderAddItemForm()}
@@ -142,7 +160,7 @@ class BetterTodoSimpleCard extends HTMLElement {
 
     return `
       <div class="items-section">
-        <div class="section-header">${this._escapeHtml(title)}</div>
+        <div class="section-header">${escapeHtml(title)}</div>
         <div class="items-container">
           ${itemsHtml}
         </div>
@@ -158,12 +176,12 @@ class BetterTodoSimpleCard extends HTMLElement {
     const completedClass = isCompleted ? 'completed' : '';
     
     return `
-      <div class="item ${completedClass}" data-uid="${this._escapeHtml(item.uid || '')}">
+      <div class="item ${completedClass}" data-uid="${escapeHtml(item.uid || '')}">
         <ha-checkbox ${checked} class="item-checkbox"></ha-checkbox>
         <div class="item-content">
-          <div class="item-summary">${this._escapeHtml(item.summary || '')}</div>
-          ${item.due ? `<div class="item-due">Due: ${this._escapeHtml(item.due)}</div>` : ''}
-          ${item.description ? `<div class="item-description">${this._escapeHtml(item.description)}</div>` : ''}
+          <div class="item-summary">${escapeHtml(item.summary || '')}</div>
+          ${item.due ? `<div class="item-due">Due: ${escapeHtml(item.due)}</div>` : ''}
+          ${item.description ? `<div class="item-description">${escapeHtml(item.description)}</div>` : ''}
         </div>
       </div>
     `;
@@ -344,13 +362,7 @@ class BetterTodoSimpleCard extends HTMLElement {
   _handleToggleItem(uid, checked) {
     if (!uid) return;
 
-    const newStatus = checked ? 'completed' : 'needs_action';
-
-    this._hass.callService('better_todo', 'update_task', {
-      entity_id: this._entity,
-      uid: uid,
-      status: newStatus
-    });
+    setTaskStatus(this._hass, this._entity, uid, checked);
   }
 
   /**
@@ -359,13 +371,8 @@ class BetterTodoSimpleCard extends HTMLElement {
   _handleEditItem(uid) {
     if (!uid) return;
 
-    // Get entity state
-    const entityState = this._hass.states[this._entity];
-    if (!entityState) return;
-
     // Find the item
-    const items = entityState.attributes.items || [];
-    const item = items.find(i => i.uid === uid);
+    const item = this._tasks.getItem(uid);
     if (!item) return;
 
     // Open more-info dialog
@@ -392,7 +399,7 @@ window.customCards.push({
 });
 
 console.info(
-  '%c BETTER-TODO-SIMPLE-CARD %c v1.0.0 ',
+  '%c BETTER-TODO-SIMPLE-CARD %c v1.2.0 ',
   'background-color: #555;color: #fff;font-weight: bold;',
   'background-color: #4caf50;color: #fff;font-weight: bold;'
 );
@@ -0,0 +1,40 @@
+import{escapeHtml,groupItems,openTaskDialog,renderGroup,saveTask,setTaskStatus,TodoItemsSubscription,}from'./better-todo-core.1bd6ab1c.js';class BetterTodoCard extends HTMLElement{constructor(){super();this._hass=null;this._config=null;this._cardElement=null;this._tasks=new TodoItemsSubscription(()=>this._updateCard());this._rendered={};}
+connectedCallback(){if(this._hass&&this._config){this._tasks.connect(this._hass,this._config.entity);}}
+disconnectedCallback(){this._tasks.disconnect();}
+setConfig(config){if(!config.entity){throw new Error('Please define an entity');}
+this._config=config;this._rendered={};this._createCard();}
+set hass(hass){this._hass=hass;if(this._config){this._tasks.connect(hass,this._config.entity);}
+this._updateCard();}
+_createCard(){if(!this._cardElement){this._cardElement=document.createElement('ha-card');this.appendChild(this._cardElement);}}
+async _handleCheckboxChange(e){const checkbox=e.target;const uid=checkbox.dataset.uid;const completed=checkbox.checked;const entity=this._config.entity;try{await setTaskStatus(this._hass,entity,uid,completed);}catch(err){console.error('Error updating todo item:',err);checkbox.checked=!completed;}}
+_handleItemClick(e){const listItem=e.currentTarget;const uid=listItem.dataset.uid;if(!uid)return;const item=this._tasks.getItem(uid);if(item){this._openTaskDialog(item);}}
+_handleAddTask(){this._openTaskDialog(null);}
+_openTaskDialog(item){const recurrenceData=item?this._tasks.recurrenceData[item.uid]:null;openTaskDialog(this._hass,item,recurrenceData,(content)=>{saveTask(this._hass,this._config.entity,item,content);});}
+_updateCard(){if(!this._hass||!this._config||!this._cardElement){return;}
+const entity=this._config.entity;const state=this._hass.states[entity];const language=this._hass.language;const rendered=this._rendered;if(state&&state===rendered.state&&this._tasks.version===rendered.version
+&&language===rendered.language){return;}
+this._rendered={state,version:this._tasks.version,language};if(!state){this._cardElement.innerHTML=`
+<div class="card-content">
+<p>Entity not found: ${escapeHtml(entity)}</p>
+</div>
+`;return;}
+const title=this._config.title||state.attributes.friendly_name||'Better ToDo';const groups=groupItems(this._tasks);const cardHeader=`
+<div class="card-header">
+<div class="name">${escapeHtml(title)}</div>
+<ha-icon-button class="add-task-button" style="margin-left: auto;">
+<ha-icon icon="mdi:plus"></ha-icon>
+</ha-icon-button>
+</div>
+`;const cardContent=`
+<div class="card-content">
+${renderGroup('no_due_date',groups.no_due_date,language)}
+${renderGroup('this_week',groups.this_week,language)}
+${renderGroup('forthcoming',groups.forthcoming,language)}
+${renderGroup('completed',groups.completed,language)}
+</div>
+`;this._cardElement.innerHTML=cardHeader+cardContent;const addButton=this._cardElement.querySelector('.add-task-button');if(addButton){addButton.addEventListener('click',()=>this._handleAddTask());}
+this._cardElement.querySelectorAll('ha-checkbox').forEach(checkbox=>{checkbox.addEventListener('change',(e)=>this._handleCheckboxChange(e));});this._cardElement.querySelectorAll('ha-check-list-item').forEach(item=>{const uid=item.dataset.uid;if(uid){item.style.cursor='pointer';item.addEventListener('click',(e)=>{if(e.target.tagName!=='HA-CHECKBOX'&&!e.target.closest('ha-checkbox')){this._handleItemClick(e);}});}});}
+getCardSize(){return 3;}
+static getStubConfig(){return{entity:'better_todo.tasks'};}
+static getConfigElement(){return document.createElement('better-todo-card-editor');}}
+customElements.define('better-todo-card',BetterTodoCard);window.customCards=window.customCards||[];window.customCards.push({type:'better-todo-card',name:'Better ToDo Card',description:'A custom card for Better ToDo with category headers',preview:true,documentationURL:'https://github.com/Geek-MD/Better_ToDo'});console.info('%c BETTER-TODO-CARD %c v0.8.0 ','background-color: #555;color: #fff;font-weight: bold;','background-color: #4caf50;color: #fff;font-weight: bold;');
@@ -0,0 +1,178 @@
+import{escapeHtml,groupItems,ListCatalogSubscription,openTaskDialog,renderGroup,saveTask,setTaskStatus,TodoItemsSubscription,}from'./better-todo-core.1bd6ab1c.js';class BetterTodoDashboardCard extends HTMLElement{constructor(){super();this._hass=null;this._config=null;this._selectedEntity=null;this._cardElement=null;this._tasks=new TodoItemsSubscription(()=>this._updateCard());this._lists=new ListCatalogSubscription(()=>this._updateCard());this._language=null;}
+connectedCallback(){if(this._hass){this._lists.connect(this._hass);}
+if(this._hass&&this._selectedEntity){this._tasks.connect(this._hass,this._selectedEntity);}}
+disconnectedCallback(){this._lists.disconnect();this._tasks.disconnect();}
+setConfig(config){this._config=config||{};this._createCard();}
+set hass(hass){this._hass=hass;this._lists.connect(hass);if(hass.language!==this._language){this._updateCard();}}
+_createCard(){if(!this._cardElement){this._cardElement=document.createElement('ha-card');this.appendChild(this._cardElement);}}
+_getTodoEntities(){return this._lists.lists.map(list=>list.entity_id);}
+_handleListClick(e){const listItem=e.currentTarget;const entityId=listItem.dataset.entity;this._selectedEntity=entityId;this._updateCard();}
+async _handleCheckboxChange(e){const checkbox=e.target;const uid=checkbox.dataset.uid;const completed=checkbox.checked;const entity=this._selectedEntity;try{await setTaskStatus(this._hass,entity,uid,completed);}catch(err){console.error('Error updating todo item:',err);checkbox.checked=!completed;}}
+_handleItemClick(e){const listItem=e.currentTarget;const uid=listItem.dataset.uid;if(!uid||!this._selectedEntity)return;const item=this._tasks.getItem(uid);if(item){this._openTaskDialog(item);}}
+_handleAddTask(){if(!this._selectedEntity)return;this._openTaskDialog(null);}
+_openTaskDialog(item){const entityId=this._selectedEntity;const recurrenceData=item?this._tasks.recurrenceData[item.uid]:null;openTaskDialog(this._hass,item,recurrenceData,(content)=>{saveTask(this._hass,entityId,item,content);});}
+_updateCard(){if(!this._hass||!this._cardElement||!this._lists.loaded){return;}
+this._language=this._hass.language;const entities=this._getTodoEntities();if(entities.length===0){this._cardElement.innerHTML=`
+<div class="card-content">
+<p>No Better ToDo lists found</p>
+</div>
+`;return;}
+if(!this._selectedEntity||!this._lists.getList(this._selectedEntity)){this._selectedEntity=entities[0];}
+this._tasks.connect(this._hass,this._selectedEntity);const listsHtml=this._renderListsPanel(entities);const tasksHtml=this._renderTasksPanel();this._cardElement.innerHTML=`
+<style>
+ha-card {
+height: 100%;
+display: flex;
+flex-direction: column;
+}
+.dashboard-container {
+display: flex;
+flex: 1;
+min-height: 500px;
+width: 100%;
+}
+.lists-panel {
+width: 250px;
+min-width: 250px;
+border-right: 1px solid var(--divider-color);
+overflow-y: auto;
+display: flex;
+flex-direction: column;
+}
+.lists-panel > div:first-child {
+flex: 1;
+}
+.add-list-container {
+margin-top: auto;
+padding: 8px 16px;
+border-top: 1px solid var(--divider-color);
+}
+.add-list-button {
+width: 100%;
+}
+.list-item {
+padding: 12px 16px;
+cursor: pointer;
+display: flex;
+align-items: center;
+transition: background-color 0.2s;
+}
+.list-item:hover {
+background-color: var(--secondary-background-color);
+}
+.list-item.selected {
+background-color: var(--primary-color);
+color: var(--text-primary-color);
+}
+.list-item-icon {
+margin-right: 12px;
+--mdc-icon-size: 24px;
+}
+.list-item-name {
+flex: 1;
+font-weight: 500;
+}
+.list-item-count {
+font-size: 0.9em;
+opacity: 0.7;
+}
+.tasks-panel {
+flex: 1;
+overflow-y: auto;
+padding: 16px;
+}
+.tasks-panel .header {
+margin: 16px 0 8px 0;
+padding-bottom: 8px;
+border-bottom: 1px solid var(--divider-color);
+}
+.tasks-panel .header h2 {
+margin: 0;
+font-size: 1.1em;
+font-weight: 500;
+color: var(--primary-text-color);
+}
+.tasks-panel ha-check-list-item {
+margin: 4px 0;
+}
+.secondary {
+font-size: 0.9em;
+color: var(--secondary-text-color);
+}
+</style>
+<div class="dashboard-container">
+<div class="lists-panel">
+<div>
+${listsHtml}
+</div>
+</div>
+<div class="tasks-panel">
+${tasksHtml}
+</div>
+</div>
+`;this._cardElement.querySelectorAll('.list-item').forEach(item=>{item.addEventListener('click',(e)=>this._handleListClick(e));});const addListButton=this._cardElement.querySelector('.add-list-button');if(addListButton){addListButton.addEventListener('click',()=>this._handleAddNewList());}
+this._cardElement.querySelectorAll('ha-checkbox').forEach(checkbox=>{checkbox.addEventListener('change',(e)=>this._handleCheckboxChange(e));});const addButton=this._cardElement.querySelector('.add-task-button');if(addButton){addButton.addEventListener('click',()=>this._handleAddTask());}
+this._cardElement.querySelectorAll('.tasks-panel ha-check-list-item').forEach(item=>{const uid=item.dataset.uid;if(uid){item.style.cursor='pointer';item.addEventListener('click',(e)=>{if(e.target.tagName!=='HA-CHECKBOX'&&!e.target.closest('ha-checkbox')){this._handleItemClick(e);}});}});}
+_handleAddNewList(){const language=this._hass.language||'en';const isSpanish=language.startsWith('es');const dialog=document.createElement('ha-dialog');dialog.heading=isSpanish?'Nueva lista':'New List';const content=document.createElement('div');content.style.padding='16px';content.innerHTML=`
+<style>
+.form-row {
+margin-bottom: 16px;
+}
+.form-row label {
+display: block;
+margin-bottom: 4px;
+font-weight: 500;
+}
+.form-row input[type="text"] {
+width: 100%;
+padding: 8px;
+border: 1px solid var(--divider-color);
+border-radius: 4px;
+background-color: var(--card-background-color);
+color: var(--primary-text-color);
+font-family: inherit;
+font-size: 14px;
+box-sizing: border-box;
+}
+.form-row input[type="text"]:focus {
+outline: none;
+border-color: var(--primary-color);
+}
+</style>
+<div class="form-row">
+<label for="list-name">${isSpanish?'Nombre de la lista':'List Name'}</label>
+<input type="text" id="list-name" placeholder="${isSpanish?'Ej: Tareas del hogar':'e.g. Home Tasks'}" required />
+</div>
+`;dialog.appendChild(content);const cancelButton=document.createElement('ha-button');cancelButton.slot='secondaryAction';cancelButton.textContent=isSpanish?'Cancelar':'Cancel';cancelButton.addEventListener('click',()=>{dialog.close();});const saveButton=document.createElement('ha-button');saveButton.slot='primaryAction';saveButton.textContent=isSpanish?'Crear':'Create';saveButton.addEventListener('click',async()=>{const nameInput=content.querySelector('#list-name');const listName=nameInput.value.trim();if(!listName){alert(isSpanish?'Por favor ingresa un nombre para la lista':'Please enter a name for the list');return;}
+try{const integrationsUrl=`/config/integrations/integration/better_todo`;localStorage.setItem('better_todo_new_list_name',listName);window.location.href=integrationsUrl;dialog.close();}catch(err){console.error('Error creating list:',err);alert(isSpanish?'Error al crear la lista':'Error creating list');}});dialog.appendChild(cancelButton);dialog.appendChild(saveButton);document.body.appendChild(dialog);dialog.open=true;setTimeout(()=>{const nameInput=content.querySelector('#list-name');nameInput?.focus();},100);dialog.addEventListener('closed',()=>{dialog.remove();});}
+_renderListsPanel(entities){const language=this._hass.language||'en';const isSpanish=language.startsWith('es');const listsHtml=entities.map(entityId=>{const list=this._lists.getList(entityId);const name=list.name||entityId.split('.')[1].replace(/_/g,' ');const activeCount=list.active_tasks;const isSelected=entityId===this._selectedEntity;return`
+<div class="list-item ${isSelected?'selected':''}" data-entity="${escapeHtml(entityId)}">
+<ha-icon class="list-item-icon" icon="mdi:format-list-checks"></ha-icon>
+<div class="list-item-name">${escapeHtml(name)}</div>
+<div class="list-item-count">${activeCount}</div>
+</div>
+`;}).join('');const addListButton=`
+<div class="add-list-container">
+<ha-button class="add-list-button">
+<ha-icon icon="mdi:plus" slot="icon"></ha-icon>
+${isSpanish?'Nueva lista':'New list'}
+</ha-button>
+</div>
+`;return listsHtml+addListButton;}
+_renderTasksPanel(){if(!this._selectedEntity){return'<p>Select a list</p>';}
+const list=this._lists.getList(this._selectedEntity);if(!list){return'<p>List not found</p>';}
+const title=list.name||this._selectedEntity.split('.')[1].replace(/_/g,' ');const language=this._hass.language;const groups=groupItems(this._tasks);return`
+<div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 16px;">
+<h1 style="margin: 0;">${escapeHtml(title)}</h1>
+<ha-icon-button class="add-task-button">
+<ha-icon icon="mdi:plus"></ha-icon>
+</ha-icon-button>
+</div>
+${renderGroup('no_due_date',groups.no_due_date,language)}
+${renderGroup('this_week',groups.this_week,language)}
+${renderGroup('forthcoming',groups.forthcoming,language)}
+${renderGroup('completed',groups.completed,language)}
+`;}
+getCardSize(){return 6;}
+static getStubConfig(){return{};}}
+customElements.define('better-todo-dashboard-card',BetterTodoDashboardCard);window.customCards=window.customCards||[];window.customCards.push({type:'better-todo-dashboard-card',name:'Better ToDo Dashboard Card',description:'Two-section dashboard card with lists and tasks',preview:true,documentationURL:'https://github.com/Geek-MD/Better_ToDo'});console.info('%c BETTER-TODO-DASHBOARD-CARD %c v1.3.0 ','background-color: #555;color: #fff;font-weight: bold;','background-color: #4caf50;color: #fff;font-weight: bold;');
@@ -0,0 +1,172 @@
+import{COMPLETED_PAGE_SIZE,openTaskDialog,saveTask,setTaskStatus,splitItems,TodoItemsSubscription,VirtualList,}from'./better-todo-core.1bd6ab1c.js';const BETTER_TODO_LIST_CARD_VERSION="0.13.0";const DEBUG_MODE=true;function debugLog(message,...args){if(DEBUG_MODE){console.log(`[Better ToDo List Card] ${message}`,...args);}}
+function errorLog(message,...args){console.error(`[Better ToDo List Card ERROR] ${message}`,...args);}
+class BetterTodoListCard extends HTMLElement{constructor(){super();this._hass=null;this._config=null;this._entityId=null;this._tasks=new TodoItemsSubscription(()=>this._syncItems());this._renderedState=null;this._activeList=null;this._completedList=null;this._completedExpanded=false;this._completedShown=COMPLETED_PAGE_SIZE;}
+connectedCallback(){if(this._hass){this._tasks.connect(this._hass,this._entityId);}
+this._attachLists();}
+disconnectedCallback(){this._tasks.disconnect();this._detachLists();}
+_attachLists(){const scroller=this.querySelector('.card-content');if(this._activeList&&scroller){this._activeList.attach(scroller);this._completedList.attach(scroller);}}
+_detachLists(){if(this._activeList){this._activeList.detach();this._completedList.detach();}}
+setConfig(config){if(!config.entity){throw new Error('You need to define an entity');}
+this._config=config;this._entityId=config.entity;debugLog('Card configured for entity:',this._entityId);this._detachLists();this._activeList=null;this._completedList=null;this._renderedState=null;this.render();}
+set hass(hass){this._hass=hass;this._tasks.connect(hass,this._entityId);const state=hass.states[this._entityId];if(state!==this._renderedState){this.render();}}
+get hass(){return this._hass;}
+getCardSize(){return 5;}
+render(){if(!this._hass||!this._entityId){debugLog('Cannot render: hass or entityId not available');return;}
+const entityState=this._hass.states[this._entityId];this._renderedState=entityState;if(!entityState){errorLog('Entity not found:',this._entityId);this._detachLists();this._activeList=null;this._completedList=null;this.innerHTML=`
+<ha-card>
+<div class="card-content">
+<p>Entity ${this._entityId} not found</p>
+</div>
+</ha-card>
+`;return;}
+debugLog('Rendering card for entity:',this._entityId,entityState);const title=this._config.title||entityState.attributes.friendly_name||this._entityId;if(this._activeList){this.querySelector('.card-header .name').textContent=title;this._syncItems();return;}
+this.innerHTML=`
+<ha-card>
+<style>
+ha-card {
+height: 100%;
+display: flex;
+flex-direction: column;
+}
+.card-header {
+padding: 16px;
+display: flex;
+align-items: center;
+justify-content: space-between;
+border-bottom: 1px solid var(--divider-color);
+}
+.card-header .name {
+font-size: 16px;
+font-weight: 500;
+color: var(--primary-text-color);
+}
+.card-header mwc-icon-button {
+--mdc-icon-size: 24px;
+}
+.card-content {
+padding: 0;
+flex: 1;
+overflow-y: auto;
+max-height: var(--better-todo-list-max-height);
+}
+.empty-state {
+padding: 32px 16px;
+text-align: center;
+color: var(--secondary-text-color);
+}
+.todo-item {
+display: flex;
+align-items: center;
+padding: 12px 16px;
+border-bottom: 1px solid var(--divider-color);
+cursor: pointer;
+transition: background-color 0.2s;
+}
+.todo-item:hover {
+background-color: var(--secondary-background-color);
+}
+.todo-item.completed {
+opacity: 0.6;
+}
+.todo-item ha-checkbox {
+margin-right: 12px;
+}
+.todo-item-content {
+flex: 1;
+min-width: 0;
+}
+.todo-item-summary {
+font-size: 14px;
+color: var(--primary-text-color);
+overflow: hidden;
+text-overflow: ellipsis;
+white-space: nowrap;
+}
+.todo-item.completed .todo-item-summary {
+text-decoration: line-through;
+}
+.todo-item-description {
+font-size: 12px;
+color: var(--secondary-text-color);
+margin-top: 4px;
+overflow: hidden;
+text-overflow: ellipsis;
+white-space: nowrap;
+}
+.todo-item-due {
+font-size: 12px;
+color: var(--secondary-text-color);
+margin-left: 8px;
+}
+.section-header {
+padding: 12px 16px;
+font-size: 14px;
+font-weight: 500;
+color: var(--secondary-text-color);
+background-color: var(--secondary-background-color);
+border-bottom: 1px solid var(--divider-color);
+position: sticky;
+top: 0;
+z-index: 1;
+display: flex;
+align-items: center;
+gap: 8px;
+cursor: pointer;
+}
+.section-header ha-icon {
+--mdc-icon-size: 20px;
+transition: transform 0.2s;
+}
+.section-header.expanded ha-icon {
+transform: rotate(90deg);
+}
+.show-more-button {
+display: block;
+width: 100%;
+padding: 12px 16px;
+border: none;
+background: none;
+color: var(--primary-color);
+font-size: 14px;
+cursor: pointer;
+}
+</style>
+<div class="card-header">
+<div class="name"></div>
+<mwc-icon-button id="add-button">
+<ha-icon icon="mdi:plus"></ha-icon>
+</mwc-icon-button>
+</div>
+<div class="card-content">
+<div class="empty-state">
+<ha-icon icon="mdi:checkbox-marked-circle-outline"></ha-icon>
+<p>No tasks</p>
+</div>
+<div class="active-section"></div>
+<div class="section-header">
+<ha-icon icon="mdi:chevron-right"></ha-icon>
+<span></span>
+</div>
+<div class="completed-section"></div>
+<button class="show-more-button">Show more</button>
+</div>
+</ha-card>
+`;this.querySelector('.card-header .name').textContent=title;this.querySelector('.card-content').style.setProperty('--better-todo-list-max-height',this._config.max_height||'480px');const rowOptions={createRow:()=>this._createItemNode(),patchRow:(node,item)=>this._patchItemNode(node,item),};this._activeList=new VirtualList(this.querySelector('.active-section'),rowOptions);this._completedList=new VirtualList(this.querySelector('.completed-section'),rowOptions);this._attachLists();this._attachEventListeners();this._syncItems();}
+_syncItems(){if(!this._activeList){return;}
+const items=this._tasks.items;const{active:activeItems,completed:completedItems}=splitItems(this._tasks);this._activeList.setItems(activeItems);this._completedList.setItems(this._completedExpanded?completedItems.slice(0,this._completedShown):[]);this.querySelector('.empty-state').style.display=items.length===0?'':'none';const completedHeader=this.querySelector('.section-header');completedHeader.style.display=completedItems.length>0?'':'none';completedHeader.classList.toggle('expanded',this._completedExpanded);completedHeader.querySelector('span').textContent=`Completed (${completedItems.length})`;this.querySelector('.show-more-button').style.display=
+this._completedExpanded&&completedItems.length>this._completedShown?'':'none';}
+_createItemNode(){const node=document.createElement('div');node.className='todo-item';node.innerHTML=`
+<ha-checkbox></ha-checkbox>
+<div class="todo-item-content">
+<div class="todo-item-summary"></div>
+<div class="todo-item-description"></div>
+</div>
+<div class="todo-item-due"></div>
+`;node.querySelector('ha-checkbox').addEventListener('change',(e)=>{this._toggleItemStatus(node.dataset.uid,e.target.checked);});return node;}
+_patchItemNode(node,item){const isCompleted=item.status==='completed';node.dataset.uid=item.uid;node.classList.toggle('completed',isCompleted);const checkbox=node.querySelector('ha-checkbox');checkbox.checked=isCompleted;checkbox.toggleAttribute('checked',isCompleted);node.querySelector('.todo-item-summary').textContent=item.summary||'';const description=node.querySelector('.todo-item-description');description.textContent=item.description||'';description.style.display=item.description?'':'none';const due=node.querySelector('.todo-item-due');due.textContent=item.due?`📅 ${item.due}`:'';due.style.display=item.due?'':'none';}
+_attachEventListeners(){const addButton=this.querySelector('#add-button');if(addButton){addButton.addEventListener('click',()=>this._openTaskDialog(null));}
+this.querySelector('.section-header').addEventListener('click',()=>{this._completedExpanded=!this._completedExpanded;this._completedShown=COMPLETED_PAGE_SIZE;this._syncItems();});this.querySelector('.show-more-button').addEventListener('click',()=>{this._completedShown+=COMPLETED_PAGE_SIZE;this._syncItems();});this.querySelector('.card-content').addEventListener('click',(e)=>{const item=e.target.closest('.todo-item');if(item&&!e.target.closest('ha-checkbox')){const uid=item.dataset.uid;debugLog('Item clicked:',uid);this._handleItemClick(uid);}});}
+async _toggleItemStatus(uid,isCompleted){debugLog('Toggling item status:',uid,isCompleted);try{await setTaskStatus(this._hass,this._entityId,uid,isCompleted);debugLog('Item status updated successfully');}catch(error){errorLog('Error updating item status:',error);alert('Failed to update task: '+error.message);}}
+_handleItemClick(uid){if(!uid||!this._entityId)return;const item=this._tasks.getItem(uid);if(item){this._openTaskDialog(item);}}
+_openTaskDialog(item){const entityId=this._entityId;const recurrenceData=item?this._tasks.recurrenceData[item.uid]:null;openTaskDialog(this._hass,item,recurrenceData,(content)=>{saveTask(this._hass,entityId,item,content);});}}
+customElements.define('better-todo-list-card',BetterTodoListCard);window.customCards=window.customCards||[];window.customCards.push({type:'better-todo-list-card',name:'Better ToDo List Card',description:'A card that displays Better ToDo tasks with full CRUD functionality',preview:true,});console.info(`%c BETTER-TODO-LIST-CARD %c v${BETTER_TODO_LIST_CARD_VERSION} `,'background-color: #555;color: #fff;font-weight: bold;','background-color: #4caf50;color: #fff;font-weight: bold;');
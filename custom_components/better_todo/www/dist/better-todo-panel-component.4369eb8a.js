@@ -0,0 +1,414 @@
+import{COMPLETED_PAGE_SIZE,escapeHtml,ListCatalogSubscription,openTaskDialog,placeChildren,saveTask,setTaskStatus,splitItems,TodoItemsSubscription,VirtualList,}from'./better-todo-core.1bd6ab1c.js';const BETTER_TODO_VERSION="0.15.1";const DEBUG_MODE=false;function debugLog(message,...args){if(DEBUG_MODE){const safeArgs=args.map(arg=>{if(typeof arg==='string'||typeof arg==='number'||typeof arg==='boolean'){return arg;}
+try{return JSON.stringify(arg);}catch(e){return'[Object]';}});console.log(`[Better ToDo Panel] ${message}`,...safeArgs);}}
+function errorLog(message,...args){const safeArgs=args.map(arg=>{if(typeof arg==='string'||typeof arg==='number'||typeof arg==='boolean'){return arg;}
+try{return JSON.stringify(arg);}catch(e){return'[Object]';}});console.error(`[Better ToDo Panel ERROR] ${message}`,...safeArgs);}
+function capitalizeWords(str){if(!str)return str;return str.split(' ').map(word=>{if(!word)return word;return word.charAt(0).toUpperCase()+word.slice(1).toLowerCase();}).join(' ');}
+class BetterTodoPanel extends HTMLElement{constructor(){super();this.hass=null;this._selectedEntityId=null;this._tasks=new TodoItemsSubscription(()=>this._syncTaskList());this._lists=new ListCatalogSubscription((lists,event)=>this._onCatalogChange(event));this._listNodes=new Map();this._taskListEntityId=null;this._activeList=null;this._completedList=null;this._completedExpanded=false;this._completedShown=COMPLETED_PAGE_SIZE;}
+connectedCallback(){if(this._hass){this._lists.connect(this._hass);}
+if(this._hass&&this._selectedEntityId){this._tasks.connect(this._hass,this._selectedEntityId);}
+this._attachTaskLists();}
+disconnectedCallback(){this._lists.disconnect();this._tasks.disconnect();this._detachTaskLists();}
+_attachTaskLists(){const scroller=this.querySelector('.main-content');if(this._activeList&&scroller){this._activeList.attach(scroller);this._completedList.attach(scroller);}}
+_detachTaskLists(){if(this._activeList){this._activeList.detach();this._completedList.detach();}}
+setConfig(config){this._config=config||{};}
+set hass(hass){this._hass=hass;this._lists.connect(hass);if(!this._initialized){this._initialized=true;debugLog('Initializing Better ToDo Panel');this._render();}}
+get hass(){return this._hass;}
+_getSortedLists(){return this._lists.lists.sort((a,b)=>{const nameA=a.name||a.entity_id;const nameB=b.name||b.entity_id;const isShoppingA=nameA.toLowerCase().includes('shopping');const isShoppingB=nameB.toLowerCase().includes('shopping');if(isShoppingA&&!isShoppingB)return 1;if(!isShoppingA&&isShoppingB)return-1;return nameA.localeCompare(nameB);});}
+_render(){if(!this._hass){errorLog('Cannot render: hass not available');return;}
+debugLog('Rendering Better ToDo Panel');this.innerHTML=`
+<style>
+:host {
+display: flex;
+flex-direction: column;
+height: 100%;
+background-color: var(--primary-background-color);
+}
+.panel-header {
+padding: 16px 24px;
+background-color: var(--primary-color);
+color: var(--text-primary-color);
+border-bottom: 1px solid var(--divider-color);
+}
+.panel-header h1 {
+margin: 0;
+font-size: 20px;
+font-weight: 500;
+}
+.better-todo-container {
+display: flex;
+flex: 1;
+overflow: hidden;
+}
+.sidebar {
+width: 300px;
+border-right: 1px solid var(--divider-color);
+overflow-y: auto;
+background-color: var(--sidebar-background-color, var(--card-background-color));
+display: flex;
+flex-direction: column;
+}
+.list-item {
+padding: 12px 16px;
+cursor: pointer;
+display: flex;
+align-items: center;
+transition: background-color 0.2s;
+border-bottom: 1px solid var(--divider-color);
+}
+.list-item:hover {
+background-color: var(--secondary-background-color);
+}
+.list-item.selected {
+background-color: var(--primary-color);
+color: var(--text-primary-color);
+}
+.list-item ha-icon {
+margin-right: 12px;
+--mdc-icon-size: 24px;
+}
+.list-item-content {
+flex: 1;
+}
+.list-item-name {
+font-weight: 500;
+}
+.list-item-count {
+font-size: 0.9em;
+opacity: 0.7;
+margin-top: 2px;
+}
+.sidebar-footer {
+margin-top: auto;
+padding: 16px;
+border-top: 1px solid var(--divider-color);
+}
+.create-list-button {
+width: 100%;
+padding: 12px;
+background-color: transparent;
+border: none;
+cursor: pointer;
+display: flex;
+align-items: center;
+justify-content: center;
+font-size: 14px;
+font-weight: 500;
+color: var(--primary-text-color);
+transition: background-color 0.2s;
+border-radius: 4px;
+}
+.create-list-button:hover {
+background-color: var(--secondary-background-color);
+}
+.create-list-button ha-icon {
+margin-right: 8px;
+--mdc-icon-size: 20px;
+}
+.main-content {
+flex: 1;
+overflow-y: auto;
+padding: 16px;
+}
+.main-header {
+display: flex;
+align-items: center;
+justify-content: space-between;
+margin-bottom: 16px;
+}
+.main-header h1 {
+margin: 0;
+font-size: 24px;
+font-weight: 400;
+}
+.empty-state {
+text-align: center;
+padding: 48px 16px;
+color: var(--secondary-text-color);
+}
+.empty-state ha-icon {
+--mdc-icon-size: 64px;
+opacity: 0.3;
+}
+</style>
+<div class="panel-header">
+<h1>Better ToDo</h1>
+</div>
+<div class="better-todo-container">
+<div class="sidebar">
+<div id="lists-container"></div>
+<div class="sidebar-footer">
+<button class="create-list-button" id="create-list-button">
+<ha-icon icon="mdi:plus"></ha-icon>
+<span>Create list</span>
+</button>
+</div>
+</div>
+<div class="main-content">
+<div id="content-container"></div>
+</div>
+</div>
+`;this.querySelector('#lists-container').addEventListener('click',(e)=>{const item=e.target.closest('.list-item');if(item&&item.dataset.entity!==this._selectedEntityId){this._selectedEntityId=item.dataset.entity;this._updateContent();}});this.querySelector('#create-list-button').addEventListener('click',()=>{this._handleCreateList();});this._updateContent();}
+_onCatalogChange(event){if(event.type==='update'&&event.entity_id===this._selectedEntityId){this._selectedEntityId=event.list.entity_id;}
+this._updateContent();}
+_updateContent(){const listsContainer=this.querySelector('#lists-container');const contentContainer=this.querySelector('#content-container');if(!listsContainer||!contentContainer){errorLog('Container elements not found');return;}
+if(!this._lists.loaded){return;}
+debugLog('Updating panel content');const lists=this._getSortedLists();if(lists.length>0&&!this._lists.getList(this._selectedEntityId)){this._selectedEntityId=lists[0].entity_id;debugLog(`Auto-selected entity: ${this._selectedEntityId}`);}
+if(lists.length===0){listsContainer.innerHTML=`
+<div class="empty-state">
+<ha-icon icon="mdi:format-list-checks"></ha-icon>
+<p>No Better ToDo lists found</p>
+<p>Add a list in Settings → Integrations</p>
+</div>
+`;contentContainer.innerHTML='';this._selectedEntityId=null;this._tasks.disconnect();this._listNodes=new Map();this._taskListEntityId=null;this._detachTaskLists();this._activeList=null;this._completedList=null;return;}
+this._syncLists(listsContainer,lists);const list=this._selectedEntityId?this._lists.getList(this._selectedEntityId):null;if(list){const name=list.name||this._selectedEntityId;this._tasks.connect(this._hass,this._selectedEntityId);if(this._taskListEntityId!==this._selectedEntityId){this._renderTaskList(contentContainer,this._selectedEntityId,name);}else{this.querySelector('.task-list-header h1').textContent=name;}
+this._syncTaskList();}}
+_syncLists(container,lists){const listNodes=new Map();const nodes=lists.map(list=>{const entityId=list.entity_id;let node=this._listNodes.get(entityId);if(!node){node=document.createElement('div');node.className='list-item';node.dataset.entity=entityId;node.innerHTML=`
+<ha-icon icon="mdi:format-list-checks"></ha-icon>
+<div class="list-item-content">
+<div class="list-item-name"></div>
+<div class="list-item-count"></div>
+</div>
+`;}
+if(node._list!==list){const name=list.name||entityId;node.querySelector('.list-item-name').textContent=capitalizeWords(name);node.querySelector('.list-item-count').textContent=`${list.active_tasks} active`;node._list=list;}
+node.classList.toggle('selected',entityId===this._selectedEntityId);listNodes.set(entityId,node);return node;});placeChildren(container,nodes);this._listNodes=listNodes;}
+_renderTaskList(container,entityId,title){debugLog('Rendering task list for:',entityId);container.innerHTML=`
+<style>
+.task-list-container {
+max-width: 800px;
+margin: 0 auto;
+}
+.task-list-header {
+display: flex;
+align-items: center;
+justify-content: space-between;
+margin-bottom: 20px;
+}
+.task-list-header h1 {
+margin: 0;
+font-size: 24px;
+font-weight: 400;
+}
+.add-task-button {
+--mdc-theme-primary: var(--primary-color);
+}
+.task-card {
+background: var(--card-background-color);
+border-radius: 8px;
+box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+margin-bottom: 16px;
+}
+.task-card-header {
+padding: 16px;
+display: flex;
+align-items: center;
+justify-content: space-between;
+border-bottom: 1px solid var(--divider-color);
+}
+.task-card-header-title {
+font-size: 16px;
+font-weight: 500;
+}
+.task-card-content {
+padding: 0;
+}
+.add-task-form {
+padding: 16px;
+border-bottom: 1px solid var(--divider-color);
+display: none;
+}
+.add-task-form.active {
+display: block;
+}
+.add-task-input {
+width: 100%;
+padding: 12px;
+font-size: 14px;
+border: 1px solid var(--divider-color);
+border-radius: 4px;
+background: var(--card-background-color);
+color: var(--primary-text-color);
+margin-bottom: 8px;
+}
+.add-task-buttons {
+display: flex;
+gap: 8px;
+}
+.task-item {
+display: flex;
+align-items: center;
+padding: 12px 16px;
+border-bottom: 1px solid var(--divider-color);
+cursor: pointer;
+transition: background-color 0.2s;
+}
+.task-item:hover {
+background-color: var(--secondary-background-color);
+}
+.task-item:last-child {
+border-bottom: none;
+}
+.task-item.completed {
+opacity: 0.6;
+}
+.task-item ha-checkbox {
+margin-right: 12px;
+}
+.task-item-content {
+flex: 1;
+min-width: 0;
+}
+.task-item-summary {
+font-size: 14px;
+color: var(--primary-text-color);
+overflow: hidden;
+text-overflow: ellipsis;
+}
+.task-item.completed .task-item-summary {
+text-decoration: line-through;
+}
+.task-item-description {
+font-size: 12px;
+color: var(--secondary-text-color);
+margin-top: 4px;
+overflow: hidden;
+text-overflow: ellipsis;
+}
+.task-item-due {
+font-size: 12px;
+color: var(--secondary-text-color);
+margin-left: 8px;
+display: flex;
+align-items: center;
+gap: 4px;
+}
+.task-item-due ha-icon {
+--mdc-icon-size: 16px;
+}
+.section-header {
+padding: 12px 16px;
+font-size: 14px;
+font-weight: 500;
+color: var(--secondary-text-color);
+background-color: var(--secondary-background-color);
+position: sticky;
+top: 0;
+z-index: 1;
+}
+.completed-header {
+display: flex;
+align-items: center;
+gap: 8px;
+cursor: pointer;
+}
+.completed-header ha-icon {
+--mdc-icon-size: 20px;
+transition: transform 0.2s;
+}
+.completed-header.expanded ha-icon {
+transform: rotate(90deg);
+}
+.show-more-button {
+display: block;
+width: 100%;
+padding: 12px 16px;
+border: none;
+background: none;
+color: var(--primary-color);
+font-size: 14px;
+cursor: pointer;
+}
+.empty-state {
+padding: 48px 16px;
+text-align: center;
+color: var(--secondary-text-color);
+}
+.empty-state ha-icon {
+--mdc-icon-size: 64px;
+opacity: 0.3;
+margin-bottom: 16px;
+}
+.fab-button {
+position: fixed;
+bottom: 24px;
+right: 24px;
+width: 56px;
+height: 56px;
+border-radius: 50%;
+background-color: var(--primary-color);
+color: var(--text-primary-color);
+border: none;
+cursor: pointer;
+box-shadow: 0 4px 8px rgba(0,0,0,0.3);
+display: flex;
+align-items: center;
+justify-content: center;
+transition: box-shadow 0.2s, transform 0.2s;
+z-index: 100;
+}
+.fab-button:hover {
+box-shadow: 0 6px 12px rgba(0,0,0,0.4);
+transform: scale(1.05);
+}
+.fab-button ha-icon {
+--mdc-icon-size: 28px;
+}
+</style>
+<div class="task-list-container">
+<div class="task-list-header">
+<h1>${escapeHtml(title)}</h1>
+</div>
+<div class="task-card">
+<div class="add-task-form active" id="add-task-form">
+<input
+type="text"
+class="add-task-input"
+id="new-task-input"
+placeholder="Add item..."
+/>
+</div>
+<div class="task-card-content">
+<div class="empty-state" id="tasks-empty">
+<ha-icon icon="mdi:checkbox-marked-circle-outline"></ha-icon>
+<p>No tasks yet</p>
+<p style="font-size: 0.9em;">Click "Add Task" to create your first task</p>
+</div>
+<div class="active-section" id="active-section"></div>
+<div class="section-header completed-header" id="completed-header">
+<ha-icon icon="mdi:chevron-right"></ha-icon>
+<span></span>
+</div>
+<div class="completed-section" id="completed-section"></div>
+<button class="show-more-button" id="completed-more">Show more</button>
+</div>
+</div>
+<button class="fab-button" id="fab-add-task" title="Add task with options">
+<ha-icon icon="mdi:plus"></ha-icon>
+</button>
+</div>
+`;this._taskListEntityId=entityId;this._completedExpanded=false;this._completedShown=COMPLETED_PAGE_SIZE;this._detachTaskLists();const rowOptions={createRow:()=>this._createTaskNode(),patchRow:(node,item)=>this._patchTaskNode(node,item,item.status==='completed'),};this._activeList=new VirtualList(this.querySelector('#active-section'),rowOptions);this._completedList=new VirtualList(this.querySelector('#completed-section'),rowOptions);this._attachTaskLists();this._attachTaskListEventListeners(entityId);}
+_syncTaskList(){if(!this._activeList){return;}
+const current=this._tasks.entityId===this._taskListEntityId;const items=current?this._tasks.items:[];const{active:activeItems,completed:completedItems}=current
+?splitItems(this._tasks)
+:{active:[],completed:[]};debugLog(`Found ${activeItems.length} active and ${completedItems.length} completed items`);this._activeList.setItems(activeItems);this._completedList.setItems(this._completedExpanded?completedItems.slice(0,this._completedShown):[]);this.querySelector('#tasks-empty').style.display=items.length===0?'':'none';const completedHeader=this.querySelector('#completed-header');completedHeader.style.display=completedItems.length>0?'':'none';completedHeader.classList.toggle('expanded',this._completedExpanded);completedHeader.querySelector('span').textContent=`Completed (${completedItems.length})`;this.querySelector('#completed-more').style.display=
+this._completedExpanded&&completedItems.length>this._completedShown?'':'none';}
+_createTaskNode(){const node=document.createElement('div');node.className='task-item';node.innerHTML=`
+<ha-checkbox></ha-checkbox>
+<div class="task-item-content">
+<div class="task-item-summary"></div>
+<div class="task-item-description"></div>
+</div>
+<div class="task-item-due"><ha-icon icon="mdi:calendar"></ha-icon> <span></span></div>
+`;const checkbox=node.querySelector('ha-checkbox');checkbox.addEventListener('change',(e)=>{e.stopPropagation();this._toggleTaskStatus(this._taskListEntityId,node.dataset.uid,e.target.checked);});checkbox.addEventListener('click',(e)=>{e.stopPropagation();});return node;}
+_patchTaskNode(node,item,isCompleted){let dueDate='';if(item.due){try{dueDate=new Date(item.due).toLocaleDateString();}catch(e){dueDate=String(item.due);}}
+node.dataset.uid=item.uid||'';node.classList.toggle('completed',isCompleted);const checkbox=node.querySelector('ha-checkbox');checkbox.checked=isCompleted;checkbox.toggleAttribute('checked',isCompleted);node.querySelector('.task-item-summary').textContent=item.summary||'';const description=node.querySelector('.task-item-description');description.textContent=item.description||'';description.style.display=item.description?'':'none';const due=node.querySelector('.task-item-due');due.querySelector('span').textContent=dueDate;due.style.display=dueDate?'':'none';}
+_attachTaskListEventListeners(entityId){const input=this.querySelector('#new-task-input');if(input){input.addEventListener('keypress',(e)=>{if(e.key==='Enter'){this._saveNewTask(entityId);}});input.addEventListener('blur',()=>{if(input.value.trim()){this._saveNewTask(entityId);}});}
+const fabBtn=this.querySelector('#fab-add-task');if(fabBtn){fabBtn.addEventListener('click',()=>this._openTaskDialog(entityId,null));}
+this.querySelector('#completed-header').addEventListener('click',()=>{this._completedExpanded=!this._completedExpanded;this._completedShown=COMPLETED_PAGE_SIZE;this._syncTaskList();});this.querySelector('#completed-more').addEventListener('click',()=>{this._completedShown+=COMPLETED_PAGE_SIZE;this._syncTaskList();});const content=this.querySelector('.task-card-content');content.addEventListener('click',(e)=>{const item=e.target.closest('.task-item');if(!item||e.target.closest('ha-checkbox')){return;}
+const task=this._tasks.getItem(item.dataset.uid);if(task){this._openTaskDialog(entityId,task);}});}
+_showToast(message){if(this._hass){const safeMessage=escapeHtml(String(message));this._hass.callService('persistent_notification','create',{message:safeMessage,title:'Better ToDo',}).catch(()=>{console.warn('[Better ToDo]',safeMessage);});}}
+async _saveNewTask(entityId){const input=this.querySelector('#new-task-input');if(!input||!input.value.trim()){return;}
+const summary=input.value.trim();debugLog('Creating new task:',summary);try{await this._hass.callService('better_todo','create_task',{entity_id:entityId,summary:summary,});debugLog('Task created successfully');input.value='';}catch(error){errorLog('Error creating task:',error);this._showToast(`Failed to create task: ${error.message}`);}}
+async _toggleTaskStatus(entityId,uid,isCompleted){debugLog('Toggling task status:',uid,isCompleted);try{await setTaskStatus(this._hass,entityId,uid,isCompleted);debugLog('Task status updated successfully');}catch(error){errorLog('Error updating task status:',error);this._showToast(`Failed to update task: ${error.message}`);}}
+_handleCreateList(){const integrationsUrl='/config/integrations/integration/better_todo';window.location.href=integrationsUrl;}
+_openTaskDialog(entityId,task){const recurrenceData=task?this._tasks.recurrenceData[task.uid]:null;openTaskDialog(this._hass,task,recurrenceData,(content)=>{saveTask(this._hass,entityId,task,content,(message)=>this._showToast(message));});}}
+if(!customElements.get('better-todo-panel')){customElements.define('better-todo-panel',BetterTodoPanel);console.info(`%c BETTER-TODO-PANEL %c v${BETTER_TODO_VERSION} `,'background-color: #555;color: #fff;font-weight: bold;','background-color: #4caf50;color: #fff;font-weight: bold;');}else{debugLog('better-todo-panel already registered, skipping registration');}